@@ -0,0 +1,26 @@
+# Compiled closures against the tree-walking evaluator, on the expressions of benchmarks.evaluator.
+import timeit
+
+from benchmarks.evaluator import CONTEXT, EXPRESSIONS
+from feel.evaluator.Compiler import Compiler
+from feel.evaluator.Evaluator import Evaluator
+from feel.parser.parser.Parser import Parser
+
+NUMBER = 20000
+
+
+def rate(function):
+    return NUMBER / timeit.timeit(function, number=NUMBER)
+
+
+if __name__ == '__main__':
+    parser = Parser()
+    evaluator = Evaluator()
+    compiler = Compiler()
+    print('%-12s %14s %14s %8s' % ('expression', 'tree-walk/s', 'compiled/s', 'speedup'))
+    for label, text in EXPRESSIONS:
+        ast = parser.parse(text)
+        compiled = compiler.compile(ast)
+        walked = rate(lambda: evaluator.evaluate(ast, CONTEXT))
+        closures = rate(lambda: compiled(CONTEXT))
+        print('%-12s %14.0f %14.0f %7.1fx' % (label, walked, closures, closures / walked))
@@ -0,0 +1,51 @@
+# Matching inputs against 10k-row decision tables, with column indexes and by testing every rule: one with
+# disjoint ranges and few distinct thresholds, one with nested ranges, every one with its own bounds.
+import random
+import time
+import timeit
+import tracemalloc
+
+from feel.evaluator.DecisionTable import ColumnIndex, DecisionTable
+
+ROWS = 10000
+QUERIES = 500
+
+
+def rules(rows):
+    generator = random.Random(1)
+    for i in range(rows):
+        yield ['[%d..%d[' % (i * 10, i * 10 + 10),
+               '"segment %d"' % generator.randrange(20) if i % 4 else '-',
+               '>= %d' % generator.randrange(100) if i % 3 else '-',
+               str(i)]
+
+
+def nested_rules(rows):
+    for i in range(rows):
+        yield ['>= %d' % (i * 10), '"segment %d"' % (i % 20), '[%d..%d]' % (i, 2 * rows - i), str(i)]
+
+
+def index_size(table):
+    """The memory the column indexes of a table take, built again with its compiled cells cached."""
+    tracemalloc.start()
+    columns = [ColumnIndex(cells, table.compiler) for cells in zip(*table.entries)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del columns
+    return size
+
+
+if __name__ == '__main__':
+    generator = random.Random(2)
+    contexts = [{'amount': generator.randrange(ROWS * 10), 'segment': 'segment %d' % generator.randrange(20),
+                 'score': generator.randrange(100)} for _ in range(QUERIES)]
+    print('%-8s %-8s %8s %10s %12s %12s' % ('table', 'match', 'build s', 'index MB', 'matches/s', 'us/match'))
+    for name, grid in (('ranges', list(rules(ROWS))), ('nested', list(nested_rules(ROWS)))):
+        for label, indexed in (('indexed', True), ('scan', False)):
+            start = time.perf_counter()
+            table = DecisionTable(['amount', 'segment', 'score'], ['rule'], grid, 'COLLECT', indexed=indexed)
+            built = time.perf_counter() - start
+            size = index_size(table) if indexed else 0
+            seconds = timeit.timeit(lambda: [table.evaluate(context) for context in contexts], number=1)
+            print('%-8s %-8s %8.2f %10.1f %12.0f %12.1f' % (name, label, built, size / 1e6, QUERIES / seconds,
+                                                           seconds / QUERIES * 1e6))
@@ -0,0 +1,42 @@
+# Evaluations per second of the tree-walking evaluator for representative expressions.
+import timeit
+
+from feel.evaluator.Evaluator import Evaluator
+from feel.parser.parser.Parser import Parser
+
+CONTEXT = {
+    'age': 42,
+    'income': 5200.5,
+    'score': 610,
+    'tags': ['gold', 'vip', 'new'],
+    'orders': [{'amount': i * 10, 'paid': i % 2 == 0} for i in range(20)],
+    'customer': {'name': 'Jo', 'address': {'city': 'Krakow'}},
+}
+
+EXPRESSIONS = [
+    ('literal', '42'),
+    ('arithmetic', '(income  *  12  -  1000) / 3 + score ** 2'),
+    ('comparison', 'age >= 18  and  score > 600'),
+    ('between', 'age  between  18  and  65'),
+    ('in', 'score  in  (< 300, [300..600[, >= 600)'),
+    ('if', 'if  age > 65  then  "senior"  else  if  age > 18  then  "adult"  else  "minor"'),
+    ('path', 'customer.address.city'),
+    ('filter', 'orders[paid = true]'),
+    ('for', 'for  o  in  orders  return  o.amount  *  2'),
+    ('quantified', 'some  o  in  orders  satisfies  o.amount > 150'),
+    ('context', '{base: income  *  12, bonus: base  /  10, total: base  +  bonus}'),
+    ('invocation', '{f: function(x, y) x  *  y  +  1, r: f(age, score)}.r'),
+]
+
+
+def run(evaluate, ast, number):
+    return number / timeit.timeit(lambda: evaluate(ast, CONTEXT), number=number)
+
+
+if __name__ == '__main__':
+    parser = Parser()
+    evaluator = Evaluator()
+    print('%-12s %14s' % ('expression', 'evaluations/s'))
+    for label, text in EXPRESSIONS:
+        ast = parser.parse(text)
+        print('%-12s %14.0f' % (label, run(evaluator.evaluate, ast, 20000)))
@@ -0,0 +1,84 @@
+# Flat array trees against the AST object graph on the synthetic 50k-cell
+# corpus of benchmarks.warm_start: memory held, conversion both ways, loading
+# from disk and a walk counting Name nodes.
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.warm_start import corpus
+from feel.parser import AST
+from feel.parser.FlatAST import FlatTrees
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def allocated(function, *args):
+    tracemalloc.start()
+    result = function(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def count_names(trees):
+    names = 0
+    stack = list(trees)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, AST.AST):
+            names += value.__class__ is AST.Name
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return names
+
+
+def count_flat_names(flat):
+    name = flat.classes.index(AST.Name)
+    kinds = flat.kinds
+    return sum(1 for t in range(len(flat)) for node in flat.walk(t) if kinds[node] == name)
+
+
+if __name__ == '__main__':
+    feel, table = corpus()
+    parser, table_parser = Parser(), TableParser()
+    trees = [parser.parse(text) for text in feel] + [table_parser.parse(text) for text in table]
+    data = pickle.dumps(trees, pickle.HIGHEST_PROTOCOL)
+    flat = FlatTrees.from_trees(trees)
+
+    print('%d trees, %d nodes' % (len(trees), len(flat.kinds)))
+    objects = allocated(pickle.loads, data)
+    arrays = allocated(lambda: FlatTrees.from_buffer(flat.to_bytes()))
+    print('memory:     objects %6.1f MB   flat %6.1f MB   (%.0f vs %.0f B/node)'
+          % (objects / 1e6, arrays / 1e6, objects / float(len(flat.kinds)), arrays / float(len(flat.kinds))))
+    print('to flat:    %6.2fs' % timed(FlatTrees.from_trees, trees)[0])
+    print('to objects: %6.2fs' % timed(flat.trees)[0])
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'trees')
+        with open(path + '.pickle', 'wb') as pickle_file:
+            pickle_file.write(data)
+        flat.save(path + '.flat')
+        with open(path + '.pickle', 'rb') as pickle_file:
+            print('load:       pickle %6.3fs   flat mmap %6.3fs'
+                  % (timed(pickle.load, pickle_file)[0], timed(FlatTrees.load, path + '.flat')[0]))
+        print('file size:  pickle %6.1f MB   flat %6.1f MB'
+              % (os.path.getsize(path + '.pickle') / 1e6, os.path.getsize(path + '.flat') / 1e6))
+    finally:
+        shutil.rmtree(directory)
+
+    seconds, names = timed(count_names, trees)
+    flat_seconds, flat_names = timed(count_flat_names, flat)
+    assert names == flat_names
+    print('walk:       objects %6.3fs   flat %6.3fs   (%d names)' % (seconds, flat_seconds, names))
@@ -0,0 +1,60 @@
+# Hashing and equality of deep and wide trees: the structural hash, computed once and then cached, and the
+# equality of equal trees and of trees differing at their last leaf, next to the recursive field by field
+# comparison nodes used before. python -m benchmarks.hashing
+import sys
+import time
+
+from feel.parser import AST
+
+SIZES = [1000, 10000, 100000]
+
+
+def chain(n, last=0):
+    """A left-deep sum of n numbers, like a long generated a + b + c + ..."""
+    tree = AST.Number(0)
+    for i in range(1, n):
+        tree = AST.Sum(tree, AST.Number(last if i == n - 1 else i))
+    return tree
+
+
+def wide(n, last=0):
+    """A list of n small invocations."""
+    return AST.List([AST.Invocation(AST.Name('f'), [AST.Number(last if i == n - 1 else i), AST.StringLiteral('s')])
+                     for i in range(n)])
+
+
+def recursive_equal(a, b):
+    if isinstance(a, AST.AST):
+        return a.__class__ is b.__class__ and all(recursive_equal(x, y) for x, y in zip(a.values(), b.values()))
+    if isinstance(a, (list, tuple)):
+        return a.__class__ is b.__class__ and len(a) == len(b) and all(map(recursive_equal, a, b))
+    return a == b
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    try:
+        function(*args)
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+
+def milliseconds(seconds):
+    return '%10s' % 'recursion' if seconds is None else '%10.2f' % (seconds * 1e3)
+
+
+if __name__ == '__main__':
+    sys.setrecursionlimit(10000)
+    print('milliseconds; the first comparisons hash both trees, the last ones find the hashes cached')
+    print('%-6s %8s %10s %10s %10s %10s %10s %10s %10s' % ('tree', 'nodes', 'hash', 'cached', 'recursive',
+                                                           'equal', 'differ', 'equal', 'differ'))
+    for label, build in (('deep', chain), ('wide', wide)):
+        for n in SIZES:
+            recursive = timed(recursive_equal, build(n), build(n))
+            tree = build(n)
+            hashing, cached = timed(hash, tree), timed(hash, tree)
+            first, second, other = build(n), build(n), build(n, -1)
+            equal, differ = timed(first.__eq__, second), timed(first.__eq__, other)
+            row = [hashing, cached, recursive, equal, differ, timed(first.__eq__, second), timed(first.__eq__, other)]
+            print('%-6s %8d %s' % (label, n, ' '.join(map(milliseconds, row))))
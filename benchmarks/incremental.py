@@ -0,0 +1,51 @@
+# Single character edits in a 10 KB expression: parsing the edited text again whole, versus an
+# IncrementalParser reusing the tree of the previous text. python -m benchmarks.incremental [kilobytes] [edits]
+import random
+import sys
+import time
+
+from feel.parser.common.Incremental import IncrementalParser
+from feel.parser.parser.Parser import Parser
+
+ENTRY = '"r%d": {"limit": [1,  2,  amount  *  1.5  +  fee], "ok": if  x  >  %d  then  "gold"  else  f(a: 2, b: y)}'
+
+
+def expression(size):
+    entries, length, i = [], 1, 0
+    while length < size:
+        entries.append(ENTRY % (i, i))
+        length += len(entries[-1]) + 2
+        i += 1
+    return '{%s}' % ', '.join(entries)
+
+
+def edits(text, count, seed=0):
+    """Offsets of digits in number literals, each replaced by another digit."""
+    generator = random.Random(seed)
+    digits = [i for i, c in enumerate(text) if c.isdigit() and text.count('"', 0, i) % 2 == 0]
+    return [(offset, generator.choice('123456789')) for offset in generator.sample(digits, count)]
+
+
+if __name__ == '__main__':
+    kilobytes = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    parser, incremental = Parser(), IncrementalParser(Parser())
+    text = expression(int(kilobytes * 1000))
+    changes = edits(text, count)
+
+    start = time.perf_counter()
+    current = text
+    for offset, digit in changes:
+        current = current[:offset] + digit + current[offset + 1:]
+        expected = parser.parse(current)
+    full = (time.perf_counter() - start) / count
+
+    document = incremental.parse(text)
+    start = time.perf_counter()
+    for offset, digit in changes:
+        document = incremental.edit(document, offset, 1, digit)
+    edit = (time.perf_counter() - start) / count
+    assert document.tree == expected and document.text == current
+
+    print('%8s %8s %14s %14s %8s' % ('KB', 'edits', 'full ms', 'edit ms', 'speedup'))
+    print('%8.1f %8d %14.3f %14.3f %8.1f' % (len(text) / 1e3, count, full * 1e3, edit * 1e3, full / edit))
@@ -0,0 +1,62 @@
+# Memory and equality of the cells of a decision table corpus, parsed as they are and interned, so equal
+# subtrees across cells share one instance. python -m benchmarks.interning [rows]
+import random
+import sys
+import time
+import tracemalloc
+
+from feel.parser.Interning import Interner
+from feel.parser.table.TableParser import TableParser
+
+COLUMNS = [
+    lambda g: g.choice(['< 18', '[18..65[', '>= 65', '-', '[%d..%d]' % (g.randrange(0, 50, 10), 60)]),
+    lambda g: g.choice(['"gold"', '"silver", "bronze"', 'not ("gold", "silver")', '-', '"segment %d"' % g.randrange(20)]),
+    lambda g: g.choice(['>= date("2017-01-01")', '[date("2017-01-01")..date("2017-12-31")]', '-',
+                        '< date("2018-0%d-01")' % g.randrange(1, 10)]),
+    lambda g: g.choice(['> %d' % g.randrange(0, 10000, 500), '[100..500]', 'limit', '< threshold', '-']),
+]
+
+
+def corpus(rows, seed=0):
+    generator = random.Random(seed)
+    return [column(generator) for _ in range(rows) for column in COLUMNS]
+
+
+def allocated(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def equal(first, second):
+    return sum(1 for a, b in zip(first, second) if a == b)
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    cells = corpus(rows)
+    parser = TableParser()
+    plain, trees = allocated(lambda: [parser.parse(text) for text in cells])
+    again = [parser.parse(text) for text in cells]
+    interner = Interner()
+    interning, (shared, shared_again) = timed(lambda: ([interner.intern(tree) for tree in trees],
+                                                        [interner.intern(tree) for tree in again]))
+    del trees
+    interned, _ = allocated(lambda: [interner.intern(parser.parse(text)) for text in cells])
+    plain_eq, count = timed(equal, again, [parser.parse(text) for text in cells])
+    shared_eq, shared_count = timed(equal, shared, shared_again)
+    assert count == shared_count == len(cells)
+
+    print('%8s %8s %12s %12s %8s %10s %12s %12s %8s' % ('cells', 'nodes', 'plain MB', 'interned MB', 'saved',
+                                                         'intern s', 'plain eq s', 'shared eq s', 'speedup'))
+    print('%8d %8d %12.2f %12.2f %7.0f%% %10.2f %12.4f %12.4f %8.0f' % (
+        len(cells), len(interner), plain / 1e6, interned / 1e6, 100 - 100.0 * interned / plain, interning,
+        plain_eq, shared_eq, plain_eq / shared_eq))
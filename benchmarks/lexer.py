@@ -0,0 +1,33 @@
+# Lexing throughput of the PLY master regex against the Scanner backend, on
+# inputs made of long names, numbers and strings.
+import time
+
+from feel.lexer.Lexer import Lexer
+from utils.StoreLogger import StoreLogger
+
+SIZE = 1000000
+INPUTS = [
+    ('long names', 'date of birth of the applicant  +  total monthly income after tax  '),
+    ('spaced name', 'ala ma kota i psa '),
+    ('numbers', '123.45  +  6  *  0.125  '),
+    ('strings', '"a rather long string literal value", '),
+    ('mixed', 'if  applicant age > 18  then  "adult"  else  [1..10]  '),
+]
+
+
+def throughput(lexer, text):
+    start = time.perf_counter()
+    lexer.input(text)
+    count = 0
+    while lexer.token():
+        count += 1
+    seconds = time.perf_counter() - start
+    return count / seconds, len(text.encode('utf8')) / seconds / 1e6
+
+
+if __name__ == '__main__':
+    ply, scanner = Lexer(StoreLogger(), backend='ply'), Lexer(StoreLogger())
+    print('%-12s %14s %10s %14s %10s' % ('input', 'PLY tokens/s', 'MB/s', 'Scanner tok/s', 'MB/s'))
+    for name, piece in INPUTS:
+        text = piece * (SIZE // len(piece))
+        print('%-12s %14.0f %10.2f %14.0f %10.2f' % ((name,) + throughput(ply, text) + throughput(scanner, text)))
@@ -0,0 +1,46 @@
+# Line and column lookups for 10k lexical errors in a 10 MB input: scanning back for the line start,
+# as error printers used to, versus a LineIndex. python -m benchmarks.line_index [megabytes] [errors]
+import sys
+import time
+
+from feel.lexer.Lexer import Lexer
+
+LINE = 'amount  *  1.5  +  fee  >  limit  -  20  and  name  =  "gold"  or  date("2017-01-01")  <  x\n'
+
+
+def document(size, errors, newlines=True):
+    line = LINE if newlines else LINE.replace('\n', ' ')
+    count = size // len(line)
+    step = count // errors
+    return ''.join('@' + line if i % step == 0 and i // step < errors else line for i in range(count))
+
+
+def scanned(diagnostics):
+    """Columns found as ErrorPrinters found them, by looking back for the previous newline."""
+    return [(d.start - d.data.rfind('\n', 0, d.start) - 1) for d in diagnostics]
+
+
+def indexed(diagnostics):
+    return [d.column for d in diagnostics]
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    errors = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    lexer = Lexer()
+    print('%-10s %8s %8s %12s %12s %12s' % ('input', 'MB', 'errors', 'lexing s', 'scanning s', 'index s'))
+    for label, newlines in (('lines', True), ('one line', False)):
+        text = document(int(megabytes * 1e6), errors, newlines)
+        lexer.input(text)
+        lexing, _ = timed(lambda: sum(1 for _ in iter(lexer.token, None)))
+        diagnostics = lexer.diagnostics
+        scanning, expected = timed(scanned, diagnostics)
+        index, found = timed(indexed, diagnostics)
+        assert expected == found
+        print('%-10s %8.1f %8d %12.2f %12.3f %12.3f' % (label, len(text) / 1e6, len(diagnostics), lexing, scanning, index))
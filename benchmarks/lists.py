@@ -0,0 +1,37 @@
+# Parse time of long comma-separated lists, per element; it stays flat when list rules take linear time.
+import time
+
+from feel.parser.parser.Parser import Parser
+from feel.parser.simple.SimpleParser import SimpleParser
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+LISTS = [
+    ('list', Parser, lambda n: '[%s]' % ',  '.join(str(i) for i in range(n))),
+    ('in', Parser, lambda n: 'x  in  (%s)' % ',  '.join('<  %d' % i for i in range(n))),
+    ('context', Parser, lambda n: '{%s}' % ',  '.join('k%d: %d' % (i, i) for i in range(n))),
+    ('arguments', Parser, lambda n: 'f(%s)' % ',  '.join('p%d: %d' % (i, i) for i in range(n))),
+    ('parameters', Parser, lambda n: 'function(%s)  1' % ',  '.join('p%d' % i for i in range(n))),
+    ('for', Parser, lambda n: 'for  %s  return  1' % '  '.join('i%d  in  x' % i for i in range(n))),
+    ('simple', SimpleParser, lambda n: ',  '.join(str(i) for i in range(n))),
+    ('unary tests', TableParser, lambda n: ',  '.join(str(i) for i in range(n))),
+]
+SIZES = [10, 100, 1000, 10000, 100000]
+
+
+def best_time(parse, text, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(text)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == '__main__':
+    parsers = {}
+    print('microseconds per element')
+    print('%-12s' % 'list' + ''.join('%10d' % n for n in SIZES))
+    for label, cls, make in LISTS:
+        parser = parsers.setdefault(cls, cls(StoreLogger()))
+        print('%-12s' % label + ''.join('%10.1f' % (best_time(parser.parse, make(n)) / n * 1e6) for n in SIZES))
@@ -0,0 +1,72 @@
+# Memory held by parsed trees: the __slots__ nodes with shared stateless
+# instances against the same trees rebuilt from plain __dict__ objects, one
+# per node, the way the AST classes used to be laid out.
+import pickle
+import tracemalloc
+
+from feel.parser import AST
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+
+COPIES = 10000
+EXPRESSIONS = [
+    ('feel', 'a  *  2  +  b'),
+    ('feel', 'if  a > 3  then  "big"  else  "small"'),
+    ('feel', 'some  x  in  [1, 2, 3]  satisfies  x > 2'),
+    ('feel', '{"limit": 10, "rate": a  /  12}'),
+    ('table', '[1..10['),
+    ('table', 'not (>= 5, "a")'),
+    ('table', '-'),
+]
+
+
+class Plain(object):
+    pass
+
+
+def fields(node):
+    return [name for cls in type(node).__mro__ for name in cls.__dict__.get('__slots__', ())
+            if name not in ('_span', '_hash', '__weakref__')]
+
+
+def plain(value):
+    if isinstance(value, AST.AST):
+        other = Plain()
+        for name in fields(value):
+            setattr(other, name, plain(getattr(value, name)))
+        return other
+    if isinstance(value, (list, tuple)):
+        return type(value)(plain(v) for v in value)
+    return value
+
+
+def count(value):
+    if isinstance(value, AST.AST):
+        return 1 + sum(count(getattr(value, name)) for name in fields(value))
+    if isinstance(value, (list, tuple)):
+        return sum(count(v) for v in value)
+    return 0
+
+
+def allocated(trees):
+    # Unpickling allocates the trees and nothing else, so both layouts are measured the same way.
+    data = pickle.dumps(trees, pickle.HIGHEST_PROTOCOL)
+    tracemalloc.start()
+    loaded = pickle.loads(data)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del loaded
+    return size
+
+
+if __name__ == '__main__':
+    parsers = {'feel': Parser(spans=False), 'table': TableParser(spans=False)}
+    print('%-45s %6s %12s %12s %12s %12s' % ('expression', 'nodes', 'dict B/expr', 'slots B/expr',
+                                             'dict B/node', 'slots B/node'))
+    for grammar, text in EXPRESSIONS:
+        tree = parsers[grammar].parse(text)
+        nodes = count(tree)
+        trees = [pickle.loads(pickle.dumps(tree)) for _ in range(COPIES)]
+        before = allocated([plain(t) for t in trees]) / float(COPIES)
+        after = allocated(trees) / float(COPIES)
+        print('%-45s %6d %12.0f %12.0f %12.0f %12.0f' % (text, nodes, before, after, before / nodes, after / nodes))
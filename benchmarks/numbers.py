@@ -0,0 +1,36 @@
+# Evaluation of arithmetic-heavy expressions with literals read as floats, Decimals, or ints and Decimals.
+import timeit
+
+from feel.Numbers import DECIMAL, FLOAT, HYBRID
+from feel.evaluator.Compiler import Compiler
+from feel.parser.parser.Parser import Parser
+
+EXPRESSIONS = [
+    ('integers', 'a  *  3  +  b  *  7  -  (a  +  b)  *  2  +  100'),
+    ('fractions', 'a  *  1.5  +  b  *  0.25  -  (a  +  b)  *  0.125'),
+    ('mixed', '(a  +  1)  *  (b  -  2)  +  a  *  0.5  +  10'),
+    ('division', '(a  *  b  +  7)  /  3  +  a  /  4'),
+]
+SCOPES = {
+    'float': {'a': 12.0, 'b': 30.0},
+    'decimal': {'a': DECIMAL('12'), 'b': DECIMAL('30')},
+    'hybrid': {'a': 12, 'b': 30},
+}
+NUMBER = 50000
+
+
+def rate(function):
+    return NUMBER / min(timeit.repeat(function, number=NUMBER, repeat=5))
+
+
+if __name__ == '__main__':
+    modes = [('float', FLOAT), ('decimal', DECIMAL), ('hybrid', HYBRID)]
+    parsers = dict((name, Parser(numbers=numbers)) for name, numbers in modes)
+    print('%-10s %12s %12s %12s   %s' % ('expression', 'float/s', 'decimal/s', 'hybrid/s', 'hybrid result'))
+    for label, text in EXPRESSIONS:
+        rates, result = [], None
+        for name, _ in modes:
+            compiled, scope = Compiler().compile(parsers[name].parse(text)), SCOPES[name]
+            rates.append(rate(lambda: compiled(scope)))
+            result = compiled(scope)
+        print('%-10s %12.0f %12.0f %12.0f   %r' % tuple([label] + rates + [result]))
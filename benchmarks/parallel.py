@@ -0,0 +1,33 @@
+# Throughput of parse_many by worker count on a synthetic corpus of 100k FEEL expressions:
+# python -m benchmarks.parallel [workers...]
+import sys
+import time
+
+from benchmarks.warm_start import EXPRESSIONS
+from feel.parser.common.BulkParse import parse_many
+from feel.parser.parser.Parser import Parser
+from utils.StoreLogger import StoreLogger
+
+SIZE = 100000
+WORKERS = [1, 2, 4, 8, 16]
+
+
+def corpus():
+    return [EXPRESSIONS[i % len(EXPRESSIONS)] % i for i in range(SIZE)]
+
+
+if __name__ == '__main__':
+    texts = corpus()
+    parser = Parser(StoreLogger())
+    start = time.perf_counter()
+    for text in texts:
+        parser.parse(text)
+    baseline = time.perf_counter() - start
+    print('%8s %10s %10s' % ('workers', 'seconds', 'speedup'))
+    print('%8s %10.2f %10.2f' % ('serial', baseline, 1))
+    for workers in [int(arg) for arg in sys.argv[1:]] or WORKERS:
+        start = time.perf_counter()
+        for _ in parse_many(texts, workers=workers):
+            pass
+        elapsed = time.perf_counter() - start
+        print('%8d %10.2f %10.2f' % (workers, elapsed, baseline / elapsed))
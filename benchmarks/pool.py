@@ -0,0 +1,47 @@
+# Parse throughput by thread count: one parser behind a global lock
+# versus a ParserPool handing out one parser per thread.
+import threading
+import time
+
+from feel.parser.common.ParserPool import ParserPool
+from feel.parser.parser.Parser import Parser
+
+EXPRESSIONS = [
+    '1 + 2 * 3 - x / 4',
+    'if  a > 1  then  {"b": [1, 2, 3]}  else  date("2017-01-01")',
+    'some  x  in  [1, 2, 3]  satisfies  x > 2',
+    'y  in  (null, <= 5, [1..10])',
+]
+PARSES_PER_THREAD = 2000
+
+
+def run(threads, parse):
+    def worker():
+        for i in range(PARSES_PER_THREAD):
+            parse(EXPRESSIONS[i % len(EXPRESSIONS)])
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return threads * PARSES_PER_THREAD / (time.perf_counter() - start)
+
+
+def locked(parser):
+    lock = threading.Lock()
+
+    def parse(text):
+        with lock:
+            return parser.parse(text)
+
+    return parse
+
+
+if __name__ == '__main__':
+    shared = locked(Parser())
+    pool = ParserPool(Parser)
+    print('%8s %16s %16s' % ('threads', 'global lock/s', 'ParserPool/s'))
+    for threads in (1, 2, 4, 8, 16):
+        print('%8d %16.0f %16.0f' % (threads, run(threads, shared), run(threads, pool.parse)))
@@ -0,0 +1,59 @@
+# Validating a corpus with seeded syntax errors: one recovering pass per expression, against fixing and
+# parsing again until no error is left, one error per run. python -m benchmarks.recovery [expressions] [errors]
+import random
+import sys
+import time
+
+from feel.parser.parser.Parser import Parser
+
+VALID = ['a%d  +  1', 'f(x: %d, y: 2)', '[1, %d, 3]', 'if  a > %d  then  1  else  2',
+         'some  x  in  [%d]  satisfies  x > 1']
+BROKEN = ['a%d  +', 'f(, %d)', '1 %d', '[1,, %d]', 'if  a > %d  then  else  2', '(%d 2)']
+ENTRIES = 20
+
+
+def corpus(count, errors, seed=0):
+    """Contexts of ENTRIES entries, each with ``errors`` broken entries, as lists of entry values."""
+    generator = random.Random(seed)
+    found = []
+    for i in range(count):
+        values = [generator.choice(VALID) % i for _ in range(ENTRIES)]
+        broken = dict((j, generator.choice(BROKEN) % i) for j in generator.sample(range(ENTRIES), errors))
+        found.append((values, broken))
+    return found
+
+
+def text(values, broken, fixed):
+    return '{%s}' % ', '.join('"e%d": %s' % (j, broken[j] if j in broken and j not in fixed else value)
+                              for j, value in enumerate(values))
+
+
+def iterative(parser, values, broken):
+    """Parses, fixes the first broken entry and parses again, until the text parses; returns the runs."""
+    fixed, runs = set(), 0
+    for j in sorted(broken):
+        runs += 1
+        parser.diagnose(text(values, broken, fixed))
+        fixed.add(j)
+    parser.diagnose(text(values, broken, fixed))
+    return runs + 1
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    errors = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    parser = Parser()
+    expressions = corpus(count, errors)
+
+    start = time.perf_counter()
+    runs = sum(iterative(parser, values, broken) for values, broken in expressions)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = sum(len(parser.recover(text(values, broken, ())).diagnostics) for values, broken in expressions)
+    recovering = time.perf_counter() - start
+
+    print('%12s %8s %14s %10s %14s %14s %8s' % ('expressions', 'errors', 'single runs', 'single s', 'found in one',
+                                                'recovering s', 'speedup'))
+    print('%12d %8d %14d %10.2f %14d %14.2f %8.1f' % (count, count * errors, runs, single, found, recovering,
+                                                      single / recovering))
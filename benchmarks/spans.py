@@ -0,0 +1,36 @@
+# Parse speed and tree memory with source spans on every node and without them (spans=False).
+# python -m benchmarks.spans [copies]
+import pickle
+import sys
+import time
+
+from benchmarks.memory import allocated, count
+from benchmarks.warm_start import EXPRESSIONS
+from feel.parser.parser.Parser import Parser
+
+ROUNDS = 5
+
+
+def throughput(parse, texts):
+    best = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for text in texts:
+            parse(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(texts) / best
+
+
+if __name__ == '__main__':
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    texts = [expression % i for i in range(copies) for expression in EXPRESSIONS]
+    print('%-8s %14s %14s %12s %12s' % ('spans', 'parse expr/s', 'stream expr/s', 'B/expr', 'B/node'))
+    for spans in (False, True):
+        parser = Parser(spans=spans)
+        trees = [parser.parse(text) for text in texts]
+        nodes = sum(count(tree) for tree in trees)
+        size = allocated(pickle.loads(pickle.dumps(trees)))
+        print('%-8s %14.0f %14.0f %12.0f %12.1f' % (spans, throughput(parser.parse, texts),
+                                                    throughput(parser.parse_spans, texts),
+                                                    size / float(len(texts)), size / float(nodes)))
@@ -0,0 +1,53 @@
+# Import-to-first-parse time of a fresh interpreter, with the shipped
+# parse/lex tables and with the tables removed (every grammar regenerated).
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+from feel.parser.parser.Parser import parser
+from feel.parser.simple.SimpleParser import parser as simple_parser
+from feel.parser.table.TableParser import parser as table_parser
+imported = time.perf_counter()
+parser.parse('1 + 2 < x')
+simple_parser.parse('1 + 2')
+table_parser.parse('not (>= 5, "a")')
+print(imported - start, time.perf_counter() - start)
+"""
+
+
+def is_table(name):
+    return name == 'parsetab.py' or name.endswith('lextab.py')
+
+
+def copy_tree(destination, with_tables):
+    for package in ('feel', 'utils'):
+        shutil.copytree(os.path.join(ROOT, package), os.path.join(destination, package),
+                        ignore=lambda d, names: [n for n in names
+                                                 if n == '__pycache__' or (not with_tables and is_table(n))])
+
+
+def measure(with_tables):
+    results = []
+    for _ in range(RUNS):
+        workdir = tempfile.mkdtemp()
+        try:
+            copy_tree(workdir, with_tables)
+            out = subprocess.check_output([sys.executable, '-c', SNIPPET], cwd=workdir, stderr=subprocess.DEVNULL)
+            results.append(tuple(float(x) for x in out.split()))
+        finally:
+            shutil.rmtree(workdir)
+    return min(r[0] for r in results), min(r[1] for r in results)
+
+
+if __name__ == '__main__':
+    for label, with_tables in (('without tables (before)', False), ('with shipped tables', True)):
+        imported, parsed = measure(with_tables)
+        print('%-25s import %7.1f ms   import + first parse %7.1f ms' % (label, imported * 1e3, parsed * 1e3))
@@ -0,0 +1,52 @@
+# Memory of streaming a synthetic bundle of simple expressions: python -m benchmarks.streaming [megabytes]
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from feel.parser.simple.SimpleParser import SimpleParser
+from utils.StoreLogger import StoreLogger
+
+EXPRESSIONS = [
+    'amount  *  1.5  +  fee  >  limit  -  20',
+    'date("2017-01-01")  <=  date and time("2018-06-30T10:00:00")',
+    '"gold, silver"  !=  category',
+    '-  discount  **  2  <  .25',
+]
+SAMPLES = 10
+
+
+def rss():
+    """Resident memory in MB; the peak where the current size cannot be read."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (IOError, OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def write_bundle(path, size):
+    count = 0
+    with open(path, 'w') as bundle:
+        while bundle.tell() < size:
+            bundle.write(',\n'.join(EXPRESSIONS[(count + i) % len(EXPRESSIONS)] for i in range(1000)) + ',\n')
+            count += 1000
+        bundle.write('0')
+    return count + 1
+
+
+if __name__ == '__main__':
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 100
+    parser = SimpleParser(StoreLogger())
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bundle.feel')
+        count = write_bundle(path, int(megabytes * 1e6))
+        print('%.0f MB bundle of %d expressions' % (os.path.getsize(path) / 1e6, count))
+        print('%12s %10s %8s' % ('expressions', 'seconds', 'RSS MB'))
+        start = time.perf_counter()
+        print('%12d %10.1f %8.1f' % (0, 0, rss()))
+        with open(path) as bundle:
+            for parsed, _ in enumerate(parser.iterparse(bundle), 1):
+                if parsed % (count // SAMPLES) == 0:
+                    print('%12d %10.1f %8.1f' % (parsed, time.perf_counter() - start, rss()))
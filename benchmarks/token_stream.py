@@ -0,0 +1,58 @@
+# LexToken objects against span-based TokenStreams: lexing throughput and
+# memory allocated for a 1 MB input, and parsing the 50k-cell corpus of
+# benchmarks.warm_start with parse and parse_spans.
+import time
+import tracemalloc
+
+from benchmarks.lexer import INPUTS
+from benchmarks.warm_start import corpus
+from feel.lexer.Lexer import Lexer
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+SIZE = 1000000
+
+
+def lex_tokens(lexer, text):
+    lexer.input(text)
+    return list(iter(lexer.token, None))
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    seconds = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = function(*args)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return seconds, held
+
+
+def parse_all(parse, texts):
+    for text in texts:
+        parse(text)
+
+
+if __name__ == '__main__':
+    lexer = Lexer(StoreLogger())
+    print('%-12s %14s %12s %14s %12s' % ('input', 'LexToken tok/s', 'held MB', 'stream tok/s', 'held MB'))
+    for name, piece in INPUTS:
+        text = piece * (SIZE // len(piece))
+        count = len(lexer.stream(text))
+        tokens_seconds, tokens_held = measure(lex_tokens, lexer, text)
+        stream_seconds, stream_held = measure(lexer.stream, text)
+        print('%-12s %14.0f %12.1f %14.0f %12.1f' % (name, count / tokens_seconds, tokens_held / 1e6,
+                                                     count / stream_seconds, stream_held / 1e6))
+
+    feel, table = corpus()
+    for name, parser, texts in (('feel', Parser(StoreLogger()), feel), ('table', TableParser(StoreLogger()), table)):
+        start = time.perf_counter()
+        parse_all(parser.parse, texts)
+        middle = time.perf_counter()
+        parse_all(parser.parse_spans, texts)
+        end = time.perf_counter()
+        print('%-6s parse %6.0f/s   parse_spans %6.0f/s' % (name, len(texts) / (middle - start), len(texts) / (end - middle)))
@@ -0,0 +1,76 @@
+# Traversals of a balanced tree of about 1M nodes and of a 10k-deep a + b + c + ... chain: walk, a visitor
+# counting names, an identity and a folding transformer, and printing, next to a recursive walk.
+# python -m benchmarks.traversal [nodes] [depth]
+import sys
+import time
+
+from feel.parser import AST
+from feel.parser.Traversal import Transformer, Visitor, walk
+
+
+class Names(Visitor):
+    def __init__(self):
+        super(Names, self).__init__()
+        self.count = 0
+
+    def visit_Name(self, node):
+        self.count += 1
+
+
+class Folder(Transformer):
+    def transform_Sum(self, node):
+        if isinstance(node.value, AST.Number) and isinstance(node.rhs, AST.Number):
+            return AST.Number(node.value.value + node.rhs.value)
+        return node
+
+
+def balanced(nodes):
+    """Sums of numbers and names, about ``nodes`` of them, halved at every level."""
+    leaves = [AST.Number(i) if i % 2 else AST.Name('x%d' % i) for i in range(nodes // 2 + 1)]
+    while len(leaves) > 1:
+        leaves = [AST.Sum(*leaves[i:i + 2]) if i + 1 < len(leaves) else leaves[i] for i in range(0, len(leaves), 2)]
+    return leaves[0]
+
+
+def chain(depth):
+    tree = AST.Name('a')
+    for i in range(depth):
+        tree = AST.Sum(tree, AST.Number(i))
+    return tree
+
+
+def recursive_walk(node):
+    count = 1
+    for name in node.child_fields:
+        value = getattr(node, name)
+        if isinstance(value, AST.AST):
+            count += recursive_walk(value)
+    return count
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    try:
+        function(*args)
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    operations = [
+        ('recursive walk', recursive_walk),
+        ('walk', lambda tree: sum(1 for _ in walk(tree))),
+        ('visitor', lambda tree: Names().visit(tree)),
+        ('identity transformer', Transformer().transform),
+        ('folding transformer', Folder().transform),
+        ('str', str),
+    ]
+    trees = [('balanced', balanced(nodes)), ('chain', chain(depth))]
+    print('%-22s' % 'seconds' + ''.join('%20s' % ('%s %d' % (label, sum(1 for _ in walk(tree))))
+                                        for label, tree in trees))
+    for name, operation in operations:
+        times = [timed(operation, tree) for _, tree in trees]
+        print('%-22s' % name + ''.join('%20s' % ('recursion' if t is None else '%.3f' % t) for t in times))
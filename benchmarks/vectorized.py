@@ -0,0 +1,32 @@
+# Unary tests over a column of a million values: NumPy masks against the compiled test of every record.
+import time
+
+import numpy
+
+from feel.evaluator.Compiler import Compiler
+from feel.evaluator.Vectorized import Vectorizer
+from feel.parser.table.TableParser import TableParser
+
+SIZE = 1000000
+TESTS = ['[18..65[', '>= 5000', '< 100, [500..600], > 9000', 'not (1, 2, 3)', '-', 'null']
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = TableParser()
+    compiler = Compiler()
+    vectorizer = Vectorizer(compiler)
+    values = numpy.random.RandomState(0).uniform(0, 10000, SIZE)
+    records = values.tolist()
+    print('%-28s %12s %12s %8s' % ('test', 'records/s', 'vector/s', 'speedup'))
+    for text in TESTS:
+        test = parser.parse(text)
+        compiled, mask = compiler.compile_test(test), vectorizer.compile(test)
+        per_record = timed(lambda: [compiled(value) for value in records])
+        vector = timed(lambda: mask(values))
+        print('%-28s %12.0f %12.0f %7.0fx' % (text, SIZE / per_record, SIZE / vector, per_record / vector))
@@ -0,0 +1,50 @@
+# Worker warm-up over a synthetic corpus of 50k FEEL cells: parsing every
+# cell versus loading the trees from a DiskCache written by a previous run.
+import os
+import shutil
+import tempfile
+import time
+
+from feel.parser.common.DiskCache import DiskCache
+
+SIZE = 50000
+EXPRESSIONS = [
+    'a  *  %d  +  b',
+    'if  a > %d  then  "big"  else  "small"',
+    'some  x  in  [1, 2, %d]  satisfies  x > 2',
+    '{"limit": %d, "rate": a  /  12}',
+]
+UNARY_TESTS = [
+    '[%d..100]',
+    '< %d',
+    'not (%d, 7)',
+]
+
+
+def corpus():
+    feel = [EXPRESSIONS[i % len(EXPRESSIONS)] % i for i in range(SIZE // 2)]
+    table = [UNARY_TESTS[i % len(UNARY_TESTS)] % i for i in range(SIZE - len(feel))]
+    return feel, table
+
+
+def warm_up(path, feel, table):
+    start = time.perf_counter()
+    cache = DiskCache(path)
+    cache.parse_all(feel)
+    cache.parse_all(table, grammar='table')
+    cache.save()
+    return time.perf_counter() - start, cache
+
+
+if __name__ == '__main__':
+    feel, table = corpus()
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'trees.cache')
+    try:
+        cold, cache = warm_up(path, feel, table)
+        print('cold start: %6.2fs  (%d parsed)' % (cold, cache.misses))
+        warm, cache = warm_up(path, feel, table)
+        print('warm start: %6.2fs  (%d loaded, %d parsed)' % (warm, cache.hits, cache.misses))
+        print('cache file: %6.1f MB' % (os.path.getsize(path) / 1e6))
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,70 @@
+from collections import namedtuple
+
+LEXICAL = 'lexical'
+SYNTAX = 'syntax'
+LIMIT = 'limit'
+
+ParseResult = namedtuple('ParseResult', 'tree diagnostics')
+
+
+class Diagnostic(namedtuple('Diagnostic', 'kind template args index start end expected')):
+    """A lexing, syntax or limit error found in an input.
+
+    Nothing is formatted when a diagnostic is made: the message, the line and column and the source line
+    with a caret under ``data[start:end]`` are rendered when asked for, with the ``LineIndex`` of the
+    input (``index``). ``start`` is ``None`` for errors without a position, like an unexpected end of input.
+    ``expected`` are the tokens the parser could have accepted instead, when known.
+    """
+    __slots__ = ()
+
+    @property
+    def message(self):
+        return self.template % self.args
+
+    @property
+    def data(self):
+        return None if self.index is None else self.index.data
+
+    @property
+    def span(self):
+        return self.start, self.end
+
+    @property
+    def line(self):
+        return None if self.start is None else self.index.line(self.start)
+
+    @property
+    def column(self):
+        return None if self.start is None else self.index.column(self.start)
+
+    def context(self):
+        """The source line of the error, and a line with carets under the offending text."""
+        first, last = self.index.bounds(self.start)
+        length = self.end - self.start
+        return (self.data[first:last + 1],
+                '%s%s%s' % ('~' * (self.start - first), '^' * length, '~' * (last - self.start - length + 1)))
+
+    def lines(self):
+        """The diagnostic as the lines a logger gets."""
+        if self.start is None:
+            return [self.message]
+        position = 'at position %d:%d' % (self.column, self.line)
+        if self.kind == LEXICAL:
+            return [self.message, position] + list(self.context())
+        return ['%s %s' % (self.message, position)] + list(self.context())
+
+    def __str__(self):
+        return '\n'.join(self.lines())
+
+
+class Diagnostics(list):
+    """The diagnostics of one input, in the order found; each is also logged, rendered, if there is a logger."""
+
+    def __init__(self, logger=None):
+        super(Diagnostics, self).__init__()
+        self.logger = logger
+
+    def report(self, diagnostic):
+        self.append(diagnostic)
+        if self.logger is not None:
+            self.logger.log(*diagnostic.lines())
@@ -1,66 +1,80 @@
-def find_first_in_lane(t):
-    return t.lexer.lexdata.rfind('\n', 0, t.lexpos) + 1
+from feel.Diagnostics import Diagnostic, LEXICAL, LIMIT, SYNTAX
+from feel.lexer.LineIndex import line_index
 
 
-def find_last_in_lane(t):
-    last_newline = t.lexer.lexdata.find('\n', t.lexpos)
-    if last_newline < 0:
-        last_newline = len(t.lexer.lexdata)
-    return last_newline - 1
+def token_length(t):
+    if t.type == 'STRING_LITERAL':
+        return len(t.value) + 2
+    elif t.type == 'error' or not isinstance(t.value, str):
+        return 1
+    return len(t.value)
 
 
-def print_context(t, l):
-    first_in_line = find_first_in_lane(t)
-    last_in_line = find_last_in_lane(t)
-    token_len = len(t.value) + 2 if t.type == 'STRING_LITERAL' else len(t.value)
-    l.log(t.lexer.lexdata[first_in_line:last_in_line + 1])
-    l.log('%s%s%s' % ('~' * (t.lexpos - first_in_line),
-                      '^' * token_len,
-                      '~' * (last_in_line - t.lexpos - token_len + 1)))
+def contextual_error(t, template, args, expected=(), kind=SYNTAX, lexer=None):
+    # only tokens made by a rule function, or handed to p_error, carry their lexer
+    lexer = t.lexer if lexer is None else lexer
+    return Diagnostic(kind, template, args, line_index(lexer), t.lexpos, t.lexpos + token_length(t), expected)
 
 
-def missing_token_error(message, t, l):
-    contextual_error(t, '%s; a token %s{%s} found instead' % (message, t.type, t.value), l)
+def positionless_error(template, args=(), expected=(), kind=SYNTAX):
+    return Diagnostic(kind, template, args, None, None, None, expected)
 
 
-def contextual_error(t, message, l):
-    l.log(
-        '%s at position %s:%s' % (message, t.lexpos - find_first_in_lane(t), t.lineno))
-    print_context(t, l)
+def unexpected_character(t):
+    return contextual_error(t, "Unexpected character: '%s'", (t.value[0],), kind=LEXICAL)
 
 
-def token_repr(p):
-    return '%s{%s}' % (p.type, p.value)
+def missing_token_error(message, t, lexer=None):
+    return contextual_error(t, '%s; a token %s{%s} found instead', (message, t.type, t.value), lexer=lexer)
+
+
+def stream_character_error(stream, position, index):
+    return Diagnostic(LEXICAL, "Unexpected character: '%s'", (stream.data[position],), index,
+                      position, position + 1, ())
+
+
+def stream_token_error(stream, i, index, expected=()):
+    return Diagnostic(SYNTAX, 'unexpected token %s{%s}', (stream.type(i), stream.value(i)), index,
+                      stream.starts[i], stream.ends[i], expected)
+
+
+def limit_error(e):
+    return positionless_error('%s', (str(e),), kind=LIMIT)
+
+
+def end_of_file(expected=()):
+    return positionless_error('unexpected end of file', expected=expected)
 
 
 # noinspection PyPep8Naming
 class UnexpectedError(object):
-    def __call__(self, o, l):
-        getattr(self, 'unexpected_%s' % type(o).__name__, self.unexpected)(o, l)
+    def __call__(self, o, expected=()):
+        return getattr(self, 'unexpected_%s' % type(o).__name__, self.unexpected)(o, expected)
 
     @staticmethod
-    def unexpected(o, l):
-        unexpected(o, l)
+    def unexpected(o, expected):
+        return unexpected(o, expected)
 
     @staticmethod
-    def unexpected_LexToken(o, l):
-        unexpected_token(o, l)
+    def unexpected_LexToken(o, expected):
+        return unexpected_token(o, expected)
 
     @staticmethod
-    def unexpected_YaccSymbol(o, l):
-        unexpected_symbol(o, l)
+    def unexpected_YaccSymbol(o, expected):
+        return unexpected_symbol(o, expected)
 
 
-def unexpected_token(t, l):
-    contextual_error(t, 'unexpected token %s' % token_repr(t), l)
+def unexpected_token(t, expected=()):
+    return contextual_error(t, 'unexpected token %s{%s}', (t.type, t.value), expected)
 
 
-def unexpected_symbol(p, l):
-    contextual_error(p.value, 'unexpected symbol %s (token %s)' % (p.type, token_repr(p.value)), l)
+def unexpected_symbol(p, expected=()):
+    return contextual_error(p.value, 'unexpected symbol %s (token %s{%s})', (p.type, p.value.type, p.value.value),
+                            expected, lexer=p.lexer)
 
 
-def unexpected(_, l):
-    l.log('something unexpected')
+def unexpected(_, expected=()):
+    return positionless_error('something unexpected', expected=expected)
 
 
 unexpected_error = UnexpectedError()
@@ -0,0 +1,47 @@
+from feel.parser import AST
+from feel.parser.Traversal import children
+
+
+class LimitExceeded(Exception):
+    pass
+
+
+class Limits(object):
+    """Bounds on the work spent on one input; ``None`` leaves a bound out.
+
+    ``length`` is counted in characters, ``tokens`` in tokens produced by the lexer, ``errors`` in
+    lexing and syntax errors reported and ``depth`` in nested AST nodes of the result. Parsing an input
+    that breaks any of them stops with a single message, and the parser returns ``None``.
+    """
+
+    def __init__(self, length=None, tokens=None, errors=None, depth=None):
+        self.length = length
+        self.tokens = tokens
+        self.errors = errors
+        self.depth = depth
+
+    def check(self, name, value):
+        limit = getattr(self, name)
+        if limit is not None and value > limit:
+            raise LimitExceeded('input exceeds the limit of %d %s' % (limit, 'characters' if name == 'length' else name))
+
+    def check_depth(self, tree):
+        if self.depth is not None and depth(tree, self.depth) > self.depth:
+            raise LimitExceeded('input exceeds the limit of %d nested nodes' % self.depth)
+
+
+UNLIMITED = Limits()
+
+
+def depth(tree, limit=None):
+    """How deep the nodes of a tree nest; stops counting once past ``limit``."""
+    deepest = 0
+    stack = [(tree, 1)] if isinstance(tree, AST.AST) else []
+    while stack:
+        node, level = stack.pop()
+        if level > deepest:
+            deepest = level
+            if limit is not None and deepest > limit:
+                break
+        stack.extend((child, level + 1) for child in children(node))
+    return deepest
@@ -0,0 +1,40 @@
+import decimal
+
+# FEEL numbers are IEEE 754-2008 Decimal128: 34 significant digits.
+CONTEXT = decimal.Context(prec=34, rounding=decimal.ROUND_HALF_EVEN, Emin=-6143, Emax=6144)
+
+MODES = ('float', 'decimal', 'hybrid')
+
+
+class Numbers(object):
+    """Turns the text of numeric literals into Python numbers.
+
+    In the ``'hybrid'`` mode, the default, literals without a fraction become ``int`` and the others
+    ``decimal.Decimal`` rounded to ``context``; both are exact, and arithmetic on small ints is much
+    cheaper than on Decimals. The ``'decimal'`` mode makes every literal a Decimal, the ``'float'`` mode
+    every literal a ``float``.
+    """
+
+    def __init__(self, mode='hybrid', context=CONTEXT):
+        if mode not in MODES:
+            raise ValueError('unknown number mode: %s' % mode)
+        self.mode = mode
+        self.context = context
+        self.convert = getattr(self, 'to_' + mode)
+
+    def __call__(self, text):
+        return self.convert(''.join(text.split()))
+
+    def to_float(self, text):
+        return float(text)
+
+    def to_decimal(self, text):
+        return self.context.create_decimal(text)
+
+    def to_hybrid(self, text):
+        return int(text) if text.isdecimal() else self.context.create_decimal(text)
+
+
+FLOAT = Numbers('float')
+DECIMAL = Numbers('decimal')
+HYBRID = Numbers('hybrid')
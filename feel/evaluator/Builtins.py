@@ -0,0 +1,61 @@
+import functools
+import math
+from decimal import Decimal
+
+from feel.Numbers import CONTEXT as DECIMALS
+from feel.evaluator.Operations import NUMBER, STRING, LIST, kind, as_list, add, divide
+
+
+def _numbers(values):
+    values = as_list(values)
+    return values if values and all(kind(v) == NUMBER for v in values) else None
+
+
+def _on(kind_name, function):
+    def builtin(*args):
+        if kind(args[0]) != kind_name:
+            return None
+        return function(*args)
+
+    return builtin
+
+
+def _aggregate(function):
+    def builtin(*args):
+        values = _numbers(list(args) if len(args) > 1 else args[0])
+        return function(values) if values is not None else None
+
+    return builtin
+
+
+def _sum(values):
+    return functools.reduce(add, values)
+
+
+def _substring(string, start, length=None):
+    start = int(start)
+    begin = start - 1 if start > 0 else len(string) + start
+    return string[begin:] if length is None else string[begin:begin + int(length)]
+
+
+BUILTINS = {
+    'not': lambda value: not value if isinstance(value, bool) else None,
+    'string length': _on(STRING, len),
+    'upper case': _on(STRING, str.upper),
+    'lower case': _on(STRING, str.lower),
+    'substring': _on(STRING, _substring),
+    'contains': _on(STRING, lambda string, match: match in string),
+    'starts with': _on(STRING, str.startswith),
+    'ends with': _on(STRING, str.endswith),
+    'count': _on(LIST, len),
+    'list contains': _on(LIST, lambda values, value: value in values),
+    'append': _on(LIST, lambda values, *items: values + list(items)),
+    'reverse': _on(LIST, lambda values: values[::-1]),
+    'sum': _aggregate(_sum),
+    'min': _aggregate(min),
+    'max': _aggregate(max),
+    'mean': _aggregate(lambda values: divide(_sum(values), len(values))),
+    'abs': _on(NUMBER, lambda value: DECIMALS.abs(value) if value.__class__ is Decimal else abs(value)),
+    'floor': _on(NUMBER, math.floor),
+    'ceiling': _on(NUMBER, math.ceil),
+}
@@ -0,0 +1,358 @@
+import weakref
+
+from feel.evaluator import Operations as op
+from feel.evaluator.Builtins import BUILTINS
+from feel.evaluator.Evaluator import BINARY, LITERALS, ENDPOINT_TESTS, INTERVAL_STARTS, INTERVAL_ENDS, \
+    CALL_ERRORS, EvaluationError, FeelFunction, child_scope, key_name
+from feel.parser import AST
+
+
+class Constant(object):
+    """A folded subtree; compiled parents bind its value instead of calling a closure."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, scope):
+        return self.value
+
+
+def is_constant(compiled):
+    return compiled.__class__ is Constant
+
+
+def fold(function, *compiled):
+    """Applies a pure operation at compile time when all operands are constants."""
+    if all(is_constant(c) for c in compiled):
+        return Constant(function(*[c.value for c in compiled]))
+    return None
+
+
+# noinspection PyPep8Naming
+class Compiler(object):
+    """Turns ASTs into nested closures ``f(scope)`` with the semantics of ``Evaluator``.
+
+    ``compile`` returns a callable taking the variable context; results are cached per AST object.
+    Literal subtrees, and operators over them, are folded into constants at compile time.
+    """
+
+    def __init__(self):
+        self.compilers = {
+            AST.Name: self.compile_Name,
+            AST.QualifiedName: self.compile_QualifiedName,
+            list: self.compile_QualifiedName,
+            AST.Endpoint: self.compile_value,
+            AST.Param: self.compile_value,
+            AST.Type: self.compile_Type,
+            AST.Negation: self.compile_Negation,
+            AST.Between: self.compile_Between,
+            AST.In: self.compile_In,
+            AST.InstanceOf: self.compile_InstanceOf,
+            AST.If: self.compile_If,
+            AST.For: self.compile_For,
+            AST.QuantifiedExpr: self.compile_QuantifiedExpr,
+            AST.FilterExpression: self.compile_FilterExpression,
+            AST.Path: self.compile_Path,
+            AST.Invocation: self.compile_Invocation,
+            AST.List: self.compile_List,
+            AST.SimpleExpressions: self.compile_List,
+            AST.Context: self.compile_Context,
+            AST.FunctionDefinition: self.compile_FunctionDefinition,
+            AST.Error: self.compile_Error,
+        }
+        for cls in BINARY:
+            self.compilers[cls] = self.compile_binary
+        for cls in LITERALS:
+            self.compilers[cls] = self.compile_literal
+
+        self.testers = {
+            AST.PositiveUnaryTests: self.compile_PositiveUnaryTests,
+            AST.Not: self.compile_Not,
+            AST.NoTest: lambda node: lambda value, scope: True,
+            AST.Null: lambda node: lambda value, scope: value is None,
+            AST.Endpoint: self.compile_Endpoint_test,
+            AST.Interval: self.compile_Interval,
+        }
+        for cls in ENDPOINT_TESTS:
+            self.testers[cls] = self.compile_op_endpoint
+
+        self.evaluators = self.compilers
+        self.cache = {}
+
+    def cached(self, node, build):
+        key = (id(node), build)
+        entry = self.cache.get(key)
+        if entry is not None and entry[0]() is node:
+            return entry[1]
+        function = build(node)
+        self.cache[key] = (weakref.ref(node, lambda _: self.cache.pop(key, None)), function)
+        return function
+
+    def compile(self, node):
+        return self.cached(node, self.build_expression)
+
+    def compile_test(self, node):
+        return self.cached(node, self.build_test)
+
+    def build_expression(self, node):
+        function = self.expression(node)
+
+        def run(context=None):
+            return function(BUILTINS if context is None else context)
+
+        return run
+
+    def build_test(self, node):
+        function = self.test_function(node)
+
+        def run(value, context=None):
+            return function(value, BUILTINS if context is None else context) is True
+
+        return run
+
+    def evaluate(self, node, context=None):
+        return self.compile(node)(context)
+
+    def test(self, node, value, context=None):
+        return self.compile_test(node)(value, context)
+
+    def expression(self, node):
+        try:
+            compiler = self.compilers[node.__class__]
+        except KeyError:
+            raise EvaluationError('cannot evaluate %s' % node.__class__.__name__)
+        return compiler(node)
+
+    def test_function(self, node):
+        try:
+            compiler = self.testers[node.__class__]
+        except KeyError:
+            raise EvaluationError('%s is not a unary test' % node.__class__.__name__)
+        return compiler(node)
+
+    # expressions
+    def compile_literal(self, node):
+        return Constant(LITERALS[node.__class__](node.value))
+
+    def compile_value(self, node):
+        return self.expression(node.value)
+
+    def compile_Name(self, node):
+        name = node.value
+        if name in BUILTINS:
+            builtin = BUILTINS[name]
+            return lambda scope: scope.get(name, builtin)
+        if '.' in name:
+            head, _, tail = name.partition('.')
+            path = tail.split('.')
+
+            def dotted(scope):
+                try:
+                    return scope[name]
+                except KeyError:
+                    pass
+                try:
+                    value = scope[head]
+                except KeyError:
+                    return None
+                for part in path:
+                    value = op.path(value, part)
+                return value
+
+            return dotted
+
+        def variable(scope):
+            try:
+                return scope[name]
+            except KeyError:
+                return None
+
+        return variable
+
+    def compile_QualifiedName(self, node):
+        names = node.value if isinstance(node, AST.QualifiedName) else node
+        head = self.expression(names[0])
+        path = [name.value for name in names[1:]]
+
+        def qualified_name(scope):
+            value = head(scope)
+            for name in path:
+                value = op.path(value, name)
+            return value
+
+        return qualified_name
+
+    def compile_Type(self, node):
+        names = node.value if isinstance(node.value, list) else [node.value]
+        return Constant('.'.join(name.value for name in names))
+
+    def compile_binary(self, node):
+        function = BINARY[node.__class__]
+        lhs, rhs = self.expression(node.value), self.expression(node.rhs)
+        folded = fold(function, lhs, rhs)
+        if folded is not None:
+            return folded
+        if is_constant(rhs):
+            rhs_value = rhs.value
+            return lambda scope: function(lhs(scope), rhs_value)
+        if is_constant(lhs):
+            lhs_value = lhs.value
+            return lambda scope: function(lhs_value, rhs(scope))
+        return lambda scope: function(lhs(scope), rhs(scope))
+
+    def compile_Negation(self, node):
+        value = self.expression(node.value)
+        return fold(op.negate, value) or (lambda scope: op.negate(value(scope)))
+
+    def compile_Between(self, node):
+        value, low, high = self.expression(node.value), self.expression(node.b_start), self.expression(node.b_end)
+        return fold(op.between, value, low, high) or (lambda scope: op.between(value(scope), low(scope), high(scope)))
+
+    def compile_In(self, node):
+        value, test = self.expression(node.value), self.test_function(node.tests)
+        return lambda scope: test(value(scope), scope) is True
+
+    def compile_InstanceOf(self, node):
+        value, type_name = self.expression(node.value), self.expression(node.type).value
+        return lambda scope: op.instance_of(value(scope), type_name)
+
+    def compile_If(self, node):
+        condition, then, else_ = self.expression(node.value), self.expression(node.then), self.expression(node.else_)
+        if is_constant(condition):
+            return then if condition.value is True else else_
+        return lambda scope: then(scope) if condition(scope) is True else else_(scope)
+
+    def generators(self, pairs):
+        generators = [(name.value, self.expression(expression)) for name, expression in pairs]
+
+        def iterations(scope, index=0):
+            if index == len(generators):
+                yield scope
+                return
+            name, expression = generators[index]
+            for item in op.as_list(expression(scope)):
+                for inner in iterations(child_scope(scope, {name: item}), index + 1):
+                    yield inner
+
+        return iterations
+
+    def compile_For(self, node):
+        iterations, result = self.generators(node.value), self.expression(node.result)
+        return lambda scope: [result(inner) for inner in iterations(scope)]
+
+    def compile_QuantifiedExpr(self, node):
+        iterations, test = self.generators(node.generators), self.expression(node.test)
+        quantifier = any if node.value else all
+        return lambda scope: quantifier(test(inner) is True for inner in iterations(scope))
+
+    def compile_FilterExpression(self, node):
+        items = self.expression(node.value)
+        criterion = self.expression(node.filter)
+        if is_constant(criterion) and op.kind(criterion.value) == op.NUMBER:
+            position = criterion.value
+            return lambda scope: op.index(op.as_list(items(scope)), position)
+
+        def filter_expression(scope):
+            values = op.as_list(items(scope))
+            selected = []
+            for item in values:
+                frame = dict(item) if isinstance(item, dict) else {}
+                frame['item'] = item
+                result = criterion(child_scope(scope, frame))
+                if result is True:
+                    selected.append(item)
+                elif op.kind(result) == op.NUMBER:
+                    return op.index(values, result)
+            return selected
+
+        return filter_expression
+
+    def compile_Path(self, node):
+        value, name = self.expression(node.value), node.name.value
+        return lambda scope: op.path(value(scope), name)
+
+    def compile_Invocation(self, node):
+        function = self.expression(node.value)
+        if node.parameters and isinstance(node.parameters[0], tuple):
+            named = [(name.value, self.expression(value)) for name, value in node.parameters]
+
+            def call(scope):
+                return function(scope)(**dict((name, value(scope)) for name, value in named))
+        else:
+            positional = [self.expression(parameter) for parameter in node.parameters]
+
+            def call(scope):
+                return function(scope)(*[parameter(scope) for parameter in positional])
+
+        def invocation(scope):
+            try:
+                return call(scope)
+            except CALL_ERRORS:
+                return None
+
+        return invocation
+
+    def compile_List(self, node):
+        items = [self.expression(item) for item in node.value]
+        folded = fold(lambda *values: list(values), *items)
+        if folded is not None:
+            values = folded.value
+            return lambda scope: list(values)
+        return lambda scope: [item(scope) for item in items]
+
+    def compile_Context(self, node):
+        entries = [(key_name(key), self.expression(value)) for key, value in node.value]
+
+        def context(scope):
+            result = {}
+            inner = child_scope(scope, result)
+            for key, value in entries:
+                result[key] = inner[key] = value(inner)
+            return result
+
+        return context
+
+    def compile_FunctionDefinition(self, node):
+        if node.external:
+            raise EvaluationError('external functions are not supported')
+        params, body = [param.value for param in node.params], self.expression(node.value)
+        return lambda scope: FeelFunction(params, body, scope)
+
+    def compile_Error(self, node):
+        raise EvaluationError('cannot evaluate %r, which did not parse' % node.value)
+
+    # unary tests
+    def compile_PositiveUnaryTests(self, node):
+        tests = [self.test_function(test) for test in node.value]
+        if len(tests) == 1:
+            return tests[0]
+        return lambda value, scope: any(test(value, scope) is True for test in tests)
+
+    def compile_Not(self, node):
+        test = self.test_function(node.value)
+        return lambda value, scope: test(value, scope) is not True
+
+    def compile_Endpoint_test(self, node):
+        endpoint = self.expression(node)
+        if is_constant(endpoint):
+            constant = endpoint.value
+            return lambda value, scope: op.equal(value, constant)
+        return lambda value, scope: op.equal(value, endpoint(scope))
+
+    def compile_op_endpoint(self, node):
+        compare, endpoint = ENDPOINT_TESTS[node.__class__], self.expression(node.value)
+        if is_constant(endpoint):
+            constant = endpoint.value
+            return lambda value, scope: compare(value, constant)
+        return lambda value, scope: compare(value, endpoint(scope))
+
+    def compile_Interval(self, node):
+        above, below = INTERVAL_STARTS[node.start.__class__], INTERVAL_ENDS[node.end.__class__]
+        low, high = self.expression(node.value), self.expression(node.endValue)
+        if is_constant(low) and is_constant(high):
+            low_value, high_value = low.value, high.value
+            return lambda value, scope: above(value, low_value) is True and below(value, high_value)
+        return lambda value, scope: above(value, low(scope)) is True and below(value, high(scope))
+
+
+compiler = Compiler()
@@ -0,0 +1,353 @@
+import bisect
+import functools
+import itertools
+
+from feel.evaluator import Operations as op
+from feel.evaluator.Compiler import compiler as default_compiler, is_constant
+from feel.evaluator.Evaluator import EvaluationError
+from feel.parser import AST
+from feel.parser.parser.Parser import parser as default_parser
+from feel.parser.table.TableParser import parser as default_table_parser
+
+
+class HitPolicyError(EvaluationError):
+    pass
+
+
+OPEN, CLOSED = False, True
+
+LOWER_BOUNDS = {
+    AST.GtEp: OPEN,
+    AST.GteEp: CLOSED,
+}
+
+UPPER_BOUNDS = {
+    AST.LtEp: OPEN,
+    AST.LteEp: CLOSED,
+}
+
+INTERVAL_STARTS = {
+    AST.OpenIntervalStart: OPEN,
+    AST.ClosedIntervalStart: CLOSED,
+}
+
+INTERVAL_ENDS = {
+    AST.OpenIntervalEnd: OPEN,
+    AST.ClosedIntervalEnd: CLOSED,
+}
+
+
+# kinds whose values may carry a UTC offset; naive and aware values do not compare
+ZONED = {op.TIME, op.DATE_AND_TIME}
+
+
+def range_key(value, value_kind):
+    """The range index a value belongs to: its kind, and whether it is aware for kinds in ``ZONED``."""
+    if value_kind in ZONED:
+        return value_kind, value.utcoffset() is not None
+    return value_kind, False
+
+
+class Joined(object):
+    """Disjoint sets of rules seen as one set, without copying them."""
+    __slots__ = ('parts', 'length')
+
+    def __init__(self, parts):
+        self.parts = parts
+        self.length = sum(map(len, parts))
+
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, rule):
+        for part in self.parts:
+            if rule in part:
+                return True
+        return False
+
+    def __iter__(self):
+        return itertools.chain(*self.parts)
+
+
+class RangeIndex(object):
+    """Stabbing index over ranges of values that compare with each other.
+
+    The bounds split the line into points and the gaps between them, the slots. Every range is kept at
+    the few nodes of a segment tree over the slots that together cover its slots, so nested ranges take
+    memory proportional to n log n, not n squared; a lookup is a bisection and a walk from the slot up to
+    the root. A range is at most at one node on such a path, so the sets of rules found there are
+    disjoint, and are returned joined rather than copied into one.
+    """
+
+    def __init__(self, ranges):
+        self.bounds = sorted(set(b for _, low, _, high, _ in ranges for b in (low, high) if b is not None))
+        # leaves are nodes size to 2 * size - 1, and the parent of node i is i // 2
+        self.size = size = 2 * len(self.bounds) + 1
+        nodes = {}
+        for rule, low, low_closed, high, high_closed in ranges:
+            first = 0 if low is None else self.slot(low) + (0 if low_closed else 1)
+            last = size - 1 if high is None else self.slot(high) - (0 if high_closed else 1)
+            first, stop = first + size, last + size + 1
+            while first < stop:
+                if first & 1:
+                    nodes.setdefault(first, set()).add(rule)
+                    first += 1
+                if stop & 1:
+                    stop -= 1
+                    nodes.setdefault(stop, set()).add(rule)
+                first >>= 1
+                stop >>= 1
+        self.nodes = dict((node, frozenset(rules)) for node, rules in nodes.items())
+
+    def slot(self, value):
+        position = bisect.bisect_left(self.bounds, value)
+        if position < len(self.bounds) and self.bounds[position] == value:
+            return 2 * position + 1
+        return 2 * position
+
+    def lookup(self, value):
+        nodes, node, found = self.nodes, self.slot(value) + self.size, []
+        while node:
+            if node in nodes:
+                found.append(nodes[node])
+            node >>= 1
+        if len(found) == 1:
+            return found[0]
+        return Joined(found) if found else frozenset()
+
+
+class ColumnIndex(object):
+    """Rules matching a value of one input column.
+
+    ``-`` cells are wildcards, constant endpoints go to a hash index keyed by (kind, value), constant
+    comparisons and intervals to a range index per kind (split into naive and aware times and dates and
+    times, which do not compare); other cells are tested one by one.
+    """
+
+    def __init__(self, cells, compiler):
+        self.compiler = compiler
+        self.wildcards = set()
+        self.points = {}
+        self.ranges = {}
+        self.scan = []
+        for rule, cell in enumerate(cells):
+            self.add(rule, cell)
+        self.wildcards = frozenset(self.wildcards)
+        self.points = dict((key, frozenset(rules)) for key, rules in self.points.items())
+        self.ranges = dict((kind, RangeIndex(ranges)) for kind, ranges in self.ranges.items())
+
+    def add(self, rule, cell):
+        if cell.__class__ is AST.NoTest:
+            self.wildcards.add(rule)
+            return
+        tests = cell.value if cell.__class__ is AST.PositiveUnaryTests else [cell]
+        entries = [self.classify(test) for test in tests]
+        if None in entries:
+            self.scan.append((rule, self.compiler.test_function(cell)))
+            return
+        for index, key in entries:
+            if index == 'points':
+                self.points.setdefault(key, set()).add(rule)
+            else:
+                bound = key[0] if key[0] is not None else key[2]
+                self.ranges.setdefault(range_key(bound, op.kind(bound)), []).append((rule,) + key)
+
+    def constant(self, node):
+        compiled = self.compiler.expression(node)
+        return (True, compiled.value) if is_constant(compiled) else (False, None)
+
+    def classify(self, test):
+        """Where a positive unary test can be indexed, or None when it has to be tested."""
+        cls = test.__class__
+        if cls is AST.Null:
+            return 'points', (None, None)
+        if cls is AST.Endpoint:
+            known, value = self.constant(test)
+            if not known:
+                return None
+            try:
+                hash(value)
+            except TypeError:
+                return None
+            return 'points', (op.kind(value), value)
+        if cls in LOWER_BOUNDS or cls in UPPER_BOUNDS:
+            known, value = self.constant(test.value)
+            if not known or op.kind(value) not in op.ORDERED:
+                return None
+            if cls in LOWER_BOUNDS:
+                return 'ranges', (value, LOWER_BOUNDS[cls], None, OPEN)
+            return 'ranges', (None, OPEN, value, UPPER_BOUNDS[cls])
+        if cls is AST.Interval:
+            low_known, low = self.constant(test.value)
+            high_known, high = self.constant(test.endValue)
+            if not (low_known and high_known) or op.kind(low) not in op.ORDERED:
+                return None
+            if range_key(low, op.kind(low)) != range_key(high, op.kind(high)):
+                return None
+            return 'ranges', (low, INTERVAL_STARTS[test.start.__class__], high, INTERVAL_ENDS[test.end.__class__])
+        return None
+
+    def lookup(self, value, scope):
+        parts = []
+        value_kind = op.kind(value)
+        try:
+            if (value_kind, value) in self.points:
+                parts.append(self.points[value_kind, value])
+        except TypeError:
+            pass
+        if value_kind in op.ORDERED:
+            ranges = self.ranges.get(range_key(value, value_kind))
+            if ranges is not None:
+                parts.append(ranges.lookup(value))
+        scanned = [rule for rule, test in self.scan if test(value, scope) is True]
+        if not scanned and len(parts) < 2:
+            return parts[0] if parts else frozenset()
+        return frozenset(itertools.chain(scanned, *parts))
+
+
+def aggregate(function):
+    """Folds the outputs that are not null with a FEEL operation; null as soon as a step gives null."""
+    def aggregation(values):
+        values = [value for value in values if value is not None]
+        return functools.reduce(function, values) if values else None
+
+    return aggregation
+
+
+def least(a, b):
+    before = op.less(b, a)
+    return None if before is None else b if before else a
+
+
+def greatest(a, b):
+    after = op.less(a, b)
+    return None if after is None else b if after else a
+
+
+AGGREGATIONS = {
+    'SUM': aggregate(op.add),
+    'MIN': aggregate(least),
+    'MAX': aggregate(greatest),
+    'COUNT': len,
+}
+
+
+class DecisionTable(object):
+    """A decision table: input expressions, unary test cells per rule and output entries.
+
+    ``rules`` is a grid of strings, input entries first and output entries after them. Every cell is
+    parsed once, input entries with ``TableParser`` and the rest with ``Parser``. Unless ``indexed`` is
+    false, matching an input uses ``ColumnIndex`` per column instead of testing every rule. With an
+    ``Interner`` equal cells, and equal parts of cells, share one tree, which is also compiled only once.
+    """
+
+    def __init__(self, inputs, outputs, rules, hit_policy='UNIQUE', aggregation=None, output_values=None,
+                 indexed=True, parser=default_parser, table_parser=default_table_parser, compiler=default_compiler,
+                 interner=None):
+        self.compiler = compiler
+        self.interner = interner
+        self.inputs = [compiler.compile(self.parse(parser, text, 'input expression')) for text in inputs]
+        self.outputs = list(outputs)
+        self.entries = []
+        self.results = []
+        for row in rules:
+            row = list(row)
+            if len(row) != len(inputs) + len(outputs):
+                raise EvaluationError('rule %d has %d cells instead of %d' % (len(self.results) + 1, len(row),
+                                                                              len(inputs) + len(outputs)))
+            self.entries.append([self.parse(table_parser, text, 'input entry') for text in row[:len(inputs)]])
+            self.results.append([compiler.compile(self.parse(parser, text, 'output entry'))
+                                 for text in row[len(inputs):]])
+
+        self.hit_policies = {
+            'UNIQUE': self.unique,
+            'ANY': self.any,
+            'FIRST': self.first,
+            'PRIORITY': self.priority,
+            'RULE ORDER': self.rule_order,
+            'OUTPUT ORDER': self.output_order,
+            'COLLECT': self.collect,
+        }
+        if hit_policy not in self.hit_policies:
+            raise EvaluationError('unknown hit policy %s' % hit_policy)
+        if aggregation is not None and (hit_policy != 'COLLECT' or aggregation not in AGGREGATIONS):
+            raise EvaluationError('aggregation %s is not valid for hit policy %s' % (aggregation, hit_policy))
+        self.hit_policy = self.hit_policies[hit_policy]
+        self.aggregation = AGGREGATIONS.get(aggregation)
+        self.output_values = output_values or {}
+
+        columns = list(zip(*self.entries)) if self.entries else [()] * len(inputs)
+        if indexed:
+            self.columns = [ColumnIndex(cells, compiler) for cells in columns]
+        else:
+            self.columns = None
+            self.tests = [[compiler.test_function(cell) for cell in row] for row in self.entries]
+
+    def parse(self, parser, text, what):
+        ast = parser.parse(text)
+        if ast is None:
+            raise EvaluationError('cannot parse %s %r' % (what, text))
+        return ast if self.interner is None else self.interner.intern(ast)
+
+    def matching_rules(self, values, scope):
+        if self.columns is None:
+            return [rule for rule, tests in enumerate(self.tests)
+                    if all(test(value, scope) is True for test, value in zip(tests, values))]
+        if not self.columns:
+            return list(range(len(self.results)))
+        lookups = [(column.lookup(value, scope), column.wildcards) for column, value in zip(self.columns, values)]
+        lookups.sort(key=lambda lookup: len(lookup[0]) + len(lookup[1]))
+        (hits, wildcards), rest = lookups[0], lookups[1:]
+        return sorted(rule for rule in itertools.chain(hits, wildcards)
+                      if all(rule in other_hits or rule in other_wildcards for other_hits, other_wildcards in rest))
+
+    def output(self, rule, scope):
+        values = [result(scope) for result in self.results[rule]]
+        return values[0] if len(values) == 1 else dict(zip(self.outputs, values))
+
+    def evaluate(self, context=None):
+        scope = {} if context is None else context
+        values = [expression(scope) for expression in self.inputs]
+        return self.hit_policy(self.matching_rules(values, scope), scope)
+
+    # hit policies
+    def unique(self, rules, scope):
+        if len(rules) > 1:
+            raise HitPolicyError('UNIQUE hit policy violated by rules %s' % ', '.join(str(r + 1) for r in rules))
+        return self.output(rules[0], scope) if rules else None
+
+    def any(self, rules, scope):
+        outputs = [self.output(rule, scope) for rule in rules]
+        if any(output != outputs[0] for output in outputs[1:]):
+            raise HitPolicyError('ANY hit policy violated by rules %s' % ', '.join(str(r + 1) for r in rules))
+        return outputs[0] if outputs else None
+
+    def first(self, rules, scope):
+        return self.output(rules[0], scope) if rules else None
+
+    def priority_key(self, rule, scope):
+        key = []
+        for name, result in zip(self.outputs, self.results[rule]):
+            values = self.output_values.get(name, [])
+            value = result(scope)
+            key.append(values.index(value) if value in values else len(values))
+        return key
+
+    def output_order(self, rules, scope):
+        ordered = sorted(rules, key=lambda rule: self.priority_key(rule, scope))
+        return [self.output(rule, scope) for rule in ordered]
+
+    def priority(self, rules, scope):
+        outputs = self.output_order(rules, scope)
+        return outputs[0] if outputs else None
+
+    def rule_order(self, rules, scope):
+        return [self.output(rule, scope) for rule in rules]
+
+    def collect(self, rules, scope):
+        outputs = self.rule_order(rules, scope)
+        if self.aggregation is None:
+            return outputs
+        if len(self.outputs) != 1:
+            raise HitPolicyError('COLLECT aggregation needs a single output')
+        return self.aggregation(outputs)
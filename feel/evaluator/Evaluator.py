@@ -0,0 +1,296 @@
+from collections import ChainMap
+
+from feel.evaluator import Operations as op
+from feel.evaluator.Builtins import BUILTINS
+from feel.parser import AST
+
+
+class EvaluationError(Exception):
+    pass
+
+
+class Scope(dict):
+    """Variables of a frame (an iteration, a function call, a context), falling back to the enclosing scope."""
+
+    __slots__ = ('parent',)
+
+    def __init__(self, frame, parent):
+        super(Scope, self).__init__(frame)
+        self.parent = parent
+
+    def __missing__(self, key):
+        return self.parent[key]
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self.parent
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def child_scope(scope, frame):
+    return Scope(frame, scope)
+
+
+class FeelFunction(object):
+    def __init__(self, params, body, scope):
+        self.params = params
+        self.body = body
+        self.scope = scope
+
+    def __call__(self, *args, **kwargs):
+        frame = dict.fromkeys(self.params)
+        frame.update(zip(self.params, args))
+        frame.update(kwargs)
+        return self.body(child_scope(self.scope, frame))
+
+
+BINARY = {
+    AST.Sum: op.add,
+    AST.Dif: op.subtract,
+    AST.Mul: op.multiply,
+    AST.Div: op.divide,
+    AST.Exp: op.power,
+    AST.Eq: op.equal,
+    AST.Neq: op.not_equal,
+    AST.Lt: op.less,
+    AST.Lte: op.less_equal,
+    AST.Gt: op.greater,
+    AST.Gte: op.greater_equal,
+    AST.Conjunction: op.conjunction,
+    AST.Disjunction: op.disjunction,
+}
+
+LITERALS = {
+    AST.Number: lambda value: value,
+    AST.StringLiteral: lambda value: value,
+    AST.Boolean: lambda value: value,
+    AST.Null: lambda value: None,
+    AST.Date: op.parse_date,
+    AST.Time: op.parse_time,
+    AST.DateAndTime: op.parse_date_and_time,
+    AST.Duration: op.parse_duration,
+}
+
+ENDPOINT_TESTS = {
+    AST.LtEp: op.less,
+    AST.LteEp: op.less_equal,
+    AST.GtEp: op.greater,
+    AST.GteEp: op.greater_equal,
+}
+
+INTERVAL_STARTS = {
+    AST.OpenIntervalStart: op.greater,
+    AST.ClosedIntervalStart: op.greater_equal,
+}
+
+INTERVAL_ENDS = {
+    AST.OpenIntervalEnd: op.less,
+    AST.ClosedIntervalEnd: op.less_equal,
+}
+
+CALL_ERRORS = (TypeError, ValueError, ArithmeticError, LookupError)
+
+
+def key_name(key):
+    return key.value if isinstance(key, AST.Name) else key
+
+
+def new_scope(context=None):
+    return ChainMap(context or {}, BUILTINS)
+
+
+# noinspection PyPep8Naming
+class Evaluator(object):
+    """Tree-walking interpreter of the ASTs built by the parsers.
+
+    Every node class is dispatched through a table keyed by the node type; unary tests (table input
+    entries and the right hand side of ``in``) have a table of their own, used by ``test``.
+    """
+
+    def __init__(self):
+        self.evaluators = {
+            AST.Name: self.evaluate_Name,
+            AST.QualifiedName: self.evaluate_QualifiedName,
+            list: self.evaluate_QualifiedName,
+            AST.Endpoint: self.evaluate_value,
+            AST.Param: self.evaluate_value,
+            AST.Type: self.evaluate_Type,
+            AST.Negation: self.evaluate_Negation,
+            AST.Between: self.evaluate_Between,
+            AST.In: self.evaluate_In,
+            AST.InstanceOf: self.evaluate_InstanceOf,
+            AST.If: self.evaluate_If,
+            AST.For: self.evaluate_For,
+            AST.QuantifiedExpr: self.evaluate_QuantifiedExpr,
+            AST.FilterExpression: self.evaluate_FilterExpression,
+            AST.Path: self.evaluate_Path,
+            AST.Invocation: self.evaluate_Invocation,
+            AST.List: self.evaluate_List,
+            AST.SimpleExpressions: self.evaluate_List,
+            AST.Context: self.evaluate_Context,
+            AST.FunctionDefinition: self.evaluate_FunctionDefinition,
+            AST.Error: self.evaluate_Error,
+        }
+        for cls in BINARY:
+            self.evaluators[cls] = self.evaluate_binary
+        for cls in LITERALS:
+            self.evaluators[cls] = self.evaluate_literal
+
+        self.testers = {
+            AST.PositiveUnaryTests: self.test_PositiveUnaryTests,
+            AST.Not: self.test_Not,
+            AST.NoTest: lambda node, value, scope: True,
+            AST.Null: lambda node, value, scope: value is None,
+            AST.Endpoint: self.test_Endpoint,
+            AST.Interval: self.test_Interval,
+        }
+        for cls in ENDPOINT_TESTS:
+            self.testers[cls] = self.test_op_endpoint
+
+    def evaluate(self, node, context=None):
+        return self.eval(node, new_scope(context))
+
+    def test(self, node, value, context=None):
+        return self.match(node, value, new_scope(context))
+
+    def eval(self, node, scope):
+        try:
+            evaluator = self.evaluators[node.__class__]
+        except KeyError:
+            raise EvaluationError('cannot evaluate %s' % node.__class__.__name__)
+        return evaluator(node, scope)
+
+    def match(self, node, value, scope):
+        try:
+            tester = self.testers[node.__class__]
+        except KeyError:
+            raise EvaluationError('%s is not a unary test' % node.__class__.__name__)
+        return tester(node, value, scope) is True
+
+    # expressions
+    def evaluate_literal(self, node, scope):
+        return LITERALS[node.__class__](node.value)
+
+    def evaluate_value(self, node, scope):
+        return self.eval(node.value, scope)
+
+    def evaluate_Name(self, node, scope):
+        return op.lookup(scope, node.value)
+
+    def evaluate_QualifiedName(self, node, scope):
+        names = node.value if isinstance(node, AST.QualifiedName) else node
+        value = self.eval(names[0], scope)
+        for name in names[1:]:
+            value = op.path(value, name.value)
+        return value
+
+    def evaluate_Type(self, node, scope):
+        names = node.value if isinstance(node.value, list) else [node.value]
+        return '.'.join(name.value for name in names)
+
+    def evaluate_binary(self, node, scope):
+        return BINARY[node.__class__](self.eval(node.value, scope), self.eval(node.rhs, scope))
+
+    def evaluate_Negation(self, node, scope):
+        return op.negate(self.eval(node.value, scope))
+
+    def evaluate_Between(self, node, scope):
+        return op.between(self.eval(node.value, scope), self.eval(node.b_start, scope), self.eval(node.b_end, scope))
+
+    def evaluate_In(self, node, scope):
+        return self.match(node.tests, self.eval(node.value, scope), scope)
+
+    def evaluate_InstanceOf(self, node, scope):
+        return op.instance_of(self.eval(node.value, scope), self.eval(node.type, scope))
+
+    def evaluate_If(self, node, scope):
+        branch = node.then if self.eval(node.value, scope) is True else node.else_
+        return self.eval(branch, scope)
+
+    def iterations(self, generators, scope):
+        if not generators:
+            yield scope
+            return
+        (name, expression), rest = generators[0], generators[1:]
+        for item in op.as_list(self.eval(expression, scope)):
+            for inner in self.iterations(rest, child_scope(scope, {name.value: item})):
+                yield inner
+
+    def evaluate_For(self, node, scope):
+        return [self.eval(node.result, inner) for inner in self.iterations(node.value, scope)]
+
+    def evaluate_QuantifiedExpr(self, node, scope):
+        results = (self.eval(node.test, inner) is True for inner in self.iterations(node.generators, scope))
+        return any(results) if node.value else all(results)
+
+    def evaluate_FilterExpression(self, node, scope):
+        items = op.as_list(self.eval(node.value, scope))
+        if isinstance(node.filter, AST.Number):
+            return op.index(items, node.filter.value)
+        selected = []
+        for item in items:
+            frame = dict(item) if isinstance(item, dict) else {}
+            frame['item'] = item
+            criterion = self.eval(node.filter, child_scope(scope, frame))
+            if criterion is True:
+                selected.append(item)
+            elif op.kind(criterion) == op.NUMBER:
+                return op.index(items, criterion)
+        return selected
+
+    def evaluate_Path(self, node, scope):
+        return op.path(self.eval(node.value, scope), node.name.value)
+
+    def evaluate_Invocation(self, node, scope):
+        function = self.eval(node.value, scope)
+        if not callable(function):
+            return None
+        try:
+            if node.parameters and isinstance(node.parameters[0], tuple):
+                return function(**dict((name.value, self.eval(value, scope)) for name, value in node.parameters))
+            return function(*[self.eval(parameter, scope) for parameter in node.parameters])
+        except CALL_ERRORS:
+            return None
+
+    def evaluate_List(self, node, scope):
+        return [self.eval(item, scope) for item in node.value]
+
+    def evaluate_Context(self, node, scope):
+        result = {}
+        inner = child_scope(scope, result)
+        for key, value in node.value:
+            result[key_name(key)] = inner[key_name(key)] = self.eval(value, inner)
+        return result
+
+    def evaluate_FunctionDefinition(self, node, scope):
+        if node.external:
+            raise EvaluationError('external functions are not supported')
+        body = node.value
+        return FeelFunction([param.value for param in node.params], lambda inner: self.eval(body, inner), scope)
+
+    def evaluate_Error(self, node, scope):
+        raise EvaluationError('cannot evaluate %r, which did not parse' % node.value)
+
+    # unary tests
+    def test_PositiveUnaryTests(self, node, value, scope):
+        return any(self.match(test, value, scope) for test in node.value)
+
+    def test_Not(self, node, value, scope):
+        return not self.match(node.value, value, scope)
+
+    def test_Endpoint(self, node, value, scope):
+        return op.equal(value, self.eval(node, scope))
+
+    def test_op_endpoint(self, node, value, scope):
+        return ENDPOINT_TESTS[node.__class__](value, self.eval(node.value, scope))
+
+    def test_Interval(self, node, value, scope):
+        low = INTERVAL_STARTS[node.start.__class__](value, self.eval(node.value, scope))
+        return low is True and INTERVAL_ENDS[node.end.__class__](value, self.eval(node.endValue, scope))
+
+
+evaluator = Evaluator()
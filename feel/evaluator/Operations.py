@@ -0,0 +1,333 @@
+"""FEEL semantics of operators on Python values.
+
+Numbers are ``int``, ``decimal.Decimal`` or ``float``, strings are ``str``, dates and times come from
+``datetime``, days and time durations are ``timedelta``, lists are ``list`` and contexts are ``dict``. Like in
+FEEL, an operation on operands it does not support yields null (``None``) instead of raising.
+
+Arithmetic on Decimals is rounded to ``feel.Numbers.CONTEXT``, and a float meeting a Decimal becomes the Decimal
+of its shortest repr. Dividing ints, or raising them to negative powers, gives a Decimal unless the result is
+whole; otherwise ints stay ints.
+"""
+import datetime
+import numbers
+import operator
+import re
+from decimal import Decimal
+
+from feel.Numbers import CONTEXT as DECIMALS
+
+NUMBER = 'number'
+STRING = 'string'
+BOOLEAN = 'boolean'
+DATE = 'date'
+TIME = 'time'
+DATE_AND_TIME = 'date and time'
+DURATION = 'days and time duration'
+LIST = 'list'
+CONTEXT = 'context'
+FUNCTION = 'function'
+
+KINDS = {
+    bool: BOOLEAN,
+    int: NUMBER,
+    Decimal: NUMBER,
+    float: NUMBER,
+    str: STRING,
+    datetime.date: DATE,
+    datetime.time: TIME,
+    datetime.datetime: DATE_AND_TIME,
+    datetime.timedelta: DURATION,
+    list: LIST,
+    dict: CONTEXT,
+}
+
+ORDERED = {NUMBER, STRING, DATE, TIME, DATE_AND_TIME, DURATION}
+
+
+def kind(value):
+    try:
+        return KINDS[value.__class__]
+    except KeyError:
+        pass
+    if value is None:
+        return None
+    for cls in (bool, datetime.datetime, datetime.date, datetime.time, datetime.timedelta, str, list, dict):
+        if isinstance(value, cls):
+            return KINDS[cls]
+    if isinstance(value, numbers.Number):
+        return NUMBER
+    if callable(value):
+        return FUNCTION
+    return None
+
+
+def _time_plus(t, d):
+    moment = datetime.datetime.combine(datetime.date(2000, 1, 1), t) + d
+    return moment.timetz()
+
+
+def _decimal(value):
+    return Decimal(repr(value)) if value.__class__ is float else value
+
+
+def _numeric(function, decimal_function):
+    """``function`` on ints and floats, ``decimal_function`` of the context as soon as a Decimal takes part."""
+    def apply(a, b):
+        if a.__class__ is Decimal or b.__class__ is Decimal:
+            return decimal_function(_decimal(a), _decimal(b))
+        return function(a, b)
+
+    return apply
+
+
+def _divide(a, b):
+    if a.__class__ is int and b.__class__ is int:
+        return a // b if a % b == 0 else DECIMALS.divide(a, b)
+    return a / b
+
+
+def _power(a, b):
+    if a.__class__ is int and b.__class__ is int and b < 0:
+        return DECIMALS.power(a, b)
+    return a ** b
+
+
+def _scale(duration, number):
+    return duration * (float(number) if number.__class__ is Decimal else number)
+
+
+def _shrink(duration, number):
+    return duration / (float(number) if number.__class__ is Decimal else number)
+
+
+ADDITION = {
+    (NUMBER, NUMBER): _numeric(operator.add, DECIMALS.add),
+    (STRING, STRING): operator.add,
+    (DURATION, DURATION): operator.add,
+    (DATE, DURATION): operator.add,
+    (DURATION, DATE): operator.add,
+    (DATE_AND_TIME, DURATION): operator.add,
+    (DURATION, DATE_AND_TIME): operator.add,
+    (TIME, DURATION): _time_plus,
+    (DURATION, TIME): lambda d, t: _time_plus(t, d),
+}
+
+SUBTRACTION = {
+    (NUMBER, NUMBER): _numeric(operator.sub, DECIMALS.subtract),
+    (DURATION, DURATION): operator.sub,
+    (DATE, DATE): operator.sub,
+    (DATE, DURATION): operator.sub,
+    (DATE_AND_TIME, DATE_AND_TIME): operator.sub,
+    (DATE_AND_TIME, DURATION): operator.sub,
+    (TIME, DURATION): lambda t, d: _time_plus(t, -d),
+}
+
+MULTIPLICATION = {
+    (NUMBER, NUMBER): _numeric(operator.mul, DECIMALS.multiply),
+    (DURATION, NUMBER): _scale,
+    (NUMBER, DURATION): lambda n, d: _scale(d, n),
+}
+
+DIVISION = {
+    (NUMBER, NUMBER): _numeric(_divide, DECIMALS.divide),
+    (DURATION, NUMBER): _shrink,
+    (DURATION, DURATION): operator.truediv,
+}
+
+EXPONENTIATION = {
+    (NUMBER, NUMBER): _numeric(_power, DECIMALS.power),
+}
+
+
+def arithmetic(table, a, b):
+    function = table.get((kind(a), kind(b)))
+    if function is None:
+        return None
+    try:
+        return function(a, b)
+    except (ArithmeticError, ValueError, TypeError):
+        return None
+
+
+def add(a, b):
+    return arithmetic(ADDITION, a, b)
+
+
+def subtract(a, b):
+    return arithmetic(SUBTRACTION, a, b)
+
+
+def multiply(a, b):
+    return arithmetic(MULTIPLICATION, a, b)
+
+
+def divide(a, b):
+    return arithmetic(DIVISION, a, b)
+
+
+def power(a, b):
+    result = arithmetic(EXPONENTIATION, a, b)
+    return None if isinstance(result, complex) else result
+
+
+def negate(a):
+    if a.__class__ is Decimal:
+        return DECIMALS.minus(a)
+    return -a if kind(a) in (NUMBER, DURATION) else None
+
+
+def equal(a, b):
+    if a is None or b is None:
+        return a is b
+    if kind(a) != kind(b):
+        return None
+    return a == b
+
+
+def not_equal(a, b):
+    result = equal(a, b)
+    return None if result is None else not result
+
+
+def _ordering(op):
+    def compare(a, b):
+        a_kind = kind(a)
+        if a_kind not in ORDERED or a_kind != kind(b):
+            return None
+        try:
+            return op(a, b)
+        except TypeError:
+            return None
+
+    return compare
+
+
+less = _ordering(operator.lt)
+less_equal = _ordering(operator.le)
+greater = _ordering(operator.gt)
+greater_equal = _ordering(operator.ge)
+
+
+def conjunction(a, b):
+    if a is False or b is False:
+        return False
+    if a is True and b is True:
+        return True
+    return None
+
+
+def disjunction(a, b):
+    if a is True or b is True:
+        return True
+    if a is False and b is False:
+        return False
+    return None
+
+
+def between(value, low, high):
+    return conjunction(greater_equal(value, low), less_equal(value, high))
+
+
+def as_list(value):
+    return value if isinstance(value, list) else [value]
+
+
+def index(items, position):
+    position = int(position)
+    if position == 0 or abs(position) > len(items):
+        return None
+    return items[position - 1 if position > 0 else position]
+
+
+TEMPORAL_PROPERTIES = {
+    'year', 'month', 'day', 'hour', 'minute', 'second', 'days', 'seconds',
+}
+
+
+def path(value, name):
+    if isinstance(value, dict):
+        return value.get(name)
+    if isinstance(value, list):
+        return [path(v, name) for v in value]
+    if name in TEMPORAL_PROPERTIES and kind(value) in (DATE, TIME, DATE_AND_TIME, DURATION):
+        return getattr(value, name, None)
+    return None
+
+
+def lookup(scope, name):
+    try:
+        return scope[name]
+    except KeyError:
+        pass
+    head, dot, tail = name.partition('.')
+    if not dot or head not in scope:
+        return None
+    value = scope[head]
+    for part in tail.split('.'):
+        value = path(value, part)
+    return value
+
+
+def instance_of(value, type_name):
+    return kind(value) == type_name
+
+
+_DATE = r'(-?\d{4,9})-(\d\d)-(\d\d)'
+_TIME = r'(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?(Z|[+-]\d\d:\d\d)?'
+DATE_RE = re.compile(_DATE + '$')
+TIME_RE = re.compile(_TIME + '$')
+DATE_AND_TIME_RE = re.compile(_DATE + 'T' + _TIME + '$')
+DURATION_RE = re.compile(r'(-)?P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$')
+
+
+def _timezone(text):
+    if not text:
+        return None
+    if text == 'Z':
+        return datetime.timezone.utc
+    offset = datetime.timedelta(hours=int(text[1:3]), minutes=int(text[4:6]))
+    return datetime.timezone(-offset if text[0] == '-' else offset)
+
+
+def _time(hour, minute, second, fraction, zone):
+    return datetime.time(int(hour), int(minute), int(second), int((fraction or '0').ljust(6, '0')),
+                         _timezone(zone))
+
+
+def parse_date(text):
+    match = DATE_RE.match(text)
+    try:
+        return datetime.date(*map(int, match.groups())) if match else None
+    except ValueError:
+        return None
+
+
+def parse_time(text):
+    match = TIME_RE.match(text)
+    try:
+        return _time(*match.groups()) if match else None
+    except ValueError:
+        return None
+
+
+def parse_date_and_time(text):
+    match = DATE_AND_TIME_RE.match(text)
+    if not match:
+        date = parse_date(text)
+        return datetime.datetime(date.year, date.month, date.day) if date else None
+    groups = match.groups()
+    try:
+        return datetime.datetime.combine(datetime.date(*map(int, groups[:3])), _time(*groups[3:]))
+    except ValueError:
+        return None
+
+
+def parse_duration(text):
+    """Days and time durations only; years and months durations evaluate to null."""
+    match = DURATION_RE.match(text)
+    if not match or text.endswith(('P', 'T')):
+        return None
+    sign, days, hours, minutes, seconds = match.groups()
+    duration = datetime.timedelta(days=int(days or 0), hours=int(hours or 0), minutes=int(minutes or 0),
+                                  seconds=float(seconds or 0))
+    return -duration if sign else duration
@@ -0,0 +1,184 @@
+import operator
+from decimal import Decimal
+
+from feel.evaluator import Operations as op
+from feel.evaluator.Compiler import compiler as default_compiler, is_constant
+from feel.evaluator.Evaluator import EvaluationError
+from feel.parser import AST
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DTYPE_KINDS = {
+    'i': (op.NUMBER,),
+    'u': (op.NUMBER,),
+    'f': (op.NUMBER,),
+    'b': (op.BOOLEAN,),
+    'U': (op.STRING,),
+    'm': (op.DURATION,),
+}
+
+# datetime64 units whose elements are dates; the elements of finer units are dates and times
+DATE_UNITS = {'Y', 'M', 'W', 'D'}
+
+# booleans are not ordered in FEEL, so boolean arrays are only compared for equality
+UNORDERED_DTYPES = {'b'}
+
+COMPARISONS = {
+    AST.LtEp: (operator.lt, op.less),
+    AST.LteEp: (operator.le, op.less_equal),
+    AST.GtEp: (operator.gt, op.greater),
+    AST.GteEp: (operator.ge, op.greater_equal),
+}
+
+INTERVAL_STARTS = {
+    AST.OpenIntervalStart: COMPARISONS[AST.GtEp],
+    AST.ClosedIntervalStart: COMPARISONS[AST.GteEp],
+}
+
+INTERVAL_ENDS = {
+    AST.OpenIntervalEnd: COMPARISONS[AST.LtEp],
+    AST.ClosedIntervalEnd: COMPARISONS[AST.LteEp],
+}
+
+EQUALITY = (operator.eq, op.equal)
+
+
+def scalar(value, dtype_kind):
+    if dtype_kind == 'M':
+        return numpy.datetime64(value)
+    if dtype_kind == 'm':
+        return numpy.timedelta64(value)
+    if value.__class__ is Decimal:
+        return float(value)
+    return value
+
+
+def endpoint_kinds(values):
+    """The kinds of the values the elements of an array can be compared with."""
+    if values.dtype.kind == 'M':
+        return (op.DATE,) if numpy.datetime_data(values.dtype)[0] in DATE_UNITS else (op.DATE_AND_TIME,)
+    return DTYPE_KINDS.get(values.dtype.kind, ())
+
+
+def exact(value):
+    # a Decimal is compared as a float only if it is that float, as FEEL compares numbers exactly
+    return value.__class__ is not Decimal or float(value) == value
+
+
+def each(feel_operator, values, value):
+    return numpy.fromiter((feel_operator(v, value) is True for v in values), bool, len(values))
+
+
+def compare(comparison, values, value):
+    """One comparison of every element with a scalar, as a boolean mask."""
+    array_operator, feel_operator = comparison
+    dtype_kind = values.dtype.kind
+    if dtype_kind == 'O' or (dtype_kind in UNORDERED_DTYPES and comparison is not EQUALITY):
+        return each(feel_operator, values, value)
+    if op.kind(value) not in endpoint_kinds(values):
+        return numpy.zeros(len(values), bool)
+    if not exact(value):
+        # NaN stands for null, and comparing it with a Decimal raises
+        return each(feel_operator, [None if v != v else v for v in values.tolist()], value)
+    return array_operator(values, scalar(value, dtype_kind))
+
+
+def is_null(values):
+    dtype_kind = values.dtype.kind
+    if dtype_kind == 'f':
+        return numpy.isnan(values)
+    if dtype_kind in 'Mm':
+        return numpy.isnat(values)
+    if dtype_kind == 'O':
+        return numpy.fromiter((v is None for v in values), bool, len(values))
+    return numpy.zeros(len(values), bool)
+
+
+# noinspection PyPep8Naming
+class Vectorizer(object):
+    """Evaluates unary tests against whole columns of values at once.
+
+    With NumPy, a test becomes a few array operations returning a boolean mask; endpoints are evaluated
+    once per call, not once per value. Columns of Python objects, and all columns without NumPy, fall
+    back to the compiled test of every value. Missing values are ``None`` or NaN/NaT.
+    """
+
+    def __init__(self, compiler=default_compiler):
+        self.compiler = compiler
+        self.vectorizers = {
+            AST.PositiveUnaryTests: self.vectorize_PositiveUnaryTests,
+            AST.Not: self.vectorize_Not,
+            AST.NoTest: lambda node: lambda values, scope: numpy.ones(len(values), bool),
+            AST.Null: lambda node: lambda values, scope: is_null(values),
+            AST.Endpoint: self.vectorize_Endpoint,
+            AST.Interval: self.vectorize_Interval,
+        }
+        for cls in COMPARISONS:
+            self.vectorizers[cls] = self.vectorize_comparison
+
+    def compile(self, node):
+        return self.compiler.cached(node, self.build)
+
+    def build(self, node):
+        if numpy is None:
+            test = self.compiler.compile_test(node)
+            return lambda values, context=None: [test(value, context) for value in values]
+        mask = self.vectorize(node)
+
+        def run(values, context=None):
+            return mask(numpy.asarray(values), {} if context is None else context)
+
+        return run
+
+    def mask(self, node, values, context=None):
+        return self.compile(node)(values, context)
+
+    def vectorize(self, node):
+        try:
+            vectorizer = self.vectorizers[node.__class__]
+        except KeyError:
+            raise EvaluationError('%s is not a unary test' % node.__class__.__name__)
+        return vectorizer(node)
+
+    def scalar(self, node):
+        compiled = self.compiler.expression(node)
+        if is_constant(compiled):
+            value = compiled.value
+            return lambda scope: value
+        return compiled
+
+    def vectorize_PositiveUnaryTests(self, node):
+        masks = [self.vectorize(test) for test in node.value]
+        if len(masks) == 1:
+            return masks[0]
+
+        def any_of(values, scope):
+            result = masks[0](values, scope)
+            for mask in masks[1:]:
+                result = result | mask(values, scope)
+            return result
+
+        return any_of
+
+    def vectorize_Not(self, node):
+        mask = self.vectorize(node.value)
+        return lambda values, scope: ~mask(values, scope)
+
+    def vectorize_Endpoint(self, node):
+        endpoint = self.scalar(node)
+        return lambda values, scope: compare(EQUALITY, values, endpoint(scope))
+
+    def vectorize_comparison(self, node):
+        comparison, endpoint = COMPARISONS[node.__class__], self.scalar(node.value)
+        return lambda values, scope: compare(comparison, values, endpoint(scope))
+
+    def vectorize_Interval(self, node):
+        above, below = INTERVAL_STARTS[node.start.__class__], INTERVAL_ENDS[node.end.__class__]
+        low, high = self.scalar(node.value), self.scalar(node.endValue)
+        return lambda values, scope: compare(above, values, low(scope)) & compare(below, values, high(scope))
+
+
+vectorizer = Vectorizer()
@@ -0,0 +1,49 @@
+import copy
+
+from feel.Diagnostics import Diagnostics
+from feel.ErrorPrinters import unexpected_character
+from feel.Limits import UNLIMITED
+from feel.Numbers import HYBRID
+from feel.lexer.Scanner import Scanner
+from feel.lexer.Tables import build_lexer
+
+
+# noinspection PyMethodMayBeStatic
+class CommonLexer(object):
+    """What every FEEL lexer does with its token rules: builds the scanner, or the PLY lexer, and runs it.
+
+    Subclasses hold the rules, ``tokens``, ``literals`` and the ``lextab`` of the PLY backend.
+    """
+
+    def t_error(self, t):
+        self.diagnostics.report(unexpected_character(t))
+        t.lexer.skip(1)
+
+    def __init__(self, logger=None, backend='scanner', limits=UNLIMITED, numbers=HYBRID, **kwargs):
+        self.logger = logger
+        self.diagnostics = Diagnostics(logger)
+        self.numbers = numbers
+        if backend == 'scanner':
+            self.lexer = Scanner(self, limits)
+        elif limits is not UNLIMITED:
+            raise ValueError('limits need the scanner backend')
+        else:
+            self.lexer = build_lexer(self, self.lextab, **kwargs)
+
+    def clone(self):
+        other = copy.copy(self)
+        other.diagnostics = Diagnostics(self.logger)
+        other.lexer = self.lexer.clone(other)
+        other.lexer.begin('INITIAL')
+        return other
+
+    def input(self, data):
+        self.diagnostics = Diagnostics(self.logger)
+        self.lexer.lineno = 1
+        self.lexer.input(data)
+
+    def token(self):
+        return self.lexer.token()
+
+    def stream(self, data):
+        return self.lexer.stream(data)
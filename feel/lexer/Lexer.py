@@ -29,4 +29,6 @@ class Lexer(BaseLexer):
         'DOTS',
     ] + list(new_reserved.values())
 
+    lextab = 'feel.lexer.lextab'
+
     t_DOTS = r'\.\.'
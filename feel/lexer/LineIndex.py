@@ -0,0 +1,65 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class LineIndex(object):
+    """Line and column lookups in one input, by binary search over the offsets where its lines start.
+
+    The offsets are found on the first lookup, in one pass over the input, so inputs that are never
+    asked about cost nothing. ``first_line`` is the number of the line the input starts on.
+    """
+    __slots__ = ('data', 'first_line', '_starts')
+
+    def __init__(self, data, first_line=1):
+        self.data = data
+        self.first_line = first_line
+        self._starts = None
+
+    @property
+    def starts(self):
+        if self._starts is None:
+            starts = array('I', [0])
+            starts.extend(accumulate(len(line) + 1 for line in self.data.split('\n')[:-1]))
+            self._starts = starts
+        return self._starts
+
+    def line_of(self, position):
+        """The index of the line holding ``position``, counted from 0."""
+        return bisect_right(self.starts, position) - 1
+
+    def line(self, position):
+        return self.first_line + self.line_of(position)
+
+    def column(self, position):
+        return position - self.starts[self.line_of(position)]
+
+    def bounds(self, position):
+        """The offsets of the first and the last character of the line holding ``position``."""
+        starts = self.starts
+        i = self.line_of(position)
+        last = starts[i + 1] - 2 if i + 1 < len(starts) else len(self.data) - 1
+        return starts[i], last
+
+    def __eq__(self, other):
+        return isinstance(other, LineIndex) and self.first_line == other.first_line and self.data == other.data
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.data, self.first_line))
+
+    def __reduce__(self):
+        return LineIndex, (self.data, self.first_line)
+
+    def __repr__(self):
+        return 'LineIndex(<%d characters>, first_line=%d)' % (len(self.data), self.first_line)
+
+
+def line_index(lexer):
+    """The LineIndex of the input a lexer is working on, built once per input."""
+    index = getattr(lexer, 'line_index', None)
+    if index is None or index.data is not lexer.lexdata:
+        index = lexer.line_index = LineIndex(lexer.lexdata)
+    return index
@@ -0,0 +1,12 @@
+# encoding: utf8
+ADDITIONAL_NAME_SYMBOLS = r'[\./\-’\+\*]'
+NAME_START_CHAR = r'[\?A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070' \
+                  r'-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\U00010000-\U000EFFFF]'
+NAME_PART_CHAR = r'(' + NAME_START_CHAR + r'| \d | [\u00B7\u0300-\u036F\u203F-\u2040])'
+NAME_PART = NAME_PART_CHAR + r'+'
+NAME_START = NAME_START_CHAR + NAME_PART_CHAR + r'*'
+NAME = NAME_START + r'(\s?(' + NAME_PART + r'|' + ADDITIONAL_NAME_SYMBOLS + r'))*'
+
+# The language of NAME with a single character class and without nested quantifiers: a match never backtracks.
+NAME_CHAR = r'[' + NAME_START_CHAR[1:-1] + r'\d\u00B7\u0300-\u036F\u203F-\u2040' + ADDITIONAL_NAME_SYMBOLS[1:-1] + r']'
+LINEAR_NAME = NAME_START_CHAR + NAME_CHAR + r'*(\s' + NAME_CHAR + r'+)*'
@@ -0,0 +1,256 @@
+import re
+from array import array
+
+from ply.lex import LexError, LexToken
+
+from feel.Limits import UNLIMITED
+from feel.lexer.LineIndex import LineIndex
+from feel.lexer.Names import NAME, NAME_START_CHAR, LINEAR_NAME
+from feel.lexer.TokenStream import TokenStream, decoder
+
+FIRST_CHARS = {
+    't_NEWLINE': lambda c: c == '\n',
+    't_STRING_LITERAL': lambda c: c == '"',
+    't_NUMERIC_LITERAL': lambda c: c == '.' or c.isdecimal(),
+    't_NAME': re.compile(NAME_START_CHAR, re.VERBOSE).match,
+}
+# Rules that only convert the value of their token; a TokenStream calls them when the value is read.
+VALUE_RULES = ('t_STRING_LITERAL', 't_NUMERIC_LITERAL')
+
+
+def rules(module, reflags=re.VERBOSE):
+    """The token rules of a lexer module in the order PLY tries them: functions by line, then strings by length."""
+    functions = sorted((getattr(module, name) for name in dir(module)
+                        if name.startswith('t_') and name != 't_error' and callable(getattr(module, name))),
+                       key=lambda f: f.__code__.co_firstlineno)
+    strings = sorted(((name, getattr(module, name)) for name in dir(module)
+                      if name.startswith('t_') and name != 't_ignore' and isinstance(getattr(module, name), str)),
+                     key=lambda rule: len(rule[1]), reverse=True)
+    found = []
+    for f in functions:
+        pattern = LINEAR_NAME if f.__doc__ == NAME else f.__doc__
+        found.append((f.__name__, FIRST_CHARS[f.__name__], re.compile(pattern, reflags), f.__name__[2:]))
+    for name, pattern in strings:
+        text = re.sub(r'\\(.)', r'\1', pattern)
+        found.append((None, text.startswith, re.compile(pattern, reflags), name[2:]))
+    return found
+
+
+class Scanner(object):
+    """A drop-in replacement of the PLY lexer of a FEEL lexer module.
+
+    Tokens, positions, line numbers and error handling are the same as with the PLY master regex,
+    but the rules worth trying are picked by the first character from a table, instead of trying
+    every rule in turn, and NAME is matched by a pattern that does not backtrack. Rule functions
+    of the module (``t_NAME``, ``t_error``...) are called like PLY calls them.
+
+    Every rule is tried at most once per token and none backtracks, so lexing takes time linear in the
+    length of the input, errors included: an error token holds only its character, not the rest of the
+    input as with PLY, and every input gets a ``LineIndex`` (``line_index``) for locating its errors.
+    ``limits`` bound the length of an input, its tokens and its lexing errors (see ``feel.Limits``).
+    """
+
+    def __init__(self, module, limits=UNLIMITED):
+        self.rules = rules(module)
+        self.limits = limits
+        self.max_tokens = float('inf') if limits.tokens is None else limits.tokens
+        self.count = 0
+        self.errors = 0
+        self.ignore = module.t_ignore
+        self.literals = module.literals
+        self.names = list(module.tokens) + list(module.literals)
+        self.ids = dict((name, i) for i, name in enumerate(self.names))
+        self.module = None
+        self.bind(module)
+        self.lexdata = None
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.line_index = None
+        self.lexmatch = None
+
+    def bind(self, module):
+        self.module = module
+        self.errorf = module.t_error
+        functions = dict((name, getattr(module, name)) for name, _, _, _ in self.rules if name)
+        self.first = {}
+        self.candidates = [(regex, kind, functions.get(name)) for name, _, regex, kind in self.rules]
+        self.decoders = [None] * len(self.names)
+        self.eager = {}
+        for name, _, _, kind in self.rules:
+            if name in VALUE_RULES:
+                self.decoders[self.ids[kind]] = decoder(functions[name])
+            elif name:
+                self.eager[kind] = functions[name]
+        for code in range(128):
+            self.dispatch(chr(code))
+
+    def dispatch(self, c):
+        found = self.first[c] = tuple(candidate for candidate, (_, first, _, _) in zip(self.candidates, self.rules)
+                                      if first(c))
+        return found
+
+    def register(self, kind):
+        # Rules may return types missing from the token list, which PLY lets through as well.
+        self.ids[kind] = len(self.names)
+        self.names.append(kind)
+        self.decoders.append(None)
+        return self.ids[kind]
+
+    def clone(self, module=None):
+        other = object.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        other.names = list(self.names)
+        other.ids = dict(self.ids)
+        other.decoders = list(self.decoders)
+        if module is not None:
+            other.bind(module)
+        return other
+
+    def begin(self, state):
+        if state != 'INITIAL':
+            raise ValueError('Undefined state')
+
+    def input(self, data):
+        self.limits.check('length', len(data))
+        self.count = 0
+        self.errors = 0
+        self.lexdata = data
+        self.line_index = LineIndex(data, self.lineno)
+        self.lexpos = 0
+        self.lexlen = len(data)
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def counted(self, tok):
+        self.count += 1
+        if self.count > self.max_tokens:
+            self.limits.check('tokens', self.count)
+        return tok
+
+    def token(self):
+        data, position, end, ignore, first = self.lexdata, self.lexpos, self.lexlen, self.ignore, self.first
+        while position < end:
+            c = data[position]
+            if c in ignore:
+                position += 1
+                continue
+            candidates = first.get(c)
+            if candidates is None:
+                candidates = self.dispatch(c)
+            for regex, kind, function in candidates:
+                m = regex.match(data, position)
+                if not m:
+                    continue
+                tok = LexToken()
+                tok.value = m.group()
+                tok.lineno = self.lineno
+                tok.lexpos = position
+                tok.type = kind
+                position = m.end()
+                if function is None:
+                    self.lexpos = position
+                    return self.counted(tok)
+                tok.lexer = self
+                self.lexmatch = m
+                self.lexpos = position
+                tok = function(tok)
+                if not tok:
+                    position = self.lexpos
+                    break
+                return self.counted(tok)
+            else:
+                if c in self.literals:
+                    tok = LexToken()
+                    tok.value = tok.type = c
+                    tok.lineno = self.lineno
+                    tok.lexpos = position
+                    self.lexpos = position + 1
+                    return self.counted(tok)
+                self.errors += 1
+                self.limits.check('errors', self.errors)
+                tok = LexToken()
+                # PLY gives the rest of the input; copying it for every error would make lexing quadratic
+                tok.value = c
+                tok.lineno = self.lineno
+                tok.type = 'error'
+                tok.lexer = self
+                tok.lexpos = self.lexpos = position
+                tok = self.errorf(tok)
+                if position == self.lexpos:
+                    raise LexError("Scanning error. Illegal character '%s'" % c, data[position:])
+                position = self.lexpos
+                if tok:
+                    return self.counted(tok)
+        self.lexpos = position + 1
+        if data is None:
+            raise RuntimeError('No input string given with input()')
+        return None
+
+    def stream(self, data, position=0, until=None):
+        """Lexes a whole input into a TokenStream, without creating a token object per token.
+
+        Lexing starts at ``position``, which must be where a token starts, with ``lineno`` as its line.
+        It stops before the first token at a ``start`` for which ``until(start)`` is true, if given.
+        """
+        self.input(data)
+        kinds, starts, ends, lines, errors = array('B'), array('I'), array('I'), array('I'), []
+        ids, eager, first, ignore, literals = self.ids, self.eager, self.first, self.ignore, self.literals
+        tok = LexToken()
+        tok.lexer = self
+        end = len(data)
+        while position < end:
+            c = data[position]
+            if c in ignore:
+                position += 1
+                continue
+            if until is not None and until(position):
+                break
+            candidates = first.get(c)
+            if candidates is None:
+                candidates = self.dispatch(c)
+            for regex, kind, _ in candidates:
+                m = regex.match(data, position)
+                if m:
+                    break
+            else:
+                m = None
+            start, lineno = position, self.lineno
+            if m is not None:
+                position = m.end()
+                function = eager.get(kind)
+                if function is not None:
+                    tok.value, tok.type, tok.lineno, tok.lexpos = m.group(), kind, lineno, start
+                    self.lexpos = position
+                    if not function(tok):
+                        position = self.lexpos
+                        continue
+                    kind = tok.type
+            elif c in literals:
+                kind = c
+                position += 1
+            else:
+                errors.append(position)
+                position += 1
+                continue
+            kind_id = ids.get(kind)
+            if kind_id is None:
+                kind_id = self.register(kind)
+            kinds.append(kind_id)
+            starts.append(start)
+            ends.append(position)
+            lines.append(lineno)
+            if len(kinds) > self.max_tokens:
+                self.limits.check('tokens', len(kinds))
+        self.lexpos = position
+        return TokenStream(data, self.names, self.decoders, kinds, starts, ends, lines, errors)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
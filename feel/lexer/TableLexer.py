@@ -1,17 +1,9 @@
-import re
-
-from ply import lex
-
-from feel.ErrorPrinters import print_context, find_first_in_lane
-from feel.lexer.BaseLexer import NAME
-
-
-# noinspection PyPep8Naming,PyMethodMayBeStatic
-from utils.PrintLogger import PrintLogger
+from feel.lexer.CommonLexer import CommonLexer
+from feel.lexer.Names import NAME
 
 
 # noinspection PyMethodMayBeStatic
-class TableLexer(object):
+class TableLexer(CommonLexer):
     reserved = {
         'date': 'DATE',
         'time': 'TIME',
@@ -33,7 +25,9 @@ class TableLexer(object):
                  'DOTS',
              ] + list(reserved.values())
 
-    literals = '()-,'
+    literals = '()[]<>.-,'
+
+    lextab = 'feel.lexer.tablelextab'
 
     t_ignore = ' \t'
 
@@ -52,29 +46,12 @@ class TableLexer(object):
 
     def t_NUMERIC_LITERAL(self, t):
         r"""(\d+\s*(\.\s*\d+)?|\.\s*\d+)"""
-        t_value = re.sub('\s', '', str(t.value))
-        t.value = float(t_value)
+        t.value = self.numbers(t.value)
         return t
 
-    def t_error(self, t):
-        self.logger.log("Unexpected character: '%s'" % t.value[0],
-                        'at position %d:%d' % (t.lexer.lexpos - find_first_in_lane(t), t.lexer.lineno))
-        print_context(t, self.logger)
-        t.lexer.skip(1)
-
     def t_NAME(self, t):
         t.type = TableLexer.reserved.get(t.value, 'NAME')
 
         return t
 
     t_NAME.__doc__ = NAME
-
-    def __init__(self, logger=PrintLogger(), **kwargs):
-        self.logger = logger
-        self.lexer = lex.lex(module=self, **kwargs)
-
-    def input(self, data):
-        self.lexer.input(data)
-
-    def token(self):
-        return self.lexer.token()
@@ -0,0 +1,42 @@
+import hashlib
+import importlib
+import os
+import re
+
+from ply import lex
+
+
+def lexer_signature(module, reflags=int(re.VERBOSE)):
+    ldict = dict((k, getattr(module, k)) for k in dir(module))
+    ldict.setdefault('__file__', '')
+    info = lex.LexerReflect(ldict, reflags=reflags)
+    info.get_all()
+    spec = [lex.__tabversion__, reflags, sorted(info.tokens), info.literals, sorted(info.ignore.items())]
+    for state in sorted(info.stateinfo):
+        spec.append([(name, f.__doc__) for name, f in info.funcsym[state]])
+        spec.append(info.strsym[state])
+    return hashlib.sha1(repr(spec).encode('utf8')).hexdigest()
+
+
+def write_lextab(lexer, lextab, signature):
+    package, _, _ = lextab.rpartition('.')
+    outputdir = os.path.dirname(importlib.import_module(package).__file__)
+    try:
+        lexer.writetab(lextab, outputdir)
+        with open(os.path.join(outputdir, lextab.split('.')[-1] + '.py'), 'a') as tf:
+            tf.write('_signature    = %r\n' % signature)
+    except (IOError, OSError):
+        pass
+
+
+def build_lexer(module, lextab, **kwargs):
+    signature = lexer_signature(module, kwargs.get('reflags', int(re.VERBOSE)))
+    try:
+        fresh = getattr(importlib.import_module(lextab), '_signature', None) == signature
+    except ImportError:
+        fresh = False
+    if fresh:
+        return lex.lex(module=module, optimize=True, lextab=lextab, **kwargs)
+    lexer = lex.lex(module=module, **kwargs)
+    write_lextab(lexer, lextab, signature)
+    return lexer
@@ -0,0 +1,54 @@
+from ply.lex import LexToken
+
+
+def decoder(function):
+    """Decodes raw token text the way a value-only rule function (``t_NUMERIC_LITERAL``...) would."""
+    tok = LexToken()
+
+    def decode(raw):
+        tok.value = raw
+        return function(tok).value
+
+    return decode
+
+
+class TokenStream(object):
+    """The tokens of one input as spans over it, in parallel arrays.
+
+    Token ``i`` has the type ``names[kinds[i]]``, covers ``data[starts[i]:ends[i]]`` and starts on line
+    ``lines[i]``. Values are decoded only when asked for. Positions of unexpected characters are listed
+    in ``errors``; they were skipped, one character each, and not reported.
+    """
+
+    def __init__(self, data, names, decoders, kinds, starts, ends, lines, errors):
+        self.data = data
+        self.names = names
+        self.decoders = decoders
+        self.kinds = kinds
+        self.starts = starts
+        self.ends = ends
+        self.lines = lines
+        self.errors = errors
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def type(self, i):
+        return self.names[self.kinds[i]]
+
+    def text(self, i):
+        return self.data[self.starts[i]:self.ends[i]]
+
+    def value(self, i):
+        decode = self.decoders[self.kinds[i]]
+        raw = self.data[self.starts[i]:self.ends[i]]
+        return raw if decode is None else decode(raw)
+
+    def tokens(self):
+        """Materializes the stream as ``LexToken``s."""
+        found = []
+        for i in range(len(self)):
+            tok = LexToken()
+            tok.type, tok.value, tok.lineno, tok.lexpos = self.type(i), self.value(i), self.lines[i], self.starts[i]
+            found.append(tok)
+        return found
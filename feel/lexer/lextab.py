@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'BETWEEN', 'DATE', 'DATE_AND_TIME', 'DOTS', 'DURATION', 'ELSE', 'EVERY', 'EXPONENT', 'EXTERNAL', 'FALSE', 'FOR', 'FUNCTION', 'GTE', 'IF', 'IN', 'INSTANCE', 'LTE', 'NAME', 'NEQ', 'NEWLINE', 'NULL', 'NUMERIC_LITERAL', 'OF', 'OR', 'RETURN', 'SATISFIES', 'SOME', 'STRING_LITERAL', 'THEN', 'TIME', 'TRUE'))
+_lexreflags   = 64
+_lexliterals  = '()[]{}:.,=+-*/<>'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NEWLINE>\\n+)|(?P<t_STRING_LITERAL>"[^"]*\\")|(?P<t_NUMERIC_LITERAL>(\\d+\\s*(\\.\\s*\\d+)?|\\.\\s*\\d+))|(?P<t_NAME>[\\?A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\U00010000-\\U000EFFFF]([\\?A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\U00010000-\\U000EFFFF]| \\d | [\\u00B7\\u0300-\\u036F\\u203F-\\u2040])*(\\s?(([\\?A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\U00010000-\\U000EFFFF]| \\d | [\\u00B7\\u0300-\\u036F\\u203F-\\u2040])+|[\\./\\-’\\+\\*]))*)|(?P<t_DOTS>\\.\\.)|(?P<t_EXPONENT>\\*\\*)|(?P<t_GTE>>=)|(?P<t_LTE><=)|(?P<t_NEQ>!=)', [None, ('t_NEWLINE', 'NEWLINE'), ('t_STRING_LITERAL', 'STRING_LITERAL'), ('t_NUMERIC_LITERAL', 'NUMERIC_LITERAL'), None, None, ('t_NAME', 'NAME'), None, None, None, None, (None, 'DOTS'), (None, 'EXPONENT'), (None, 'GTE'), (None, 'LTE'), (None, 'NEQ')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_signature    = '8c591fc3ff554a863dbfaf4aba5a8e6a0c382641'
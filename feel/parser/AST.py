@@ -1,384 +1,681 @@
+from operator import attrgetter
+
+SPAN_BITS = 32
+SPAN_MASK = (1 << SPAN_BITS) - 1
+
+
 class AST(object):
+    """A node of a parsed tree.
+
+    Nodes compare and hash by structure: their class and the values of their fields. The hash of a node
+    is computed once, from the cached hashes of its children, and comparing two trees walks both with a
+    stack, skipping shared subtrees and stopping at the first pair of nodes whose hashes differ. Neither
+    recurses, so trees of any depth compare; a node must not be changed once it has been hashed.
+
+    ``child_fields`` names the fields that hold the children of a node, themselves or in lists and tuples;
+    the other fields hold plain values. Printing a node prints its children first, without recursion.
+    """
+    __slots__ = ('value', '_span', '_hash', '__weakref__')
+    child_fields = ('value',)
+
     def __init__(self, token):
         self.value = token
 
+    @property
+    def span(self):
+        """The start and end offsets of the node in the parsed text, or ``None`` if it was parsed without spans."""
+        try:
+            packed = self._span
+        except AttributeError:
+            return None
+        return packed >> SPAN_BITS, packed & SPAN_MASK
+
     def __eq__(self, o):
-        return self.__class__ == o.__class__ and self.value == o.value
+        pending = [(self, o)]
+        while pending:
+            a, b = pending.pop()
+            if a is b:
+                continue
+            if isinstance(a, AST):
+                if a.__class__ is not b.__class__ or hash(a) != hash(b):
+                    return False
+                shape = SHAPES[a.__class__]
+                pending.extend(zip(shape(a), shape(b)))
+            elif isinstance(a, (list, tuple)):
+                if a.__class__ is not b.__class__ or len(a) != len(b):
+                    return False
+                pending.extend(zip(a, b))
+            elif a != b:
+                return False
+        return True
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            return structural_hash(self)
+
+    def values(self):
+        """The values of the fields of the node, in the order of ``fields``."""
+        return SHAPES[self.__class__](self)[1:]
+
+    def __reduce_ex__(self, protocol):
+        # the whole tree as flat records, so pickling does not recurse into it; the cached hash is left
+        # out, since string hashes differ between processes
+        return unflattened, (flattened(self),)
+
+    def __copy__(self):
+        return rebuilt(self, [getattr(self, name) for name in self.child_fields])
+
+    def __deepcopy__(self, memo):
+        # copies from the leaves up, so trees of any depth copy; plain values are immutable and shared
+        for value, items in postorder(self, lambda value: id(value) in memo or isinstance(value, Stateless)):
+            items = [memo.get(id(item), item) for item in items]
+            memo[id(value)] = rebuilt(value, items) if isinstance(value, AST) else value.__class__(items)
+        return memo[id(self)]
+
+    def __init_subclass__(cls, **kwargs):
+        super(AST, cls).__init_subclass__(**kwargs)
+        FIELDS[cls] = fields(cls)
+        SHAPES[cls] = attrgetter('__class__', *FIELDS[cls])
+        CHILDREN[cls] = reversed_children(cls)
+
+    def format(self):
+        """The text of the node, with the text of its children already in place of them."""
+        return '%s{%s}' % (self.__class__.__name__, self.value)
 
     def __str__(self):
-        return '%s{%s}' % (self.__class__.__name__, self.value)
+        return text(self)
+
+    __repr__ = __str__
+
+
+def fields(cls):
+    """Names of the attributes of a node class, those of its base classes first."""
+    return tuple(name for c in reversed(cls.__mro__) for name in c.__dict__.get('__slots__', ())
+                 if name not in ('_span', '_hash', '__weakref__'))
+
+
+def reversed_children(cls):
+    """A getter of the child fields of a node, last first as a stack wants them, and how many they are."""
+    names = tuple(reversed(cls.child_fields))
+    return (attrgetter(*names) if names else None), len(names)
+
+
+FIELDS = {AST: fields(AST)}
+# the class and the fields of a node, in one tuple
+SHAPES = {AST: attrgetter('__class__', *FIELDS[AST])}
+CHILDREN = {AST: reversed_children(AST)}
+NESTED = (AST, list, tuple)
+
+
+def children(node):
+    """The child nodes of a node, in the order of its ``child_fields``, also those in lists and tuples."""
+    pending = [getattr(node, name) for name in reversed(node.child_fields)]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, AST):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            pending.extend(reversed(value))
+
+
+def walk(tree):
+    """Every node of a tree, parents before their children, without recursion."""
+    pending = [tree]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, AST):
+            yield value
+            getter, count = CHILDREN[value.__class__]
+            if count == 1:
+                pending.append(getter(value))
+            elif count:
+                pending.extend(getter(value))
+        elif isinstance(value, (list, tuple)):
+            pending.extend(reversed(value))
+
+
+def postorder(tree, skip):
+    """Every node, list and tuple of a tree, after those inside it, without recursion.
+
+    Yields ``(value, items)``: the values of the child fields of a node, or the items of a list or tuple.
+    Values for which ``skip`` is true are left out, with all they hold; a consumer that records what it
+    was given skips what it already has, and so gets the subtrees met twice once.
+    """
+    pending = [(tree, None)]
+    while pending:
+        value, items = pending.pop()
+        if items is None:
+            if skip(value):
+                continue
+            if isinstance(value, AST):
+                items = [getattr(value, name) for name in value.child_fields]
+            elif isinstance(value, (list, tuple)):
+                items = value
+            else:
+                continue
+            waiting = [item for item in items if isinstance(item, NESTED) and not skip(item)]
+            if waiting:
+                pending.append((value, items))
+                pending.extend((item, None) for item in waiting)
+                continue
+        yield value, items
+
+
+def rebuilt(node, values):
+    """A copy of a node with ``values`` in its child fields; it keeps the span of the node, not its hash."""
+    other = object.__new__(node.__class__)
+    for name in FIELDS[node.__class__]:
+        setattr(other, name, getattr(node, name))
+    for name, value in zip(node.child_fields, values):
+        setattr(other, name, value)
+    if hasattr(node, '_span'):
+        other._span = node._span
+    return other
+
+
+def structural_hash(tree):
+    """Hashes a node from its class and fields, the nodes under it first, without recursion.
+
+    Every node hashed keeps its hash in ``_hash``. Lists and tuples hash as their class and the hashes of
+    their items, and are hashed again wherever they are met.
+    """
+    hashes = {}
+    for value, items in postorder(tree, lambda value: id(value) in hashes or hasattr(value, '_hash')):
+        if isinstance(value, AST):
+            items = SHAPES[value.__class__](value)
+        else:
+            items = (value.__class__,) + tuple(items)
+        key = hash(tuple([hashes[id(item)] if isinstance(item, (list, tuple)) else hash(item) for item in items]))
+        if isinstance(value, AST):
+            value._hash = key
+        else:
+            hashes[id(value)] = key
+    return tree._hash
+
+
+def flattened(tree):
+    """A tree as a list of records, one per node, list and tuple, those inside first, built without recursion.
+
+    A record is ``(class, values, references, span)``: ``values`` are those of the fields of a node, or the
+    items of a list or tuple, and bit ``i`` of ``references`` is set if ``values[i]`` is the index of the
+    record of a value inside it. Subtrees met twice are recorded once.
+    """
+    index, records = {}, []
+    for value, items in postorder(tree, lambda value: id(value) in index):
+        values = list(SHAPES[value.__class__](value)[1:] if isinstance(value, AST) else items)
+        references = 0
+        for i, item in enumerate(values):
+            if isinstance(item, NESTED):
+                values[i] = index[id(item)]
+                references |= 1 << i
+        index[id(value)] = len(records)
+        records.append((value.__class__, tuple(values), references, getattr(value, '_span', None)))
+    return records
+
+
+def unflattened(records):
+    """The tree of ``flattened`` records."""
+    built = []
+    for cls, values, references, span in records:
+        if references:
+            values = [built[item] if references >> i & 1 else item for i, item in enumerate(values)]
+        if cls is list or cls is tuple:
+            value = cls(values)
+        elif issubclass(cls, Stateless):
+            value = cls()
+        else:
+            value = object.__new__(cls)
+            for name, item in zip(FIELDS[cls], values):
+                setattr(value, name, item)
+            if span is not None:
+                value._span = span
+        built.append(value)
+    return built[-1]
+
+
+class Text(object):
+    """The text of a printed node, standing for it in the copy of its parent that is formatted."""
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __str__(self):
+        return self.text
 
     __repr__ = __str__
 
 
+def text(tree):
+    """Prints a tree from its leaves up, formatting every node with the text of its children in their place."""
+    texts = {}
+    for value, items in postorder(tree, lambda value: id(value) in texts):
+        items = [texts.get(id(item), item) for item in items]
+        if isinstance(value, AST):
+            texts[id(value)] = Text(rebuilt(value, items).format())
+        else:
+            texts[id(value)] = value.__class__(items)
+    return texts[id(tree)].text
+
+
+def locate(node, start, end):
+    """Gives a node the offsets of the text it was parsed from, packed in one int.
+
+    Only the first, innermost span is kept: a node passed up unchanged, like an expression in parentheses,
+    keeps its own. Shared stateless nodes, and values that are not nodes, get none.
+    """
+    if isinstance(node, AST) and not hasattr(node, '_span') and not isinstance(node, Stateless):
+        node._span = start << SPAN_BITS | end
+
+
+class Stateless(AST):
+    """A node without state; every class has a single shared instance."""
+    __slots__ = ()
+    child_fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super(Stateless, cls).__init_subclass__(**kwargs)
+        cls.instance = object.__new__(cls)
+        cls.instance.value = None
+
+    def __new__(cls):
+        return cls.instance
+
+    def __init__(self):
+        pass
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, ()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
 class Date(AST):
-    pass
+    __slots__ = ()
+    child_fields = ()
 
 
 class Time(AST):
-    pass
+    __slots__ = ()
+    child_fields = ()
 
 
 class DateAndTime(AST):
-    pass
+    __slots__ = ()
+    child_fields = ()
 
 
 class Duration(AST):
-    pass
+    __slots__ = ()
+    child_fields = ()
 
 
 class Name(AST):
-    pass
+    __slots__ = ()
+    child_fields = ()
 
 
 class Context(AST):
-    pass
+    __slots__ = ()
 
 
 class Param(AST):
-    pass
+    __slots__ = ()
 
 
 class FunctionDefinition(AST):
+    __slots__ = ('params', 'external')
+    child_fields = ('value', 'params')
+
     def __init__(self, params, external, body):
         super(FunctionDefinition, self).__init__(body)
         self.params = params
         self.external = external
 
-    def __str__(self):
+    def format(self):
         return "function(%s)%s %s" % (self.params,
                                       'external' if self.external else '',
-                                      super(FunctionDefinition, self).__str__())
-
-    __repr__ = __str__
-
-    def __eq__(self, o):
-        return super(AST, self).__eq__(o) and self.external == o.external and self.params == o.params
+                                      super(FunctionDefinition, self).format())
 
 
 class List(AST):
-    pass
+    __slots__ = ()
 
 
 class Type(AST):
-    pass
+    __slots__ = ()
 
 
 class InstanceOf(AST):
+    __slots__ = ('type',)
+    child_fields = ('value', 'type')
+
     def __init__(self, expression, instance_type):
         super(InstanceOf, self).__init__(expression)
         self.type = instance_type
 
-    def __str__(self):
+    def format(self):
         return "%s instance of %s" % (self.value, self.type)
 
-    __repr__ = __str__
-
-    def __eq__(self, o):
-        return super(InstanceOf, self).__eq__(o) and self.type == o.type
-
 
 class QualifiedName(AST):
-    pass
+    __slots__ = ()
 
 
 class FilterExpression(AST):
+    __slots__ = ('filter',)
+    child_fields = ('value', 'filter')
+
     def __init__(self, token, filter_value):
         super(FilterExpression, self).__init__(token)
         self.filter = filter_value
 
-    def __eq__(self, o):
-        return super(FilterExpression, self).__eq__(o) and self.filter == o.filter
-
-    def __str__(self):
+    def format(self):
         return '%s[%s]' % (self.value, self.filter)
 
-    __repr__ = __str__
-
 
 class BinOp(AST):
+    __slots__ = ('op', 'rhs')
+    child_fields = ('value', 'rhs')
+
     def __init__(self, lhs, op, rhs):
         super(BinOp, self).__init__(lhs)
         self.op = op
         self.rhs = rhs
 
-    def __eq__(self, o):
-        return super(BinOp, self).__eq__(o) and self.op == o.op and self.rhs == o.rhs
-
-    def __str__(self):
+    def format(self):
         return '(%s %s %s)' % (self.value, self.op, self.rhs)
 
-    __repr__ = __str__
-
 
 class Eq(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Eq, self).__init__(lhs, '=', rhs)
 
 
 class Neq(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Neq, self).__init__(lhs, '!=', rhs)
 
 
 class Lt(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Lt, self).__init__(lhs, '<', rhs)
 
 
 class Lte(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Lte, self).__init__(lhs, '<=', rhs)
 
 
 class Gt(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Gt, self).__init__(lhs, '<=', rhs)
 
 
 class Gte(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Gte, self).__init__(lhs, '<=', rhs)
 
 
 class Between(AST):
+    __slots__ = ('b_start', 'b_end')
+    child_fields = ('value', 'b_start', 'b_end')
+
     def __init__(self, token, b_start, b_end):
         super(Between, self).__init__(token)
         self.b_start = b_start
         self.b_end = b_end
 
-    def __eq__(self, o):
-        return super(Between, self).__eq__(o) and self.b_start == o.b_start and self.b_end == o.b_end
+    def format(self):
+        return '{%s, %s, %s}' % (super(Between, self).format(), self.b_start, self.b_end)
 
-    def __str__(self):
-        return '{%s, %s, %s}' % (super(Between, self).__str__(), self.b_start, self.b_end)
 
-
-class Null(AST):
-    def __init__(self):
-        super(Null, self).__init__(None)
+class Null(Stateless):
+    __slots__ = ()
 
 
 class PositiveUnaryTests(AST):
-    pass
+    __slots__ = ()
 
 
 class In(AST):
+    __slots__ = ('tests',)
+    child_fields = ('value', 'tests')
+
     def __init__(self, token, tests):
         super(In, self).__init__(token)
         self.tests = tests
 
-    def __eq__(self, o):
-        return super(In, self).__eq__(o) and self.tests == o.tests
-
-    def __str__(self):
+    def format(self):
         return '%s in %s' % (self.value, self.tests)
 
-    __repr__ = __str__
-
 
 class Conjunction(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Conjunction, self).__init__(lhs, 'and', rhs)
 
 
 class Disjunction(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Disjunction, self).__init__(lhs, 'or', rhs)
 
 
 class QuantifiedExpr(AST):
+    __slots__ = ('generators', 'test')
+    child_fields = ('generators', 'test')
+
     def __init__(self, some, generators, test):
         super(QuantifiedExpr, self).__init__(some)
         self.generators = generators
         self.test = test
 
-    def __eq__(self, o):
-        return super(QuantifiedExpr, self).__eq__(o) and self.generators == o.generators and self.test == o.test
-
-    def __str__(self):
+    def format(self):
         return '%s %s satisfies %s' % ('some' if self.value else 'every',
                                        ' '.join('%s in %s' % p for p in self.generators),
                                        self.test)
 
-    __repr__ = __str__
-
 
 class If(AST):
+    __slots__ = ('then', 'else_')
+    child_fields = ('value', 'then', 'else_')
+
     def __init__(self, condition, then, else_):
         super(If, self).__init__(condition)
         self.then = then
         self.else_ = else_
 
-    def __eq__(self, o):
-        return super(If, self).__eq__(o) and self.then == o.then and self.else_ == o.else_
-
-    def __str__(self):
+    def format(self):
         return 'if %s\n then %s\n else %s' % (self.value, self.then, self.else_)
 
-    __repr__ = __str__
-
 
 class For(AST):
+    __slots__ = ('result',)
+    child_fields = ('value', 'result')
+
     def __init__(self, generators, result):
         super(For, self).__init__(generators)
         self.result = result
 
-    def __eq__(self, o):
-        return super(For, self).__eq__(o) and self.result == o.result
-
-    def __str__(self):
+    def format(self):
         return 'for %s\n return %s' % (' '.join('%s in %s' % p for p in self.value),
                                        self.result)
 
-    __repr__ = __str__
-
 
 class Path(AST):
+    __slots__ = ('name',)
+    child_fields = ('value', 'name')
+
     def __init__(self, expr, name):
         super(Path, self).__init__(expr)
         self.name = name
 
-    def __eq__(self, o):
-        return super(Path, self).__eq__(o) and self.name == o.name
-
-    def __str__(self):
+    def format(self):
         return '%s.%s' % (self.value, self.name)
 
-    __repr__ = __str__
-
 
 class Invocation(AST):
+    __slots__ = ('parameters',)
+    child_fields = ('value', 'parameters')
+
     def __init__(self, foo, parameters):
         super(Invocation, self).__init__(foo)
         self.parameters = parameters
 
-    def __eq__(self, o):
-        return super(Invocation, self).__eq__(o) and self.parameters == o.parameters
-
-    def __str__(self):
+    def format(self):
         return '%s(%s)' % (self.value, ', '.join(str(p) for p in self.parameters))
 
-    __repr__ = __str__
-
 
 class Number(AST):
-    pass
+    __slots__ = ()
+    child_fields = ()
 
 
 class Boolean(AST):
-    pass
+    __slots__ = ()
+    child_fields = ()
 
 
 class StringLiteral(AST):
-    pass
+    __slots__ = ()
+    child_fields = ()
 
 
 class Negation(AST):
-    pass
+    __slots__ = ()
 
 
 class Exp(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Exp, self).__init__(lhs, '**', rhs)
 
 
 class Div(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Div, self).__init__(lhs, '/', rhs)
 
 
 class Mul(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Mul, self).__init__(lhs, '*', rhs)
 
 
 class Dif(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Dif, self).__init__(lhs, '-', rhs)
 
 
 class Sum(BinOp):
+    __slots__ = ()
+
     def __init__(self, lhs, rhs):
         super(Sum, self).__init__(lhs, '+', rhs)
 
 
 class Not(AST):
-    pass
+    __slots__ = ()
 
 
-class NoTest(AST):
-    def __init__(self):
-        super(NoTest, self).__init__(None)
+class NoTest(Stateless):
+    __slots__ = ()
 
 
-class IntervalBorders(AST):
-    def __init__(self, representation):
-        super(IntervalBorders, self).__init__(None)
-        self.representation = representation
+class IntervalBorders(Stateless):
+    __slots__ = ()
+    representation = None
 
-    def __str__(self):
+    def format(self):
         return self.representation
 
-    __repr__ = __str__
-
 
 class OpenIntervalStart(IntervalBorders):
-    def __init__(self):
-        super(OpenIntervalStart, self).__init__('(')
+    __slots__ = ()
+    representation = '('
 
 
 class ClosedIntervalStart(IntervalBorders):
-    def __init__(self):
-        super(ClosedIntervalStart, self).__init__('[')
+    __slots__ = ()
+    representation = '['
 
 
 class ClosedIntervalEnd(IntervalBorders):
-    def __init__(self):
-        super(ClosedIntervalEnd, self).__init__(']')
+    __slots__ = ()
+    representation = ']'
 
 
 class OpenIntervalEnd(IntervalBorders):
-    def __init__(self):
-        super(OpenIntervalEnd, self).__init__(')')
+    __slots__ = ()
+    representation = ')'
 
 
 class Endpoint(AST):
-    pass
+    __slots__ = ()
 
 
 class Interval(AST):
+    __slots__ = ('start', 'endValue', 'end')
+    child_fields = ('value', 'start', 'endValue', 'end')
+
     def __init__(self, start, start_value, end_value, end):
         super(Interval, self).__init__(start_value)
         self.start = start
         self.endValue = end_value
         self.end = end
 
-    def __eq__(self, o):
-        rest = self.start == o.start and self.endValue == o.endValue and self.end == o.end
-        return super(Interval, self).__eq__(o) and rest
-
-    def __str__(self):
+    def format(self):
         return '%s%s..%s%s' % (self.start, self.value, self.endValue, self.end)
 
-    __repr__ = __str__
-
 
 class LtEp(AST):
-    pass
+    __slots__ = ()
 
 
 class LteEp(AST):
-    pass
+    __slots__ = ()
 
 
 class GtEp(AST):
-    pass
+    __slots__ = ()
 
 
 class GteEp(AST):
-    pass
+    __slots__ = ()
 
 
 class SimpleExpressions(AST):
-    pass
+    __slots__ = ()
+
+
+class Error(AST):
+    """The source text of a part of an input that did not parse, put in its place by error recovery."""
+    __slots__ = ()
+    child_fields = ()
@@ -0,0 +1,190 @@
+import array
+import marshal
+import mmap
+import struct
+from decimal import Decimal
+
+from feel.parser import AST
+
+MAGIC = b'FEELFLAT'
+VERSION = 2
+HEADER = struct.Struct('=8sI4Q')
+CLASSES = [cls for cls in vars(AST).values() if isinstance(cls, type) and issubclass(cls, AST.AST)] + [list, tuple]
+
+
+def node_fields(cls):
+    if cls in (list, tuple):
+        return ()
+    return AST.fields(cls)
+
+
+def padded(size):
+    return size + -size % 8
+
+
+class FlatTrees(object):
+    """A sequence of trees stored in flat arrays instead of AST objects.
+
+    Nodes are numbered from 0. ``kinds[n]`` is the index of the class of node ``n``, and its fields, in
+    ``node_fields`` order, are ``slots[offsets[n]:offsets[n + 1]]``. Lists and tuples of nodes are nodes
+    too. A reference to a node is its number; a negative reference ``r`` is ``literals[-r - 1]``. The nodes
+    of tree ``t`` are numbered from ``starts[t]`` to ``starts[t + 1]`` and its root is ``roots[t]``, a
+    reference as well, so a failed parse is stored as the literal ``None``. Stateless nodes are stored once.
+
+    ``to_bytes`` lays the arrays out one after another; ``from_buffer`` reads them back without copying
+    from any buffer: an ``mmap`` (see ``load``), ``multiprocessing.shared_memory`` or ``numpy.frombuffer``
+    views. Only the class names and the deduplicated literals are decoded; Decimal literals are stored as
+    their text.
+    """
+
+    def __init__(self, classes, kinds, offsets, slots, roots, starts, literals):
+        self.classes = classes
+        self.fields = [node_fields(cls) for cls in classes]
+        self.kinds = kinds
+        self.offsets = offsets
+        self.slots = slots
+        self.roots = roots
+        self.starts = starts
+        self.literals = literals
+
+    @classmethod
+    def from_trees(cls, trees):
+        kinds, offsets, slots = array.array('B'), array.array('I', [0]), array.array('i')
+        roots, starts = array.array('i'), array.array('I', [0])
+        literals, pool, shared = [], {}, {}
+        kind_of = dict((c, k) for k, c in enumerate(CLASSES))
+
+        def reference(value, position):
+            if isinstance(value, (AST.AST, list, tuple)):
+                if isinstance(value, AST.Stateless) and value.__class__ in shared:
+                    return shared[value.__class__]
+                stack.append((position, value))
+                return 0
+            key = (value.__class__, value)
+            if key not in pool:
+                pool[key] = -len(literals) - 1
+                literals.append(value)
+            return pool[key]
+
+        for tree in trees:
+            roots.append(0)
+            stack = []
+            roots[-1] = reference(tree, None)
+            while stack:
+                position, value = stack.pop()
+                node = len(kinds)
+                if position is None:
+                    roots[-1] = node
+                else:
+                    slots[position] = node
+                if isinstance(value, AST.Stateless):
+                    shared[value.__class__] = node
+                if value.__class__ in (list, tuple):
+                    values = value
+                else:
+                    values = [getattr(value, name) for name in node_fields(value.__class__)]
+                start = len(slots)
+                kinds.append(kind_of[value.__class__])
+                offsets.append(start + len(values))
+                slots.extend([0] * len(values))
+                for i in reversed(range(len(values))):
+                    slots[start + i] = reference(values[i], start + i)
+            starts.append(len(kinds))
+        return cls(CLASSES, kinds, offsets, slots, roots, starts, literals)
+
+    def __len__(self):
+        return len(self.roots)
+
+    def __getitem__(self, tree):
+        return self.tree(tree)
+
+    def tree(self, tree):
+        """Builds the AST objects of a tree."""
+        first, end = self.starts[tree], self.starts[tree + 1]
+        built = [None] * (end - first)
+        classes, kinds, offsets, slots, literals = self.classes, self.kinds, self.offsets, self.slots, self.literals
+
+        def value(ref):
+            if ref < 0:
+                return literals[-ref - 1]
+            if first <= ref:
+                return built[ref - first]
+            return classes[kinds[ref]]()
+
+        for node in range(end - 1, first - 1, -1):
+            cls = classes[kinds[node]]
+            values = [value(ref) for ref in slots[offsets[node]:offsets[node + 1]]]
+            if cls is list or cls is tuple:
+                built[node - first] = cls(values)
+            elif issubclass(cls, AST.Stateless):
+                built[node - first] = cls()
+            else:
+                obj = built[node - first] = cls.__new__(cls)
+                for name, field in zip(self.fields[kinds[node]], values):
+                    setattr(obj, name, field)
+        return value(self.roots[tree])
+
+    def trees(self):
+        return [self.tree(t) for t in range(len(self))]
+
+    def kind(self, node):
+        return self.classes[self.kinds[node]]
+
+    def field(self, node, name):
+        """The value of a field: a literal, or the number of a node."""
+        ref = self.slots[self.offsets[node] + self.fields[self.kinds[node]].index(name)]
+        return self.literals[-ref - 1] if ref < 0 else ref
+
+    def children(self, node):
+        return [ref for ref in self.slots[self.offsets[node]:self.offsets[node + 1]] if ref >= 0]
+
+    def walk(self, tree):
+        """Yields the numbers of the nodes of a tree in preorder, without building them."""
+        stack = [self.roots[tree]]
+        slots, offsets = self.slots, self.offsets
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+            yield node
+            stack.extend(reversed(slots[offsets[node]:offsets[node + 1]].tolist()))
+
+    def to_bytes(self):
+        decimals = [i for i, value in enumerate(self.literals) if value.__class__ is Decimal]
+        literals = list(self.literals)
+        for i in decimals:
+            literals[i] = str(literals[i])
+        meta = marshal.dumps(([cls.__name__ for cls in self.classes], literals, decimals))
+        sections = [self.kinds, self.offsets, self.slots, self.roots, self.starts]
+        data = bytearray(HEADER.pack(MAGIC, VERSION, len(self.kinds), len(self.slots), len(self.roots), len(meta)))
+        for section in sections:
+            data += section.tobytes()
+            data += bytes(-len(data) % 8)
+        return bytes(data + meta)
+
+    def save(self, path):
+        with open(path, 'wb') as flat_file:
+            flat_file.write(self.to_bytes())
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        view = memoryview(buffer).cast('B')
+        magic, version, nodes, slots, trees, meta = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('not a flat tree buffer of version %d' % VERSION)
+        sections = []
+        position = HEADER.size
+        for code, count in (('B', nodes), ('I', nodes + 1), ('i', slots), ('i', trees), ('I', trees + 1)):
+            size = count * struct.calcsize(code)
+            sections.append(view[position:position + size].cast(code))
+            position = padded(position + size)
+        names, literals, decimals = marshal.loads(view[position:position + meta])
+        for i in decimals:
+            literals[i] = Decimal(literals[i])
+        classes = [list if name == 'list' else tuple if name == 'tuple' else getattr(AST, name) for name in names]
+        return cls(classes, *(sections + [literals]))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as flat_file:
+            return cls.from_buffer(mmap.mmap(flat_file.fileno(), 0, access=mmap.ACCESS_READ))
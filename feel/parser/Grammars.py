@@ -0,0 +1,9 @@
+from feel.parser.parser.Parser import Parser
+from feel.parser.simple.SimpleParser import SimpleParser
+from feel.parser.table.TableParser import TableParser
+
+GRAMMARS = {
+    'feel': Parser,
+    'simple': SimpleParser,
+    'table': TableParser,
+}
@@ -0,0 +1,82 @@
+import math
+import threading
+from decimal import Decimal
+
+from feel.parser import AST
+from feel.parser.Traversal import postorder
+
+
+CONTAINERS = (AST.AST, list, tuple)
+
+
+def item_key(item):
+    # interned children by identity; literals by class too, so 1, True and Decimal('1') stay apart, and
+    # by what equality ignores: the digits of a Decimal, so 1.0 and 1.00 stay apart, and the sign of zero
+    if isinstance(item, CONTAINERS):
+        return id(item)
+    cls = item.__class__
+    if cls is Decimal:
+        return cls, item.as_tuple()
+    if cls is float:
+        return cls, item, math.copysign(1.0, item)
+    return cls, item
+
+
+class Interner(object):
+    """Hash-consing of trees: structurally equal subtrees of all the trees interned share one instance.
+
+    Every distinct node, list and tuple is kept once, keyed by its class and its fields. Children that
+    were interned already stand in the key by identity, so a key, and its hash, costs the fields of its
+    own node, however deep the subtree. Equal interned trees are the same object, and comparing them
+    stops at the identity check of ``__eq__``.
+
+    Interned trees are shared and must be treated as read only. They have no spans, since one instance
+    stands for nodes of many texts. The input trees are left unchanged.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.fields = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def clear(self):
+        with self.lock:
+            self.nodes.clear()
+
+    def intern(self, tree):
+        """The shared instance structurally equal to ``tree``; subtrees are interned first, without recursion."""
+        done = {}
+        with self.lock:
+            for value, _ in postorder(tree, lambda value: id(value) in done or isinstance(value, AST.Stateless)):
+                done[id(value)] = self.canonical(value, done)
+        return done.get(id(tree), tree)
+
+    def names(self, cls):
+        names = self.fields.get(cls)
+        if names is None:
+            names = self.fields[cls] = AST.fields(cls)
+        return names
+
+    def canonical(self, value, done):
+        if isinstance(value, AST.AST):
+            values = [getattr(value, name) for name in self.names(value.__class__)]
+        else:
+            values = value
+        values = [done.get(id(item), item) for item in values]
+        key = (value.__class__,) + tuple(map(item_key, values))
+        found = self.nodes.get(key)
+        if found is None:
+            if isinstance(value, AST.AST):
+                found = object.__new__(value.__class__)
+                for name, item in zip(self.names(value.__class__), values):
+                    setattr(found, name, item)
+            else:
+                found = value.__class__(values)
+            self.nodes[key] = found
+        return found
+
+
+interner = Interner()
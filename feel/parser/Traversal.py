@@ -0,0 +1,109 @@
+from operator import is_not
+
+from feel.parser import AST
+# one definition of the children of a node, shared with the rest of the package
+from feel.parser.AST import children, postorder, walk
+
+# returned by a visit method, the children of the node are not visited
+SKIP = object()
+
+
+class ClassTable(dict):
+    """Values by node class, each found with ``find`` the first time its class is looked up."""
+
+    def __init__(self, find):
+        super(ClassTable, self).__init__()
+        self.find = find
+
+    def __missing__(self, cls):
+        value = self[cls] = self.find(cls)
+        return value
+
+
+def handler(owner, prefix, default):
+    """A finder of the method of ``owner`` for a node class: ``<prefix><Class>``, for the class or the closest
+    of its bases, else ``default``."""
+    def find(cls):
+        for c in cls.__mro__:
+            method = getattr(owner, prefix + c.__name__, None)
+            if method is not None:
+                return method
+        return default
+    return find
+
+
+class Leave(object):
+    __slots__ = ('method', 'node')
+
+    def __init__(self, method, node):
+        self.method = method
+        self.node = node
+
+
+# noinspection PyPep8Naming
+class Visitor(object):
+    """Walks a tree with a stack, calling ``visit_<Class>`` on every node, parents before their children.
+
+    Methods are looked up once per node class, through its bases, so ``visit_BinOp`` gets every binary
+    operation; nodes without one go to ``generic_visit``. A visit method returning ``SKIP`` leaves the
+    children of its node out. ``leave_<Class>`` methods, if any, are called once the children are done.
+    """
+
+    def __init__(self):
+        self.visitors = ClassTable(handler(self, 'visit_', self.generic_visit))
+        self.leavers = ClassTable(handler(self, 'leave_', None))
+
+    def generic_visit(self, node):
+        pass
+
+    def visit(self, tree):
+        visitors, leavers = self.visitors, self.leavers
+        pending = [tree]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, AST.AST):
+                cls = value.__class__
+                if visitors[cls](value) is SKIP:
+                    continue
+                leave = leavers[cls]
+                if leave is not None:
+                    pending.append(Leave(leave, value))
+                getter, count = AST.CHILDREN[cls]
+                if count == 1:
+                    pending.append(getter(value))
+                elif count:
+                    pending.extend(getter(value))
+            elif isinstance(value, (list, tuple)):
+                pending.extend(reversed(value))
+            elif value.__class__ is Leave:
+                value.method(value.node)
+
+
+# noinspection PyPep8Naming
+class Transformer(object):
+    """Rebuilds a tree from its leaves up with a stack, replacing every node by what ``transform_<Class>``
+    returns for it.
+
+    A transform method gets its node with the children transformed already: the node itself if none of
+    them changed, else a copy. The tree given is left unchanged, and the subtrees no method changed are
+    shared with it; a subtree met twice, like a stateless node, is transformed once. Methods are looked
+    up as in ``Visitor``; nodes without one are kept, by ``generic_transform``.
+    """
+
+    def __init__(self):
+        self.transformers = ClassTable(handler(self, 'transform_', self.generic_transform))
+
+    def generic_transform(self, node):
+        return node
+
+    def transform(self, tree):
+        transformers = self.transformers
+        results = {}
+        for value, items in postorder(tree, lambda value: id(value) in results):
+            new = [results.get(id(item), item) for item in items]
+            changed = any(map(is_not, new, items))
+            if isinstance(value, AST.AST):
+                results[id(value)] = transformers[value.__class__](AST.rebuilt(value, new) if changed else value)
+            else:
+                results[id(value)] = value.__class__(new) if changed else value
+        return results.get(id(tree), tree)
@@ -1,18 +1,14 @@
-from ply import yacc
-
-from feel.ErrorPrinters import unexpected_error
 from feel.lexer.BaseLexer import BaseLexer as Lexer
 from feel.parser import AST
+from feel.parser.common.CommonParser import CommonParser
+from feel.parser.common.ParserPool import ParserPool
 
 
 # noinspection PyMethodMayBeStatic
-from feel.parser.common import parsetab
-from utils.PrintLogger import PrintLogger
-
-
-# noinspection PyMethodMayBeStatic
-class BaseParser(object):
+class BaseParser(CommonParser):
     tokens = Lexer.tokens
+    recovery_symbols = ('expression',)
+    lexer_class = Lexer
 
     precedence = [
         ('left', '=', '<', 'LTE', '>', 'GTE'),
@@ -29,7 +25,6 @@ class BaseParser(object):
     # cases are only for removing 'unused rule' warnings
     def p_expression(self, p):
         """expression : '1' arithmetic_expression
-                      | '3' empty_list
                       | '4' comparison
                       | '5' simple_value"""
 
@@ -53,7 +48,7 @@ class BaseParser(object):
     def p_dot_names(self, p):
         """dot_names :                    %prec INSTANCE
                      | '.' name dot_names %prec path_expression_p"""
-        p[0] = [p[2]] + p[3] if len(p.slice) == 4 else []
+        p[0] = [p[2]] + p[3] if len(p) == 4 else []
 
     # 21-25
     def p_binary_operators(self, p):
@@ -141,25 +136,5 @@ class BaseParser(object):
             'duration': AST.Duration
         }[p[1]](p[3])
 
-    # helper rules
-    def p_empty_list(self, p):
-        """empty_list : """
-        p[0] = []
-
-    def p_error(self, p):
-        if p:
-            unexpected_error(p, self.logger)
-        else:
-            self.logger.log('unexpected end of file')
-
-    # noinspection SpellCheckingInspection
-    def __init__(self, tabmodule, logger=PrintLogger(), **kwargs):
-        self.logger = logger
-        self.lexer = Lexer()
-        self.parser = yacc.yacc(module=self, tabmodule=tabmodule, **kwargs)
-
-    def parse(self, *args, **kwargs):
-        return self.parser.parse(*args, lexer=self.lexer.lexer, **kwargs)
-
 
-parser = BaseParser(parsetab)
+parser = ParserPool(BaseParser, 'feel.parser.common.parsetab')
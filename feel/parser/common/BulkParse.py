@@ -0,0 +1,51 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from feel.Diagnostics import ParseResult
+from feel.parser.Grammars import GRAMMARS
+
+BATCH_SIZE = 500
+
+_worker = None
+
+
+def parse_batch(parser, texts):
+    """Parses texts one by one, keeping the diagnostics of each of them."""
+    results = []
+    for text in texts:
+        tree = parser.parse(text)
+        results.append(ParseResult(tree, list(parser.diagnostics)))
+    return results
+
+
+def start_worker(factory, kwargs):
+    global _worker
+    _worker = factory(**kwargs)
+
+
+def parse_in_worker(texts):
+    return parse_batch(_worker, texts)
+
+
+def parse_many(sources, grammar='feel', workers=None, batch_size=BATCH_SIZE, grammars=GRAMMARS, **kwargs):
+    """Parses many texts with a pool of processes; yields a ``ParseResult(tree, diagnostics)`` per text, in order.
+
+    Every worker builds its parser once, with ``kwargs`` (``limits``, ``numbers``...), and parses
+    batches of ``batch_size`` texts. ``tree`` is ``None`` for a text with errors, and ``diagnostics``
+    are those found while parsing it, rendered only when asked for. ``workers`` defaults to the number
+    of CPUs; with a single worker the texts are parsed in this process.
+    """
+    factory = grammars[grammar]
+    workers = workers or os.cpu_count() or 1
+    sources = list(sources)
+    if workers == 1:
+        parser = factory(**kwargs)
+        for start in range(0, len(sources), batch_size):
+            for parsed in parse_batch(parser, sources[start:start + batch_size]):
+                yield parsed
+        return
+    batches = [sources[start:start + batch_size] for start in range(0, len(sources), batch_size)]
+    with ProcessPoolExecutor(workers, initializer=start_worker, initargs=(factory, kwargs)) as executor:
+        for results in executor.map(parse_in_worker, batches):
+            for parsed in results:
+                yield parsed
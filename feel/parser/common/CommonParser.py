@@ -0,0 +1,102 @@
+from ply import yacc
+
+from feel.Diagnostics import Diagnostics, ParseResult
+from feel.ErrorPrinters import end_of_file, limit_error, unexpected_error
+from feel.Limits import LimitExceeded, UNLIMITED
+from feel.Numbers import HYBRID
+from feel.parser.common.Recovery import parse_recovering
+from feel.parser.common.Spans import token_ends, track_spans
+from feel.parser.common.StreamParser import FAILED, parse_stream
+
+
+class CommonParser(object):
+    """What every FEEL parser does with its grammar: builds its tables and parses, reporting diagnostics.
+
+    Subclasses hold the grammar rules, ``tokens``, ``precedence``, the ``lexer_class`` and the
+    ``recovery_symbols`` of ``recover``.
+    """
+    recovery_symbols = ()
+
+    def p_error(self, p):
+        self.errors += 1
+        self.limits.check('errors', self.errors)
+        expected = tuple(sorted(token for token in self.parser.action[self.parser.state] if token != 'error'))
+        self.diagnostics.report(unexpected_error(p, expected) if p else end_of_file(expected))
+
+    # noinspection SpellCheckingInspection
+    def __init__(self, tabmodule, logger=None, limits=UNLIMITED, numbers=HYBRID, spans=True, **kwargs):
+        self.logger = logger
+        self.limits = limits
+        self.spans = spans
+        self.errors = 0
+        self.lexer = self.lexer_class(logger, limits=limits, numbers=numbers)
+        kwargs.setdefault('debug', False)
+        self.parser = yacc.yacc(module=self, tabmodule=tabmodule, **kwargs)
+        if spans:
+            track_spans(self.parser)
+
+    @property
+    def diagnostics(self):
+        return self.lexer.diagnostics
+
+    def parse(self, *args, **kwargs):
+        """Parses a text; ``lineno`` is the number of its first line, 1 by default.
+
+        Unless the parser was made with ``spans=False``, every node gets the offsets it spans in the text.
+        """
+        self.errors = 0
+        self.lexer.diagnostics = Diagnostics(self.logger)
+        self.lexer.lexer.lineno = kwargs.pop('lineno', 1)
+        if self.spans:
+            kwargs.setdefault('tokenfunc', token_ends(self.lexer.lexer))
+        try:
+            result = self.parser.parse(*args, lexer=self.lexer.lexer, **kwargs)
+            self.limits.check_depth(result)
+        except LimitExceeded as e:
+            self.diagnostics.report(limit_error(e))
+            return None
+        return result
+
+    def parse_spans(self, text):
+        """Parses like ``parse``, but over a TokenStream; inputs with errors are parsed again by ``parse``."""
+        self.lexer.diagnostics = Diagnostics(self.logger)
+        self.lexer.lexer.lineno = 1
+        try:
+            stream = self.lexer.stream(text)
+            if not stream.errors:
+                result = parse_stream(self.parser, stream, self.spans)
+                if result is not FAILED:
+                    self.limits.check_depth(result)
+                    return result
+        except LimitExceeded as e:
+            self.diagnostics.report(limit_error(e))
+            return None
+        return self.parse(text)
+
+    def diagnose(self, *args, **kwargs):
+        """Parses like ``parse``; returns the tree, or ``None``, with the diagnostics of the input."""
+        return ParseResult(self.parse(*args, **kwargs), self.diagnostics)
+
+    def recover(self, text, lineno=1):
+        """Parses a text going on after syntax errors, to find all of them in one pass.
+
+        Returns the tree, with ``AST.Error`` nodes in place of the parts that did not parse, or ``None``,
+        with the diagnostics of the input. ``recovery_symbols`` are the nonterminals an error node can stand for.
+        """
+        self.errors = 0
+        self.lexer.diagnostics = Diagnostics(self.logger)
+        self.lexer.lexer.lineno = lineno
+        try:
+            stream = self.lexer.stream(text)
+            result = parse_recovering(self.parser, stream, self.recovery_symbols, self.report_error, self.spans, lineno)
+            self.limits.check_depth(result)
+        except LimitExceeded as e:
+            self.diagnostics.report(limit_error(e))
+            result = None
+        return ParseResult(result, self.diagnostics)
+
+    def report_error(self, diagnostic):
+        self.errors += 1
+        self.limits.check('errors', self.errors)
+        self.diagnostics.report(diagnostic)
+
@@ -0,0 +1,118 @@
+import gc
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+
+from feel.Numbers import HYBRID
+from feel.parser import AST
+from feel.parser.Grammars import GRAMMARS
+from feel.parser.common.ParserPool import ParserPool
+
+FORMAT = 1
+
+
+def grammar_version(factory, numbers=HYBRID):
+    """Hashes what the trees of a grammar come from: its parser and lexer classes, the AST and the number mode."""
+    modules = set([AST])
+    for cls in factory.__mro__ + factory.lexer_class.__mro__:
+        if cls is not object:
+            modules.add(sys.modules[cls.__module__])
+    digest = hashlib.sha1(('%d %s %d' % (FORMAT, numbers.mode, numbers.context.prec)).encode('utf8'))
+    for module in sorted(modules, key=lambda m: m.__name__):
+        with open(module.__file__, 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def unpickle(data):
+    # Unpickling creates a lot of objects and nothing cyclic; keep the collector from rescanning them.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def text_key(text):
+    return hashlib.blake2b(text.encode('utf8'), digest_size=16).digest()
+
+
+class DiskCache(object):
+    """Keeps parsed trees in a file, so a new process loads them in bulk instead of parsing.
+
+    Trees are keyed by a hash of their source text and stored per grammar, together with the
+    grammar version and number mode; trees of any other version or mode are ignored on load. Texts missing from the file
+    are parsed, and ``save`` writes them back. Every caller gets the same tree instance, which must
+    be treated as read only. Failed parses are not stored.
+    """
+
+    def __init__(self, path, logger=None, numbers=HYBRID, grammars=GRAMMARS):
+        self.path = path
+        self.parsers = dict((name, ParserPool(factory, logger, numbers=numbers)) for name, factory in grammars.items())
+        self.versions = dict((name, grammar_version(factory, numbers)) for name, factory in grammars.items())
+        self.entries = dict((name, {}) for name in grammars)
+        self.lock = threading.Lock()
+        self.hits = self.misses = 0
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'rb') as cache_file:
+                version, tables = pickle.load(cache_file)
+        except (IOError, OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return
+        if version != FORMAT:
+            return
+        for name, (grammar, data) in tables.items():
+            if name in self.entries and self.versions[name] == grammar:
+                self.entries[name].update(unpickle(data))
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            tables = dict((name, (self.versions[name], pickle.dumps(entries, pickle.HIGHEST_PROTOCOL)))
+                          for name, entries in self.entries.items())
+            self.dirty = False
+        # A file of its own per call, so concurrent saves from threads or processes never mix their writes.
+        directory, name = os.path.split(os.path.abspath(self.path))
+        with tempfile.NamedTemporaryFile(dir=directory, prefix=name + '.', suffix='.tmp', delete=False) as cache_file:
+            try:
+                pickle.dump((FORMAT, tables), cache_file, pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                cache_file.close()
+                os.remove(cache_file.name)
+                raise
+        os.replace(cache_file.name, self.path)
+
+    def parse(self, text, grammar='feel'):
+        key = text_key(text)
+        entries = self.entries[grammar]
+        tree = entries.get(key)
+        if tree is not None:
+            with self.lock:
+                self.hits += 1
+            return tree
+        tree = self.parsers[grammar].parse(text)
+        with self.lock:
+            self.misses += 1
+            if tree is not None:
+                entries[key] = tree
+                self.dirty = True
+        return tree
+
+    def parse_all(self, texts, grammar='feel'):
+        return [self.parse(text, grammar) for text in texts]
+
+    def clear(self):
+        with self.lock:
+            for entries in self.entries.values():
+                entries.clear()
+            self.hits = self.misses = 0
+            self.dirty = True
@@ -0,0 +1,210 @@
+from array import array
+from bisect import bisect_left
+
+from feel.lexer.TokenStream import TokenStream
+from feel.parser import AST
+from feel.parser.Traversal import children
+from feel.parser.common.StreamParser import FAILED, run_tables
+
+# Tokens around an expression that end it whatever it holds: an expression between them can be parsed
+# again on its own and put back in place.
+OPENING = frozenset(['(', '[', '{', ',', ':'])
+CLOSING = frozenset([')', ']', '}', ','])
+
+
+class Document(object):
+    """A text parsed by an ``IncrementalParser``: its tree, its tokens and the tokens spanned by every node.
+
+    ``spans`` maps ``id(node)`` to ``(node, first, last, whole)``: the indexes of the first and the last
+    token of the node in ``stream``, and whether those tokens were reduced to the start symbol of the
+    grammar. Texts with errors have them in ``diagnostics``, a tree only if the parser recovered, and no spans.
+    Nodes are shared between the documents of successive edits, so nodes parsed without errors do not hold
+    their own offsets (their ``span`` is ``None``); ``span`` here gives them in this document.
+    """
+
+    def __init__(self, text, tree, stream, spans, diagnostics=()):
+        self.text = text
+        self.tree = tree
+        self.stream = stream
+        self.spans = spans
+        self.diagnostics = diagnostics
+
+    def span(self, node):
+        """The start and end offsets of a node in the text, or ``None`` for nodes without one."""
+        entry = self.spans.get(id(node))
+        if entry is None:
+            return None
+        return self.stream.starts[entry[1]], self.stream.ends[entry[2]]
+
+
+def parse_tracked(lr, stream, first, stop, spans, symbol):
+    """Runs the tables of a yacc ``LRParser`` over tokens ``first`` to ``stop`` of a stream, with ``run_tables``.
+
+    The tokens spanned by every AST node built are recorded in ``spans``, as in ``Document.spans``, with
+    ``symbol`` as the start symbol.
+    """
+    def reduced(p, name, start, position):
+        node = p[0]
+        if isinstance(node, AST.AST) and not isinstance(node, AST.Stateless):
+            entry = spans.get(id(node))
+            if entry is None:
+                spans[id(node)] = (node, start, position - 1, name == symbol)
+            elif name == symbol and entry[1] == start and entry[2] == position - 1:
+                spans[id(node)] = (node, start, position - 1, True)
+
+    return run_tables(lr, stream, first, stop, reduced)
+
+
+def shifted(values, delta):
+    return array('I', (value + delta for value in values)) if delta else values
+
+
+def substitute(value, old, new):
+    if value is old:
+        return new
+    if isinstance(value, list):
+        return [substitute(item, old, new) for item in value]
+    if isinstance(value, tuple):
+        return tuple(substitute(item, old, new) for item in value)
+    return value
+
+
+def replace_child(node, old, new):
+    """A copy of a node with the child ``old`` replaced by ``new``."""
+    other = object.__new__(node.__class__)
+    for name in AST.fields(node.__class__):
+        setattr(other, name, substitute(getattr(node, name), old, new))
+    return other
+
+
+class IncrementalParser(object):
+    """Parses a text once, then parses edits of it again reusing what they left unchanged.
+
+    An edit re-lexes the text from a couple of tokens before it up to the first old token it reaches
+    again; the rest of the tokens are reused, moved. The smallest node around the changed tokens that
+    is an expression between delimiters like ``,`` or ``(`` and ``)`` is then parsed again, on its own,
+    and the new subtree is put in a copy of the path from the root; every other subtree is shared with
+    the previous tree. Edits that no such node holds, or texts with errors, are parsed whole.
+
+    Works with parsers on the scanner backend; grammar actions get a plain list, as in ``parse_spans``.
+    """
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.lr = parser.parser
+        self.scanner = parser.lexer.lexer
+        self.start = self.lr.productions[0].str.split('->')[1].strip()
+
+    def parse(self, text):
+        self.scanner.lineno = 1
+        return self.parse_stream(text, self.scanner.stream(text))
+
+    def parse_stream(self, text, stream):
+        spans = {}
+        tree = FAILED if stream.errors else parse_tracked(self.lr, stream, 0, len(stream), spans, self.start)
+        if tree is FAILED:
+            tree, diagnostics = self.parser.diagnose(text)
+            return Document(text, tree, stream, {}, diagnostics)
+        return Document(text, tree, stream, spans, [])
+
+    def edit(self, document, offset, deleted, inserted):
+        """Parses ``document.text`` with ``deleted`` characters at ``offset`` replaced by ``inserted``."""
+        text = document.text[:offset] + inserted + document.text[offset + deleted:]
+        old = document.stream
+        if document.tree is None or document.diagnostics:
+            return self.parse(text)
+        delta = len(inserted) - deleted
+        restart = max(bisect_left(old.ends, offset) - 2, 0)
+        resync = [len(old)]
+        after = offset + len(inserted)
+        old_starts = old.starts
+
+        def until(position):
+            if position < after:
+                return False
+            i = bisect_left(old_starts, position - delta, restart)
+            if i < len(old_starts) and old_starts[i] == position - delta:
+                resync[0] = i
+                return True
+            return False
+
+        self.scanner.lineno = old.lines[restart] if restart else 1
+        new = self.scanner.stream(text, old.starts[restart] if restart else 0, until)
+        if new.errors:
+            return self.parse(text)
+        stop = resync[0]
+        lines = self.scanner.lineno - old.lines[stop] if stop < len(old) else 0
+        stream = TokenStream(text, old.names, old.decoders,
+                             old.kinds[:restart] + new.kinds + old.kinds[stop:],
+                             old.starts[:restart] + new.starts + shifted(old.starts[stop:], delta),
+                             old.ends[:restart] + new.ends + shifted(old.ends[stop:], delta),
+                             old.lines[:restart] + new.lines + shifted(old.lines[stop:], lines),
+                             [])
+        # the old tokens first to last were replaced by count new ones; the others are the same
+        first, last, count = restart, stop - 1, len(new)
+        while count and first <= last and old.ends[first] <= offset and \
+                old.kinds[first] == new.kinds[first - restart] and old.starts[first] == new.starts[first - restart] \
+                and old.ends[first] == new.ends[first - restart]:
+            first += 1
+            count -= 1
+        while count and first <= last and old.starts[last] >= offset + deleted and \
+                old.kinds[last] == new.kinds[first - restart + count - 1] and \
+                old.starts[last] + delta == new.starts[first - restart + count - 1] and \
+                old.ends[last] + delta == new.ends[first - restart + count - 1]:
+            last -= 1
+            count -= 1
+        moved = count - (last - first + 1)
+        if not count and first > last:
+            return Document(text, document.tree, stream, document.spans, [])
+        tree, spans = self.reparse(document, stream, first, last, moved)
+        if tree is FAILED:
+            return self.parse_stream(text, stream)
+        return Document(text, tree, stream, spans, [])
+
+    def reparse(self, document, stream, first, last, moved):
+        """Parses again the smallest expression holding the old tokens ``first`` to ``last``."""
+        spans, names, kinds = document.spans, document.stream.names, document.stream.kinds
+        path, node = [], document.tree
+        while node is not None:
+            path.append(node)
+            for child in children(node):
+                entry = spans.get(id(child))
+                if entry is not None and entry[1] <= first and last <= entry[2]:
+                    node = child
+                    break
+            else:
+                node = None
+        for depth in range(len(path) - 1, 0, -1):
+            _, start, end, whole = spans[id(path[depth])]
+            if not whole or start == 0 or end + 1 >= len(kinds) or \
+                    names[kinds[start - 1]] not in OPENING or names[kinds[end + 1]] not in CLOSING:
+                continue
+            found = {}
+            subtree = parse_tracked(self.lr, stream, start, end + moved + 1, found, self.start)
+            if subtree is FAILED:
+                continue
+            return self.splice(path[:depth], path[depth], subtree, found, spans, last, moved)
+        return FAILED, None
+
+    @staticmethod
+    def splice(ancestors, old, new, found, spans, last, moved):
+        """The new tree and spans, with ``new`` in place of ``old``; the old ones are left as they were."""
+        kept = dict(spans)
+        for ancestor in ancestors:
+            del kept[id(ancestor)]
+        pending = [old]
+        while pending:
+            node = pending.pop()
+            kept.pop(id(node), None)
+            pending.extend(children(node))
+        if moved:
+            for key, entry in kept.items():
+                if entry[2] > last:
+                    first = entry[1] + moved if entry[1] > last else entry[1]
+                    kept[key] = (entry[0], first, entry[2] + moved, entry[3])
+        for ancestor in reversed(ancestors):
+            new, old = replace_child(ancestor, old, new), ancestor
+            entry = spans[id(ancestor)]
+            kept[id(new)] = (new, entry[1], entry[2] + moved, entry[3])
+        kept.update(found)
+        return new, kept
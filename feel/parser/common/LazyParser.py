@@ -0,0 +1,23 @@
+import threading
+
+
+class LazyParser(object):
+    """Stands in for a module level parser; builds it on first use."""
+
+    def __init__(self, factory, *args, **kwargs):
+        self._factory = factory
+        self._args = args
+        self._kwargs = kwargs
+        self._instance = None
+        self._lock = threading.Lock()
+
+    @property
+    def instance(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory(*self._args, **self._kwargs)
+        return self._instance
+
+    def __getattr__(self, name):
+        return getattr(self.instance, name)
@@ -0,0 +1,85 @@
+import copy
+import threading
+from collections import OrderedDict, namedtuple
+
+from feel.parser.Grammars import GRAMMARS
+from feel.parser.common.ParserPool import ParserPool
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions size maxsize')
+
+
+class Failure(object):
+    def __init__(self, diagnostics):
+        self.diagnostics = diagnostics
+
+    @property
+    def messages(self):
+        return [line for diagnostic in self.diagnostics for line in diagnostic.lines()]
+
+
+class ParseCache(object):
+    """Memoizes parse results by grammar and source text, evicting the least recently used.
+
+    Every caller gets the same cached tree, so callers must not change the trees they get. With
+    ``copy=True`` each call returns a deep copy instead, which callers may change freely.
+    With ``cache_failures`` a failed parse is remembered too: it returns ``None`` again and its
+    messages are logged again, without parsing.
+    """
+
+    def __init__(self, maxsize=1024, cache_failures=False, copy=False, logger=None, grammars=GRAMMARS):
+        self.maxsize = maxsize
+        self.cache_failures = cache_failures
+        self.copy = copy
+        self.logger = logger
+        self.parsers = dict((name, ParserPool(factory, self.logger)) for name, factory in grammars.items())
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def parse(self, text, grammar='feel'):
+        key = (grammar, text)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is None:
+            entry = self.store(key, self.parse_uncached(text, grammar))
+        elif entry.__class__ is Failure and self.logger is not None:
+            self.logger.log(*entry.messages)
+        if entry.__class__ is Failure:
+            return None
+        return copy.deepcopy(entry) if self.copy else entry
+
+    def parse_uncached(self, text, grammar):
+        parser = self.parsers[grammar].local()
+        result = parser.parse(text)
+        return Failure(list(parser.diagnostics)) if result is None else result
+
+    def store(self, key, entry):
+        if entry.__class__ is Failure and not self.cache_failures:
+            return entry
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def diagnostics(self, text, grammar='feel'):
+        """The ``Diagnostic`` records of a cached failed parse, or ``None`` if the text has none cached."""
+        with self.lock:
+            entry = self.entries.get((grammar, text))
+        return list(entry.diagnostics) if entry.__class__ is Failure else None
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self.entries), self.maxsize)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
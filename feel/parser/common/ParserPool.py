@@ -0,0 +1,66 @@
+import copy
+import threading
+from contextlib import contextmanager
+
+from feel.parser.common.LazyParser import LazyParser
+from feel.parser.common.Spans import track_spans
+
+
+def clone_parser(parser):
+    """Copies a built parser sharing its LR tables, but not the lexer and yacc state of a parse."""
+    other = copy.copy(parser)
+    other.lexer = parser.lexer.clone()
+    other.parser = copy.copy(parser.parser)
+    other.parser.errorfunc = other.p_error
+    other.parser.productions = [copy.copy(production) for production in parser.parser.productions]
+    actions = dict((p.func, getattr(other, p.func)) for p in other.parser.productions if p.func)
+    for production in other.parser.productions:
+        production.bind(actions)
+    if other.spans:
+        track_spans(other.parser)
+    return other
+
+
+class ParserPool(object):
+    """Hands out parser/lexer pairs, one per thread or checked out explicitly.
+
+    All pairs are clones of a single parser built on first use, so the LR and lexer
+    tables are shared while every pair keeps its own parsing state.
+    """
+
+    def __init__(self, factory, *args, **kwargs):
+        self._template = LazyParser(factory, *args, **kwargs)
+        self._local = threading.local()
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return clone_parser(self._template.instance)
+
+    def release(self, parser):
+        with self._lock:
+            self._free.append(parser)
+
+    @contextmanager
+    def checkout(self):
+        parser = self.acquire()
+        try:
+            yield parser
+        finally:
+            self.release(parser)
+
+    def local(self):
+        try:
+            return self._local.parser
+        except AttributeError:
+            self._local.parser = self.acquire()
+            return self._local.parser
+
+    def parse(self, *args, **kwargs):
+        return self.local().parse(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.local(), name)
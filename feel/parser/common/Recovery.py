@@ -0,0 +1,98 @@
+from feel.ErrorPrinters import end_of_file, stream_character_error, stream_token_error
+from feel.lexer.LineIndex import LineIndex
+from feel.parser import AST
+from feel.parser.common.StreamParser import FAILED, locating, run_tables
+
+# Tokens parsing resumes at after a syntax error.
+SYNC = frozenset([',', ')', ']', '}', 'THEN', 'ELSE', 'RETURN', 'SATISFIES'])
+OPENING = frozenset(['(', '[', '{'])
+CLOSING = frozenset([')', ']', '}'])
+
+
+def parse_recovering(lr, stream, symbols, report, spans=False, lineno=1):
+    """Runs the tables of a yacc ``LRParser`` over a ``TokenStream``, going on after syntax errors.
+
+    Every error is given to ``report`` as a diagnostic, unexpected characters skipped by the lexer
+    included. On a syntax error tokens are skipped up to the nearest ``SYNC`` token outside of brackets
+    opened since, or the end of the input, and states are popped until one where a nonterminal of
+    ``symbols`` can be followed by that token. An ``AST.Error`` node with the skipped text stands for that
+    nonterminal, and parsing goes on from the token. Returns the tree, with its ``Error`` nodes, or
+    ``None`` if no state could take one. The tables run with ``run_tables``, as in ``parse_stream``.
+    """
+    actions, goto, productions, defaulted = lr.action, lr.goto, lr.productions, lr.defaulted_states
+    names, kinds, count = stream.names, stream.kinds, len(stream)
+    starts, ends, characters = stream.starts, stream.ends, stream.errors
+    index = LineIndex(stream.data, lineno)
+    # the position last resumed at, and the number of unexpected characters reported
+    resumed, reported = [-1], [0]
+
+    def report_characters(until):
+        # unexpected characters before offset ``until``, so diagnostics come in the order of the input
+        i = reported[0]
+        while i < len(characters) and characters[i] < until:
+            report(stream_character_error(stream, characters[i], index))
+            i += 1
+        reported[0] = i
+
+    def accepts(stack, token):
+        # follows the reductions the token leads to, as LALR tables may reduce before finding an error
+        stack = list(stack)
+        while True:
+            state = stack[-1]
+            t = defaulted[state] if state in defaulted else actions[state].get(token)
+            if t is None:
+                return False
+            if t >= 0:
+                return True
+            production = productions[-t]
+            if production.len:
+                del stack[-production.len:]
+            stack.append(goto[stack[-1]][production.name])
+
+    def resume(states, first):
+        """The position of the token to resume at, the depth of the stack to resume from and the symbol."""
+        depth = 0
+        for k in range(first, count + 1):
+            token = names[kinds[k]] if k < count else '$end'
+            if token in OPENING:
+                depth += 1
+            elif depth and token in CLOSING:
+                depth -= 1
+            elif token == '$end' or depth == 0 and token in SYNC:
+                for d in range(len(states) - 1, -1, -1):
+                    for symbol in symbols:
+                        g = goto.get(states[d], {}).get(symbol)
+                        if g is not None and accepts(states[:d + 1] + [g], token):
+                            return k, d, symbol
+        return None
+
+    def error(states, values, firsts, position):
+        expected = tuple(sorted(token for token in actions[states[-1]] if token != 'error'))
+        if position < count:
+            report_characters(starts[position])
+            report(stream_token_error(stream, position, index, expected))
+        else:
+            report_characters(len(stream.data))
+            report(end_of_file(expected))
+        found = resume(states, position + 1 if position == resumed[0] else position)
+        if found is None:
+            return None
+        k, d, symbol = found
+        first = firsts[d + 1] if d + 1 < len(firsts) else position
+        del states[d + 1:]
+        del values[d + 1:]
+        del firsts[d + 1:]
+        node = AST.Error(stream.data[starts[first]:ends[k - 1]] if first < k else '')
+        if spans and first < k:
+            AST.locate(node, starts[first], ends[k - 1])
+        states.append(goto[states[-1]][symbol])
+        values.append(node)
+        firsts.append(first)
+        resumed[0] = k
+        return k
+
+    tree = run_tables(lr, stream, reduced=locating(stream) if spans else None, error=error)
+    if tree is FAILED:
+        return None
+    report_characters(len(stream.data))
+    return tree
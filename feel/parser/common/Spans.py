@@ -0,0 +1,60 @@
+from feel.parser import AST
+from feel.parser.Traversal import walk
+
+
+def token_ends(lexer):
+    """A yacc token function reading from ``lexer`` that stores where every token ends in its ``endlexpos``."""
+    token = lexer.token
+
+    def next_token():
+        tok = token()
+        if tok is not None:
+            tok.endlexpos = lexer.lexpos
+        return tok
+    return next_token
+
+
+def spanning(action):
+    """Wraps a grammar action to give the symbol it reduces, and the node it builds, the offsets under them.
+
+    Symbols reduced by empty rules have ``None`` offsets and are skipped, as are the error symbols of yacc.
+    Actions run by ``parse_stream`` get a plain list, and are left to it.
+    """
+    def reduce(p):
+        action(p)
+        if p.__class__ is list:
+            return
+        symbols = p.slice
+        result = symbols[0]
+        if len(symbols) == 1:
+            result.lexpos = result.endlexpos = None
+            return
+        try:
+            start, end = symbols[1].lexpos, symbols[-1].endlexpos
+        except AttributeError:
+            start = end = None
+        if start is None or end is None:
+            located = [symbol for symbol in symbols[1:] if getattr(symbol, 'endlexpos', None) is not None]
+            if not located:
+                result.lexpos = result.endlexpos = None
+                return
+            start, end = located[0].lexpos, located[-1].endlexpos
+        result.lexpos, result.endlexpos = start, end
+        if result.value is not symbols[1].value:
+            AST.locate(result.value, start, end)
+    return reduce
+
+
+def track_spans(lr):
+    """Makes the productions of a yacc ``LRParser`` give spans to the nodes they build."""
+    for production in lr.productions:
+        if production.callable is not None:
+            production.callable = spanning(production.callable)
+
+
+def shift_spans(tree, offset):
+    """Moves the spans of the nodes of a tree by ``offset`` characters."""
+    for node in walk(tree):
+        span = node.span
+        if span is not None:
+            node._span = (span[0] + offset) << AST.SPAN_BITS | (span[1] + offset)
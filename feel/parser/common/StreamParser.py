@@ -0,0 +1,86 @@
+from feel.parser.AST import locate
+
+FAILED = object()
+
+
+def run_tables(lr, stream, first=0, stop=None, reduced=None, error=None):
+    """Runs the tables of a yacc ``LRParser`` over tokens ``first`` to ``stop`` of a ``TokenStream``.
+
+    Grammar actions get a plain list in place of ``YaccProduction``, so they may only index it and take
+    its length. Token values are decoded when shifted. After every reduction ``reduced(p, name, start,
+    position)`` gets that list, the name of the production and the tokens it spans, ``start`` up to
+    ``position``. On a syntax error ``error(states, values, starts, position)`` may change the stacks,
+    ``starts`` holding the first token of every value, and return the position to go on from; without
+    it, or if it returns ``None``, ``FAILED`` is returned.
+    """
+    actions, goto, productions, defaulted = lr.action, lr.goto, lr.productions, lr.defaulted_states
+    names, kinds, value = stream.names, stream.kinds, stream.value
+    stop = len(stream) if stop is None else stop
+    tracked = reduced is not None or error is not None
+    states, values, firsts = [0], [None], [first]
+    state, position, lookahead = 0, first, None
+    while True:
+        if state in defaulted:
+            t = defaulted[state]
+        else:
+            if lookahead is None:
+                lookahead = names[kinds[position]] if position < stop else '$end'
+            t = actions[state].get(lookahead)
+        if t is None:
+            position = None if error is None else error(states, values, firsts, position)
+            if position is None:
+                return FAILED
+            state = states[-1]
+            lookahead = None
+        elif t > 0:
+            states.append(t)
+            state = t
+            values.append(value(position))
+            if tracked:
+                firsts.append(position)
+            position += 1
+            lookahead = None
+        elif t < 0:
+            production = productions[-t]
+            length = production.len
+            if length:
+                p = [None] + values[-length:]
+                del values[-length:]
+                del states[-length:]
+            else:
+                p = [None]
+            production.callable(p)
+            if tracked:
+                if length:
+                    start = firsts[-length]
+                    del firsts[-length:]
+                else:
+                    start = position
+                firsts.append(start)
+                if reduced is not None:
+                    reduced(p, production.name, start, position)
+            values.append(p[0])
+            state = goto[states[-1]][production.name]
+            states.append(state)
+        else:
+            return values[-1]
+
+
+def locating(stream):
+    """A ``reduced`` hook giving the nodes built the offsets of their tokens, as ``AST.locate`` does."""
+    starts, ends = stream.starts, stream.ends
+
+    def reduced(p, name, start, position):
+        if start < position and (len(p) != 2 or p[0] is not p[1]):
+            locate(p[0], starts[start], ends[position - 1])
+
+    return reduced
+
+
+def parse_stream(lr, stream, spans=False):
+    """Runs the tables of a yacc ``LRParser`` over a ``TokenStream``, with ``run_tables``.
+
+    Nothing recovers from syntax errors here: on the first one ``FAILED`` is returned, so the caller can
+    parse again with yacc to report it. With ``spans`` the nodes built get the offsets of their tokens.
+    """
+    return run_tables(lr, stream, reduced=locating(stream) if spans else None)
@@ -0,0 +1,47 @@
+import re
+
+from feel.Limits import UNLIMITED
+
+CHUNK_SIZE = 1 << 16
+SPECIAL = re.compile(r'["()\[\]{},]')
+QUOTE = re.compile('"')
+
+
+def chunks(source, size=CHUNK_SIZE):
+    """The text of a file object, a string or an iterable of strings, in chunks."""
+    if isinstance(source, str):
+        return [source]
+    if hasattr(source, 'read'):
+        return iter(lambda: source.read(size), '')
+    return source
+
+
+def split(source, limits=UNLIMITED):
+    """Yields the pieces of a text between the commas outside of strings and brackets.
+
+    The text is read in chunks, and only the piece being scanned is kept, so at most one piece and one
+    chunk are held at a time. A piece longer than the length limit of ``limits`` raises ``LimitExceeded``.
+    """
+    buffer, scanned, depth, quoted = '', 0, 0, False
+    for chunk in chunks(source):
+        buffer += chunk
+        start, position = 0, scanned
+        while True:
+            m = (QUOTE if quoted else SPECIAL).search(buffer, position)
+            if m is None:
+                break
+            position = m.end()
+            c = m.group()
+            if c == '"':
+                quoted = not quoted
+            elif c in '([{':
+                depth += 1
+            elif c in ')]}':
+                depth = max(depth - 1, 0)
+            elif depth == 0:
+                yield buffer[start:m.start()]
+                start = position
+        buffer = buffer[start:]
+        scanned = len(buffer)
+        limits.check('length', scanned)
+    yield buffer
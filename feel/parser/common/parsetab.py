@@ -0,0 +1,67 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "left=<LTE>GTEleft+-left*/leftEXPONENTrightnegation_pleftINSTANCEleftpath_expression_pDATE DATE_AND_TIME DURATION EXPONENT FALSE GTE LTE NAME NEQ NEWLINE NUMERIC_LITERAL STRING_LITERAL TIME TRUEexpression : '1' arithmetic_expression\n                      | '4' comparison\n                      | '5' simple_valuearithmetic_expression : binary_operators\n                                 | arithmetic_negationsimple_value : qualified_name\n                        | simple_literalqualified_name : name dot_namesdot_names :                    %prec INSTANCE\n                     | '.' name dot_names %prec path_expression_pbinary_operators : expression '+'      expression\n                            | expression '-'      expression\n                            | expression '*'      expression\n                            | expression '/'      expression\n                            | expression EXPONENT expressionarithmetic_negation : '-' expression %prec negation_pname : NAMEsimple_literal : numeric_literal\n                          | string_literal\n                          | boolean_literal\n                          | date_time_literalstring_literal : STRING_LITERALboolean_literal : TRUE\n                           | FALSEnumeric_literal : NUMERIC_LITERALcomparison : operatoroperator : expression '=' expression\n                    | expression NEQ expression\n                    | expression '<' expression\n                    | expression LTE expression\n                    | expression '>' expression\n                    | expression GTE expressiondate_time_literal : DATE          '(' STRING_LITERAL ')'\n                             | TIME          '(' STRING_LITERAL ')'\n                             | DATE_AND_TIME '(' STRING_LITERAL ')'\n                             | DATE_AND_TIME '(' STRING_LITERAL NEWLINE ')'\n                             | DURATION      '(' STRING_LITERAL ')'"
+    
+_lr_action_items = {'1':([0,2,3,9,30,31,32,33,34,36,37,38,39,40,41,],[2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,]),'4':([0,2,3,9,30,31,32,33,34,36,37,38,39,40,41,],[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'5':([0,2,3,9,30,31,32,33,34,36,37,38,39,40,41,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'$end':([1,5,6,7,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[0,-1,-4,-5,-2,-26,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'-':([2,5,6,7,8,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[9,-1,-4,-5,31,-2,-26,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'NAME':([4,43,],[21,21,]),'NUMERIC_LITERAL':([4,],[22,]),'STRING_LITERAL':([4,44,45,46,47,],[23,60,61,62,63,]),'TRUE':([4,],[24,]),'FALSE':([4,],[25,]),'DATE':([4,],[26,]),'TIME':([4,],[27,]),'DATE_AND_TIME':([4,],[28,]),'DURATION':([4,],[29,]),'+':([5,6,7,8,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,30,-2,-26,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'*':([5,6,7,8,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,32,-2,-26,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'/':([5,6,7,8,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,33,-2,-26,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'EXPONENT':([5,6,7,8,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,34,-2,-26,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'=':([5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,-2,-26,36,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'NEQ':([5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,-2,-26,37,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'<':([5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,-2,-26,38,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'LTE':([5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,-2,-26,39,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'>':([5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,-2,-26,40,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'GTE':([5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,35,42,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[-1,-4,-5,-2,-26,41,-3,-6,-7,-9,-18,-19,-20,-21,-17,-25,-22,-23,-24,-16,-8,-11,-12,-13,-14,-15,-27,-28,-29,-30,-31,-32,-9,-10,-33,-34,-35,-37,-36,]),'.':([16,21,59,],[43,-17,43,]),'(':([26,27,28,29,],[44,45,46,47,]),')':([60,61,62,63,68,],[65,66,67,69,70,]),'NEWLINE':([62,],[68,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expression':([0,2,3,9,30,31,32,33,34,36,37,38,39,40,41,],[1,8,12,35,48,49,50,51,52,53,54,55,56,57,58,]),'arithmetic_expression':([2,],[5,]),'binary_operators':([2,],[6,]),'arithmetic_negation':([2,],[7,]),'comparison':([3,],[10,]),'operator':([3,],[11,]),'simple_value':([4,],[13,]),'qualified_name':([4,],[14,]),'simple_literal':([4,],[15,]),'name':([4,43,],[16,59,]),'numeric_literal':([4,],[17,]),'string_literal':([4,],[18,]),'boolean_literal':([4,],[19,]),'date_time_literal':([4,],[20,]),'dot_names':([16,59,],[42,64,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expression","S'",1,None,None,None),
+  ('expression -> 1 arithmetic_expression','expression',2,'p_expression','BaseParser.py',32),
+  ('expression -> 4 comparison','expression',2,'p_expression','BaseParser.py',33),
+  ('expression -> 5 simple_value','expression',2,'p_expression','BaseParser.py',34),
+  ('arithmetic_expression -> binary_operators','arithmetic_expression',1,'p_arithmetic_expression','BaseParser.py',38),
+  ('arithmetic_expression -> arithmetic_negation','arithmetic_expression',1,'p_arithmetic_expression','BaseParser.py',39),
+  ('simple_value -> qualified_name','simple_value',1,'p_simple_value','BaseParser.py',44),
+  ('simple_value -> simple_literal','simple_value',1,'p_simple_value','BaseParser.py',45),
+  ('qualified_name -> name dot_names','qualified_name',2,'p_qualified_name','BaseParser.py',50),
+  ('dot_names -> <empty>','dot_names',0,'p_dot_names','BaseParser.py',54),
+  ('dot_names -> . name dot_names','dot_names',3,'p_dot_names','BaseParser.py',55),
+  ('binary_operators -> expression + expression','binary_operators',3,'p_binary_operators','BaseParser.py',60),
+  ('binary_operators -> expression - expression','binary_operators',3,'p_binary_operators','BaseParser.py',61),
+  ('binary_operators -> expression * expression','binary_operators',3,'p_binary_operators','BaseParser.py',62),
+  ('binary_operators -> expression / expression','binary_operators',3,'p_binary_operators','BaseParser.py',63),
+  ('binary_operators -> expression EXPONENT expression','binary_operators',3,'p_binary_operators','BaseParser.py',64),
+  ('arithmetic_negation -> - expression','arithmetic_negation',2,'p_arithmetic_negation','BaseParser.py',76),
+  ('name -> NAME','name',1,'p_name','BaseParser.py',81),
+  ('simple_literal -> numeric_literal','simple_literal',1,'p_simple_literal','BaseParser.py',86),
+  ('simple_literal -> string_literal','simple_literal',1,'p_simple_literal','BaseParser.py',87),
+  ('simple_literal -> boolean_literal','simple_literal',1,'p_simple_literal','BaseParser.py',88),
+  ('simple_literal -> date_time_literal','simple_literal',1,'p_simple_literal','BaseParser.py',89),
+  ('string_literal -> STRING_LITERAL','string_literal',1,'p_string_literal','BaseParser.py',94),
+  ('boolean_literal -> TRUE','boolean_literal',1,'p_boolean_literal','BaseParser.py',99),
+  ('boolean_literal -> FALSE','boolean_literal',1,'p_boolean_literal','BaseParser.py',100),
+  ('numeric_literal -> NUMERIC_LITERAL','numeric_literal',1,'p_numeric_literal','BaseParser.py',105),
+  ('comparison -> operator','comparison',1,'p_comparison','BaseParser.py',110),
+  ('operator -> expression = expression','operator',3,'p_operator','BaseParser.py',115),
+  ('operator -> expression NEQ expression','operator',3,'p_operator','BaseParser.py',116),
+  ('operator -> expression < expression','operator',3,'p_operator','BaseParser.py',117),
+  ('operator -> expression LTE expression','operator',3,'p_operator','BaseParser.py',118),
+  ('operator -> expression > expression','operator',3,'p_operator','BaseParser.py',119),
+  ('operator -> expression GTE expression','operator',3,'p_operator','BaseParser.py',120),
+  ('date_time_literal -> DATE ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',132),
+  ('date_time_literal -> TIME ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',133),
+  ('date_time_literal -> DATE_AND_TIME ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',134),
+  ('date_time_literal -> DATE_AND_TIME ( STRING_LITERAL NEWLINE )','date_time_literal',5,'p_date_time_literal','BaseParser.py',135),
+  ('date_time_literal -> DURATION ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',136),
+]
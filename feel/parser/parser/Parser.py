@@ -2,15 +2,14 @@ from feel.ErrorPrinters import missing_token_error
 from feel.lexer.Lexer import Lexer as Lexer
 from feel.parser import AST
 from feel.parser.common.BaseParser import BaseParser
+from feel.parser.common.ParserPool import ParserPool
 
 
 # noinspection PyMethodMayBeStatic
-from feel.parser.parser import parsetab
-from utils.PrintLogger import PrintLogger
-
-
 class Parser(BaseParser):
     tokens = Lexer.tokens
+    recovery_symbols = ('expression', 'textual_expression')
+    lexer_class = Lexer
 
     precedence = [
         ('right', 'function_definition_p', 'quantified_p', 'if_p', 'for_p'),
@@ -109,13 +108,13 @@ class Parser(BaseParser):
         p[0] = AST.PositiveUnaryTests(p[1])
 
     def p_many_positive_unary_tests(self, p):
-        """many_positive_unary_tests : positive_unary_test more_positive_unary_tests"""
-        p[0] = [p[1]] + p[2]
-
-    def p_more_positive_unary_tests(self, p):
-        """more_positive_unary_tests : empty_list empty_list
-                                     | ',' many_positive_unary_tests"""
-        p[0] = p[2]
+        """many_positive_unary_tests : positive_unary_test
+                                     | many_positive_unary_tests ',' positive_unary_test"""
+        if len(p) == 2:
+            p[0] = [p[1]]
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_par_textual_expression(self, p):
         """par_textual_expression : '(' textual_expression ')'"""
@@ -154,8 +153,9 @@ class Parser(BaseParser):
         p[0] = [(p[1], p[3])]
 
     def p_many_param_pairs(self, p):
-        """many_param_pairs : one_param_pair ',' named_parameters"""
-        p[0] = p[1] + p[3]
+        """many_param_pairs : named_parameters ',' parameter_name ':' expression"""
+        p[1].append((p[3], p[5]))
+        p[0] = p[1]
 
     # 43
     def p_parameter_name(self, p):
@@ -178,8 +178,9 @@ class Parser(BaseParser):
         p[0] = [p[1]]
 
     def p_many_expressions(self, p):
-        """many_expressions : single_expression ',' expressions"""
-        p[0] = p[1] + p[3]
+        """many_expressions : expressions ',' expression"""
+        p[1].append(p[3])
+        p[0] = p[1]
 
     # 45
     def p_path_expression(self, p):
@@ -208,13 +209,13 @@ class Parser(BaseParser):
 
     def p_missing_then_error(self, p):
         """missing_then_error : IF expression error ELSE"""
-        missing_token_error("missing 'then' branch in 'if' expression", p[3], self.logger)
+        self.diagnostics.report(missing_token_error("missing 'then' branch in 'if' expression", p[3], self.lexer.lexer))
         self.parser.errok()
         p[0] = AST.If(p[2], AST.Null(), AST.Null())
 
     def p_missing_else_error(self, p):
         """missing_else_error : IF expression THEN expression error"""
-        missing_token_error("missing 'else' branch in 'if' expression", p[5], self.logger)
+        self.diagnostics.report(missing_token_error("missing 'else' branch in 'if' expression", p[5], self.lexer.lexer))
         self.parser.errok()
         p[0] = AST.If(p[2], p[4], AST.Null())
 
@@ -222,7 +223,7 @@ class Parser(BaseParser):
     def p_quantified_expression(self, p):
         """quantified_expression : SOME  in_pairs SATISFIES expression %prec quantified_p
                                  | EVERY in_pairs SATISFIES expression %prec quantified_p"""
-        p[0] = AST.QuantifiedExpr(p.slice[1].type == 'SOME', p[2], p[4])
+        p[0] = AST.QuantifiedExpr(p[1] == 'some', p[2], p[4])
 
     def p_in_pairs(self, p):
         """in_pairs : one_in_pair
@@ -234,8 +235,9 @@ class Parser(BaseParser):
         p[0] = [(p[1], p[3])]
 
     def p_many_in_pairs(self, p):
-        """many_in_pairs : one_in_pair in_pairs"""
-        p[0] = p[1] + p[2]
+        """many_in_pairs : in_pairs name IN expression"""
+        p[1].append((p[2], p[4]))
+        p[0] = p[1]
 
     # 49
     def p_disjunction(self, p):
@@ -319,13 +321,14 @@ class Parser(BaseParser):
         p[0] = [p[1]]
 
     def p_many_formal_parameters(self, p):
-        """many_formal_parameters : formal_parameter ',' formal_parameters"""
-        p[0] = [p[1]] + p[3]
+        """many_formal_parameters : formal_parameters ',' formal_parameter"""
+        p[1].append(p[3])
+        p[0] = p[1]
 
     def p_external(self, p):
         """external : EXTERNAL
                     | empty_list"""
-        p[0] = p.slice[1].type == 'EXTERNAL'
+        p[0] = p[1] == 'external'
 
     # 58
     def p_formal_parameter(self, p):
@@ -349,14 +352,15 @@ class Parser(BaseParser):
         p[0] = [p[1]]
 
     def p_many_context_entries(self, p):
-        """many_context_entries : context_entry ',' context_entries"""
-        p[0] = [p[1]] + p[3]
+        """many_context_entries : context_entries ',' context_entry"""
+        p[1].append(p[3])
+        p[0] = p[1]
 
     def p_missing_comma_error(self, p):
-        """missing_comma_error : context_entry ',' error"""
-        missing_token_error('comma is missing in a context', p[3], self.logger)
+        """missing_comma_error : context_entries ',' error"""
+        self.diagnostics.report(missing_token_error('comma is missing in a context', p[3], self.lexer.lexer))
         self.parser.errok()
-        p[0] = []
+        p[0] = p[1]
 
     # 60
     def p_context_entry(self, p):
@@ -373,9 +377,13 @@ class Parser(BaseParser):
         """null : NULL"""
         p[0] = AST.Null()
 
-    def __init__(self, logger=PrintLogger(), **kwargs):
-        super(Parser, self).__init__(parsetab, logger, **kwargs)
-        self.lexer = Lexer()
+    # helper rules
+    def p_empty_list(self, p):
+        """empty_list : """
+        p[0] = []
+
+    def __init__(self, logger=None, **kwargs):
+        super(Parser, self).__init__('feel.parser.parser.parsetab', logger, **kwargs)
 
 
-parser = Parser()
+parser = ParserPool(Parser)
@@ -0,0 +1,170 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "rightfunction_definition_pquantified_pif_pfor_pleftORleftANDleft=NEQ<LTE>GTEcomparison_pleft+-left*/leftEXPONENTrightnegation_pleftINSTANCEleftpath_expression_pright.left[AND BETWEEN DATE DATE_AND_TIME DOTS DURATION ELSE EVERY EXPONENT EXTERNAL FALSE FOR FUNCTION GTE IF IN INSTANCE LTE NAME NEQ NEWLINE NULL NUMERIC_LITERAL OF OR RETURN SATISFIES SOME STRING_LITERAL THEN TIME TRUEexpression : textual_expression\n                      | boxes_expressionarithmetic_expression : binary_operators\n                                 | arithmetic_negationtextual_expression : for_expression\n                              | if_expression\n                              | quantified_expression\n                              | disjunction\n                              | conjunction\n                              | comparison\n                              | arithmetic_expression\n                              | instance_of\n                              | path_expression\n                              | filter_expression\n                              | function_invocation\n                              | literal\n                              | name\n                              | par_textual_expressionsimple_value : qualified_name\n                        | simple_literalqualified_name : name dot_namesdot_names :                    %prec INSTANCE\n                     | '.' name dot_names %prec path_expression_pbinary_operators : expression '+'      expression\n                            | expression '-'      expression\n                            | expression '*'      expression\n                            | expression '/'      expression\n                            | expression EXPONENT expressionsimple_positive_unary_test : endpoint\n                                      | op_endpoint\n                                      | intervalop_endpoint : '<' endpoint\n                       | GTE endpoint\n                       | '>' endpoint\n                       | LTE endpointarithmetic_negation : '-' expression %prec negation_pinterval : interval_starts endpoint DOTS endpoint interval_endsname : NAMEinterval_starts : '(' %prec comparison_p\n                           | ']' %prec comparison_p\n                           | '[' %prec comparison_psimple_literal : numeric_literal\n                          | string_literal\n                          | boolean_literal\n                          | date_time_literalstring_literal : STRING_LITERALinterval_ends : ')'\n                         | '['\n                         | ']'boolean_literal : TRUE\n                           | FALSEnumeric_literal : NUMERIC_LITERALpositive_unary_test : null\n                               | simple_positive_unary_testpositive_unary_tests : many_positive_unary_testsoperator : expression '=' expression\n                    | expression NEQ expression\n                    | expression '<' expression\n                    | expression LTE expression\n                    | expression '>' expression\n                    | expression GTE expressionmany_positive_unary_tests : positive_unary_test\n                                     | many_positive_unary_tests ',' positive_unary_testpar_textual_expression : '(' textual_expression ')'endpoint : simple_valuedate_time_literal : DATE          '(' STRING_LITERAL ')'\n                             | TIME          '(' STRING_LITERAL ')'\n                             | DATE_AND_TIME '(' STRING_LITERAL ')'\n                             | DATE_AND_TIME '(' STRING_LITERAL NEWLINE ')'\n                             | DURATION      '(' STRING_LITERAL ')'literal : simple_literal\n                   | nullfunction_invocation : expression parametersparameters : '(' positional_parameters ')'\n                      | '(' named_parameters      ')'named_parameters : one_param_pair\n                            | many_param_pairsone_param_pair : parameter_name ':' expressionmany_param_pairs : named_parameters ',' parameter_name ':' expressionparameter_name : namepositional_parameters : expressions\n                                 | empty_listexpressions : single_expression\n                       | many_expressionssingle_expression : expressionmany_expressions : expressions ',' expressionpath_expression : expression '.' namefor_expression : FOR in_pairs RETURN expression %prec for_pif_expression : valid_if\n                         | invalid_if_errorvalid_if : IF expression THEN expression ELSE expression %prec if_pinvalid_if_error : missing_then_error\n                            | missing_else_errormissing_then_error : IF expression error ELSEmissing_else_error : IF expression THEN expression errorquantified_expression : SOME  in_pairs SATISFIES expression %prec quantified_p\n                                 | EVERY in_pairs SATISFIES expression %prec quantified_pin_pairs : one_in_pair\n                    | many_in_pairsone_in_pair : name IN expressionmany_in_pairs : in_pairs name IN expressiondisjunction : expression OR expressionconjunction : expression AND expressioncomparison : operator\n                      | between\n                      | in1\n                      | in2between : between1 AND expression  %prec comparison_pbetween1 : expression BETWEEN expression %prec comparison_pin1 : expression IN positive_unary_test %prec comparison_pin2 : expression IN '(' positive_unary_tests ')' %prec comparison_pfilter_expression : expression '[' expression ']'instance_of : expression INSTANCE OF typetype : qualified_nameboxes_expression : list\n                            | function_definition\n                            | contextlist : '[' positional_parameters ']'function_definition : FUNCTION '(' empty_list        ')' external expression %prec function_definition_p\n                               | FUNCTION '(' formal_parameters ')' external expression %prec function_definition_pformal_parameters : single_formal_parameter\n                             | many_formal_parameterssingle_formal_parameter : formal_parametermany_formal_parameters : formal_parameters ',' formal_parameterexternal : EXTERNAL\n                    | empty_listformal_parameter : parameter_namecontext : '{' context_entries '}'\n                   | '{' empty_list      '}'context_entries : single_context_entry\n                           | many_context_entries\n                           | missing_comma_errorsingle_context_entry : context_entrymany_context_entries : context_entries ',' context_entrymissing_comma_error : context_entries ',' errorcontext_entry : key ':' expressionkey : name\n               | STRING_LITERALnull : NULLempty_list : "
+    
+_lr_action_items = {'FOR':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,199,200,219,220,221,222,224,230,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-140,-140,-126,21,-125,21,21,21,]),'SOME':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,199,200,219,220,221,222,224,230,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-140,-140,-126,24,-125,24,24,24,]),'EVERY':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,199,200,219,220,221,222,224,230,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-140,-140,-126,25,-125,25,25,25,]),'NAME':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,38,39,40,41,43,44,45,46,47,48,49,50,51,52,57,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,91,102,103,108,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,143,144,145,146,147,149,151,152,153,154,155,156,164,165,166,167,168,170,175,176,177,178,182,183,184,185,187,188,189,190,191,192,193,194,195,196,197,199,200,201,206,207,208,209,211,212,213,214,215,218,219,220,221,222,224,225,226,229,230,231,232,233,234,235,236,237,],[35,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,35,-89,-90,35,35,-104,-105,-106,-107,-3,-4,35,-71,-72,-38,35,35,35,-92,-93,35,-42,-43,-44,-45,-139,-52,-46,-50,-51,35,35,35,35,-73,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-98,-99,35,35,35,35,-36,-102,-103,35,-87,-56,-57,-58,-59,-60,-61,-110,-39,-53,-54,-29,-30,-31,-65,35,35,35,35,35,-19,-20,-40,-41,-22,-24,-25,-26,-27,-28,35,35,35,35,-118,35,-64,-128,35,-129,35,35,-108,-113,-114,-112,-39,-32,-33,-34,-35,-21,35,-74,-75,35,35,-88,35,-100,-96,-97,-140,-140,35,-94,-66,-67,-68,-70,-111,35,35,-22,-101,-126,35,-125,35,35,-95,-69,-23,35,-119,-120,-91,-37,-47,-48,-49,]),'(':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,32,33,34,35,36,37,39,40,41,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,88,89,90,101,102,103,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,149,151,152,153,154,155,156,164,166,167,168,170,175,176,177,182,183,184,185,187,189,190,192,193,194,195,196,197,198,199,200,204,205,206,207,208,209,211,212,213,215,217,218,219,220,221,222,224,225,226,229,230,231,232,233,234,235,236,237,238,],[36,70,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,36,-71,-72,-38,36,91,36,-92,-93,36,-42,-43,-44,-45,-139,-52,-46,-50,-51,104,105,106,107,36,36,36,-73,36,36,36,36,36,36,120,36,36,36,36,36,36,36,70,-1,70,70,36,-36,-102,-103,-87,70,-56,-57,-58,-59,-60,-61,-110,178,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,70,36,36,36,36,-118,36,-64,-128,-129,36,36,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,36,-88,36,70,-96,-97,70,-140,-140,70,70,-94,-66,-67,-68,-70,-111,178,-22,70,70,-126,36,-125,36,36,-95,-69,-23,36,-119,-120,-91,-37,-47,-48,-49,70,]),'[':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,32,33,34,35,36,39,40,41,43,44,45,46,47,48,49,50,51,52,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,88,89,90,101,102,103,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,149,151,152,153,154,155,156,164,166,167,168,170,175,176,177,182,183,184,185,187,189,190,192,193,194,195,196,197,198,199,200,204,205,206,207,208,209,211,212,213,215,217,218,219,220,221,222,224,225,226,228,229,230,231,232,233,234,235,236,237,238,],[32,61,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,32,-71,-72,-38,32,32,-92,-93,32,-42,-43,-44,-45,-139,-52,-46,-50,-51,32,32,32,-73,32,32,32,32,32,32,135,32,32,32,32,32,32,32,61,-1,61,61,32,61,61,61,-87,61,61,61,61,61,61,61,-110,135,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,61,61,61,61,61,61,32,32,32,32,-118,32,-64,-128,-129,32,32,61,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,32,61,32,61,61,61,61,-140,-140,61,61,-94,-66,-67,-68,-70,-111,135,-22,61,61,-126,32,-125,32,32,-95,-69,236,-23,32,61,61,61,-37,-47,-48,-49,61,]),'FUNCTION':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,199,200,219,220,221,222,224,230,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-140,-140,-126,37,-125,37,37,37,]),'{':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,199,200,219,220,221,222,224,230,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-140,-140,-126,38,-125,38,38,38,]),'IF':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,199,200,219,220,221,222,224,230,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-140,-140,-126,39,-125,39,39,39,]),'-':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,32,33,34,35,36,39,40,41,43,44,45,46,47,48,49,50,51,52,57,58,61,62,63,64,65,66,67,68,70,71,72,73,74,75,76,88,89,90,101,102,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,149,151,152,153,154,155,156,164,166,167,168,170,175,176,177,182,183,184,185,187,189,190,192,193,194,195,196,197,198,199,200,204,205,206,207,208,209,211,212,215,217,218,219,220,221,222,224,225,226,229,230,231,232,233,234,235,236,237,238,],[43,72,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,43,-71,-72,-38,43,43,-92,-93,43,-42,-43,-44,-45,-139,-52,-46,-50,-51,43,43,43,-73,43,43,43,43,43,43,43,43,43,43,43,43,43,72,-1,72,72,43,-36,72,72,-87,72,72,72,72,72,72,72,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,72,43,43,43,43,-118,43,-64,-128,-129,43,43,72,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,43,72,43,72,72,72,72,-140,-140,72,72,-94,-66,-67,-68,-70,-111,-22,72,72,-126,43,-125,43,43,-95,-69,-23,43,72,72,72,-37,-47,-48,-49,72,]),'NULL':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,149,151,152,153,155,167,168,192,194,199,200,213,219,220,221,222,224,230,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-140,-140,48,-126,48,-125,48,48,48,]),'NUMERIC_LITERAL':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,134,135,149,151,152,153,155,167,168,178,192,194,199,200,213,214,219,220,221,222,224,230,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-39,49,49,49,49,49,-40,-41,49,49,49,49,49,49,49,-39,49,49,-140,-140,49,49,-126,49,-125,49,49,49,]),'STRING_LITERAL':([0,32,36,38,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,104,105,106,107,120,127,128,129,130,131,134,135,149,151,152,153,155,165,167,168,178,192,194,199,200,213,214,219,220,221,222,224,230,],[50,50,50,100,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,171,172,173,174,-39,50,50,50,50,50,-40,-41,50,50,50,50,50,100,50,50,-39,50,50,-140,-140,50,50,-126,50,-125,50,50,50,]),'TRUE':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,134,135,149,151,152,153,155,167,168,178,192,194,199,200,213,214,219,220,221,222,224,230,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-39,51,51,51,51,51,-40,-41,51,51,51,51,51,51,51,-39,51,51,-140,-140,51,51,-126,51,-125,51,51,51,]),'FALSE':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,134,135,149,151,152,153,155,167,168,178,192,194,199,200,213,214,219,220,221,222,224,230,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-39,52,52,52,52,52,-40,-41,52,52,52,52,52,52,52,-39,52,52,-140,-140,52,52,-126,52,-125,52,52,52,]),'DATE':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,134,135,149,151,152,153,155,167,168,178,192,194,199,200,213,214,219,220,221,222,224,230,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-39,53,53,53,53,53,-40,-41,53,53,53,53,53,53,53,-39,53,53,-140,-140,53,53,-126,53,-125,53,53,53,]),'TIME':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,134,135,149,151,152,153,155,167,168,178,192,194,199,200,213,214,219,220,221,222,224,230,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-39,54,54,54,54,54,-40,-41,54,54,54,54,54,54,54,-39,54,54,-140,-140,54,54,-126,54,-125,54,54,54,]),'DATE_AND_TIME':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,134,135,149,151,152,153,155,167,168,178,192,194,199,200,213,214,219,220,221,222,224,230,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-39,55,55,55,55,55,-40,-41,55,55,55,55,55,55,55,-39,55,55,-140,-140,55,55,-126,55,-125,55,55,55,]),'DURATION':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,134,135,149,151,152,153,155,167,168,178,192,194,199,200,213,214,219,220,221,222,224,230,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-39,56,56,56,56,56,-40,-41,56,56,56,56,56,56,56,-39,56,56,-140,-140,56,56,-126,56,-125,56,56,56,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,103,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,143,144,145,146,147,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,196,197,206,207,208,209,211,212,215,225,226,229,231,232,233,234,235,236,237,],[0,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,-36,-102,-103,-87,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-24,-25,-26,-27,-28,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,-96,-97,-94,-66,-67,-68,-70,-111,-22,-95,-69,-23,-119,-120,-91,-37,-47,-48,-49,]),'OR':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[57,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,57,-1,57,57,-36,-102,-103,-87,57,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,57,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,57,57,57,57,57,57,57,-94,-66,-67,-68,-70,-111,-22,57,57,-95,-69,-23,57,57,57,-37,-47,-48,-49,57,]),'AND':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,42,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[58,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,102,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,58,-1,58,58,-36,58,-103,-87,58,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,-109,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,58,58,58,58,58,58,58,-94,-66,-67,-68,-70,-111,-22,58,58,-95,-69,-23,58,58,58,-37,-47,-48,-49,58,]),'INSTANCE':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[59,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,59,-1,59,59,59,59,59,-87,59,59,59,59,59,59,59,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,59,59,59,59,59,59,-118,-64,-128,-129,59,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,59,59,59,59,59,59,59,-94,-66,-67,-68,-70,-111,-22,59,59,-95,-69,-23,59,59,59,-37,-47,-48,-49,59,]),'.':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[60,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,60,-1,60,60,60,60,60,-87,60,60,60,60,60,60,60,-110,-53,-54,-29,-30,-31,-65,-19,-20,188,-17,60,60,60,60,60,60,-118,-64,-128,-129,60,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,60,60,60,60,60,60,60,-94,-66,-67,-68,-70,-111,188,60,60,-95,-69,-23,60,60,60,-37,-47,-48,-49,60,]),'=':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[63,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,63,-1,63,63,-36,63,63,-87,63,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,63,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,63,63,63,63,63,63,63,-94,-66,-67,-68,-70,-111,-22,63,63,-95,-69,-23,63,63,63,-37,-47,-48,-49,63,]),'NEQ':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[64,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,64,-1,64,64,-36,64,64,-87,64,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,64,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,64,64,64,64,64,64,64,-94,-66,-67,-68,-70,-111,-22,64,64,-95,-69,-23,64,64,64,-37,-47,-48,-49,64,]),'<':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,69,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,213,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[65,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,127,65,-1,65,65,-36,65,65,-87,65,-56,-57,-58,-59,-60,-61,-110,127,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,65,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,65,65,65,65,65,65,65,-94,-66,-67,-68,-70,-111,127,-22,65,65,-95,-69,-23,65,65,65,-37,-47,-48,-49,65,]),'LTE':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,69,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,213,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[66,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,130,66,-1,66,66,-36,66,66,-87,66,-56,-57,-58,-59,-60,-61,-110,130,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,66,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,66,66,66,66,66,66,66,-94,-66,-67,-68,-70,-111,130,-22,66,66,-95,-69,-23,66,66,66,-37,-47,-48,-49,66,]),'>':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,69,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,213,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[67,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,129,67,-1,67,67,-36,67,67,-87,67,-56,-57,-58,-59,-60,-61,-110,129,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,67,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,67,67,67,67,67,67,67,-94,-66,-67,-68,-70,-111,129,-22,67,67,-95,-69,-23,67,67,67,-37,-47,-48,-49,67,]),'GTE':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,69,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,213,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[68,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,128,68,-1,68,68,-36,68,68,-87,68,-56,-57,-58,-59,-60,-61,-110,128,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,68,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,68,68,68,68,68,68,68,-94,-66,-67,-68,-70,-111,128,-22,68,68,-95,-69,-23,68,68,68,-37,-47,-48,-49,68,]),'IN':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,80,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,150,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[69,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,151,69,-1,69,69,-36,-102,-103,-87,69,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,69,194,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,69,-96,-97,69,69,69,-94,-66,-67,-68,-70,-111,-22,69,69,-95,-69,-23,-119,-120,-91,-37,-47,-48,-49,69,]),'+':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[71,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,71,-1,71,71,-36,71,71,-87,71,71,71,71,71,71,71,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,71,-118,-64,-128,-129,71,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,71,71,71,71,71,71,71,-94,-66,-67,-68,-70,-111,-22,71,71,-95,-69,-23,71,71,71,-37,-47,-48,-49,71,]),'*':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[73,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,73,-1,73,73,-36,73,73,-87,73,73,73,73,73,73,73,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,73,73,-26,-27,-28,73,-118,-64,-128,-129,73,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,73,73,73,73,73,73,73,-94,-66,-67,-68,-70,-111,-22,73,73,-95,-69,-23,73,73,73,-37,-47,-48,-49,73,]),'/':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[74,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,74,-1,74,74,-36,74,74,-87,74,74,74,74,74,74,74,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,74,74,-26,-27,-28,74,-118,-64,-128,-129,74,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,74,74,74,74,74,74,74,-94,-66,-67,-68,-70,-111,-22,74,74,-95,-69,-23,74,74,74,-37,-47,-48,-49,74,]),'EXPONENT':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[75,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,75,-1,75,75,-36,75,75,-87,75,75,75,75,75,75,75,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,75,75,75,75,-28,75,-118,-64,-128,-129,75,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,75,75,75,75,75,75,75,-94,-66,-67,-68,-70,-111,-22,75,75,-95,-69,-23,75,75,75,-37,-47,-48,-49,75,]),'BETWEEN':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,88,89,90,101,103,108,109,111,112,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,142,143,144,145,146,147,148,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,198,204,205,206,207,208,209,211,212,215,217,218,225,226,229,231,232,233,234,235,236,237,238,],[76,-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,76,-1,76,76,-36,-102,-103,-87,76,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-17,-24,-25,-26,-27,-28,76,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,76,-96,-97,76,76,76,-94,-66,-67,-68,-70,-111,-22,76,76,-95,-69,-23,-119,-120,-91,-37,-47,-48,-49,76,]),',':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,84,86,87,88,92,94,95,96,97,103,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,138,139,140,142,143,144,145,146,147,154,156,158,159,160,161,162,163,164,166,170,175,176,177,180,181,182,183,184,185,187,189,190,193,196,197,198,202,203,204,206,207,208,209,211,212,215,217,223,225,226,227,229,231,232,233,234,235,236,237,238,],[-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,155,-83,-84,-85,165,-130,-131,-132,-133,-36,-102,-103,-87,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,191,-76,-77,-17,-24,-25,-26,-27,-28,-118,-64,201,-121,-122,-123,-127,-80,-128,-129,-108,-113,-114,-112,213,-62,-32,-33,-34,-35,-21,-74,-75,-88,-96,-97,-86,-134,-135,-136,-94,-66,-67,-68,-70,-111,-22,-78,-124,-95,-69,-63,-23,-119,-120,-91,-37,-47,-48,-49,-79,]),']':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,32,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,69,83,84,85,86,87,88,103,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,132,133,136,143,144,145,146,147,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,196,197,198,206,207,208,209,211,212,213,215,225,226,228,229,231,232,233,234,235,236,237,],[-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-140,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,134,154,-81,-82,-83,-84,-85,-36,-102,-103,-87,177,-56,-57,-58,-59,-60,-61,-110,134,-53,-54,-29,-30,-31,-65,-19,-20,-22,-24,-25,-26,-27,-28,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,-96,-97,-86,-94,-66,-67,-68,-70,-111,134,-22,-95,-69,237,-23,-119,-120,-91,-37,-47,-48,-49,]),'THEN':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,101,103,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,143,144,145,146,147,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,196,197,206,207,208,209,211,212,215,225,226,229,231,232,233,234,235,236,237,],[-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,168,-36,-102,-103,-87,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-24,-25,-26,-27,-28,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,-96,-97,-94,-66,-67,-68,-70,-111,-22,-95,-69,-23,-119,-120,-91,-37,-47,-48,-49,]),'error':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,101,103,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,143,144,145,146,147,154,156,164,165,166,170,175,176,177,182,183,184,185,187,189,190,193,196,197,205,206,207,208,209,211,212,215,225,226,229,231,232,233,234,235,236,237,],[-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,169,-36,-102,-103,-87,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-24,-25,-26,-27,-28,-118,-64,-128,203,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,-96,-97,225,-94,-66,-67,-68,-70,-111,-22,-95,-69,-23,-119,-120,-91,-37,-47,-48,-49,]),')':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,70,84,85,86,87,88,89,91,103,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,137,138,139,140,142,143,144,145,146,147,154,156,157,158,159,160,161,162,163,164,166,170,171,172,173,174,175,176,177,179,180,181,182,183,184,185,187,189,190,193,196,197,198,206,207,208,209,210,211,212,215,217,223,225,226,227,228,229,231,232,233,234,235,236,237,238,],[-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,-140,-81,-82,-83,-84,-85,156,-140,-36,-102,-103,-87,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,189,190,-76,-77,-17,-24,-25,-26,-27,-28,-118,-64,199,200,-121,-122,-123,-127,-80,-128,-129,-108,207,208,209,211,-113,-114,-112,212,-55,-62,-32,-33,-34,-35,-21,-74,-75,-88,-96,-97,-86,-94,-66,-67,-68,226,-70,-111,-22,-78,-124,-95,-69,-63,235,-23,-119,-120,-91,-37,-47,-48,-49,-79,]),'RETURN':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,77,78,79,103,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,143,144,145,146,147,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,206,207,208,209,211,212,215,218,225,226,229,231,232,233,234,235,236,237,],[-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,149,-98,-99,-36,-102,-103,-87,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-24,-25,-26,-27,-28,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,-100,-96,-97,-94,-66,-67,-68,-70,-111,-22,-101,-95,-69,-23,-119,-120,-91,-37,-47,-48,-49,]),'SATISFIES':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,78,79,81,82,103,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,143,144,145,146,147,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,195,196,197,206,207,208,209,211,212,215,218,225,226,229,231,232,233,234,235,236,237,],[-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,-98,-99,152,153,-36,-102,-103,-87,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-24,-25,-26,-27,-28,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,-100,-96,-97,-94,-66,-67,-68,-70,-111,-22,-101,-95,-69,-23,-119,-120,-91,-37,-47,-48,-49,]),'}':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,38,40,41,44,45,46,47,48,49,50,51,52,62,92,93,94,95,96,97,103,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,143,144,145,146,147,154,156,164,166,170,175,176,177,182,183,184,185,187,189,190,193,196,197,202,203,204,206,207,208,209,211,212,215,225,226,229,231,232,233,234,235,236,237,],[-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-140,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,164,166,-130,-131,-132,-133,-36,-102,-103,-87,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-24,-25,-26,-27,-28,-118,-64,-128,-129,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,-96,-97,-134,-135,-136,-94,-66,-67,-68,-70,-111,-22,-95,-69,-23,-119,-120,-91,-37,-47,-48,-49,]),'ELSE':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,26,27,28,29,30,31,33,34,35,40,41,44,45,46,47,48,49,50,51,52,62,103,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,126,132,133,136,143,144,145,146,147,154,156,164,166,169,170,175,176,177,182,183,184,185,187,189,190,193,196,197,205,206,207,208,209,211,212,215,225,226,229,231,232,233,234,235,236,237,],[-1,-2,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-115,-116,-117,-89,-90,-104,-105,-106,-107,-3,-4,-71,-72,-38,-92,-93,-42,-43,-44,-45,-139,-52,-46,-50,-51,-73,-36,-102,-103,-87,-56,-57,-58,-59,-60,-61,-110,-53,-54,-29,-30,-31,-65,-19,-20,-22,-24,-25,-26,-27,-28,-118,-64,-128,-129,206,-108,-113,-114,-112,-32,-33,-34,-35,-21,-74,-75,-88,-96,-97,224,-94,-66,-67,-68,-70,-111,-22,-95,-69,-23,-119,-120,-91,-37,-47,-48,-49,]),':':([35,98,99,100,141,142,163,216,],[-38,167,-137,-138,192,-80,-80,230,]),'DOTS':([35,44,45,46,47,49,50,51,52,126,132,133,136,186,187,207,208,209,211,215,226,229,],[-38,-42,-43,-44,-45,-52,-46,-50,-51,-65,-19,-20,-22,214,-21,-66,-67,-68,-70,-22,-69,-23,]),'OF':([59,],[110,]),'NEWLINE':([173,],[210,]),'EXTERNAL':([199,200,],[221,221,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[1,88,90,101,103,108,109,112,113,114,115,116,117,118,88,143,144,145,146,147,148,170,193,195,196,197,198,204,205,217,218,231,232,233,238,]),'textual_expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[2,2,89,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,]),'boxes_expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'for_expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'if_expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'quantified_expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'disjunction':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'conjunction':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'comparison':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'arithmetic_expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'instance_of':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'path_expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'filter_expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'function_invocation':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'literal':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'name':([0,21,24,25,32,36,38,39,43,57,58,60,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,81,82,91,102,110,120,127,128,129,130,131,149,151,152,153,155,165,167,168,188,191,192,194,201,213,214,220,222,224,230,],[16,80,80,80,16,16,99,16,16,16,16,111,16,16,16,16,16,16,16,136,142,16,16,16,16,16,16,150,150,150,163,16,136,136,136,136,136,136,136,16,16,16,16,16,99,16,16,215,163,16,16,163,136,136,16,16,16,16,]),'par_textual_expression':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'list':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'function_definition':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'context':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'valid_if':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'invalid_if_error':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'operator':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'between':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'in1':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'in2':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'binary_operators':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'arithmetic_negation':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'simple_literal':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,149,151,152,153,155,167,168,192,194,213,214,220,222,224,230,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,133,33,33,33,33,33,33,33,33,133,133,133,133,133,133,33,33,33,33,33,33,33,33,33,133,133,33,33,33,33,]),'null':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,149,151,152,153,155,167,168,192,194,213,220,222,224,230,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,121,34,34,34,34,34,34,34,34,121,34,34,34,34,34,34,34,34,34,121,34,34,34,34,]),'missing_then_error':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'missing_else_error':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'between1':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,70,71,72,73,74,75,76,102,149,151,152,153,155,167,168,192,194,220,222,224,230,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'numeric_literal':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,149,151,152,153,155,167,168,192,194,213,214,220,222,224,230,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'string_literal':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,149,151,152,153,155,167,168,192,194,213,214,220,222,224,230,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'boolean_literal':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,149,151,152,153,155,167,168,192,194,213,214,220,222,224,230,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'date_time_literal':([0,32,36,39,43,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,102,120,127,128,129,130,131,149,151,152,153,155,167,168,192,194,213,214,220,222,224,230,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'parameters':([1,88,90,101,103,108,109,112,113,114,115,116,117,118,143,144,145,146,147,148,170,193,195,196,197,198,204,205,217,218,231,232,233,238,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'in_pairs':([21,24,25,],[77,81,82,]),'one_in_pair':([21,24,25,],[78,78,78,]),'many_in_pairs':([21,24,25,],[79,79,79,]),'positional_parameters':([32,70,],[83,137,]),'expressions':([32,70,],[84,84,]),'empty_list':([32,38,70,91,199,200,],[85,93,85,157,219,219,]),'single_expression':([32,70,],[86,86,]),'many_expressions':([32,70,],[87,87,]),'context_entries':([38,],[92,]),'single_context_entry':([38,],[94,]),'many_context_entries':([38,],[95,]),'missing_comma_error':([38,],[96,]),'context_entry':([38,165,],[97,202,]),'key':([38,165,],[98,98,]),'positive_unary_test':([69,120,213,],[119,181,227,]),'simple_positive_unary_test':([69,120,213,],[122,122,122,]),'endpoint':([69,120,127,128,129,130,131,213,214,],[123,123,182,183,184,185,186,123,228,]),'op_endpoint':([69,120,213,],[124,124,124,]),'interval':([69,120,213,],[125,125,125,]),'simple_value':([69,120,127,128,129,130,131,213,214,],[126,126,126,126,126,126,126,126,126,]),'interval_starts':([69,120,213,],[131,131,131,]),'qualified_name':([69,110,120,127,128,129,130,131,213,214,],[132,176,132,132,132,132,132,132,132,132,]),'named_parameters':([70,],[138,]),'one_param_pair':([70,],[139,]),'many_param_pairs':([70,],[140,]),'parameter_name':([70,91,191,201,],[141,162,216,162,]),'formal_parameters':([91,],[158,]),'single_formal_parameter':([91,],[159,]),'many_formal_parameters':([91,],[160,]),'formal_parameter':([91,201,],[161,223,]),'type':([110,],[175,]),'positive_unary_tests':([120,],[179,]),'many_positive_unary_tests':([120,],[180,]),'dot_names':([136,215,],[187,229,]),'external':([199,200,],[220,222,]),'interval_ends':([228,],[234,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expression","S'",1,None,None,None),
+  ('expression -> textual_expression','expression',1,'p_expression','Parser.py',31),
+  ('expression -> boxes_expression','expression',1,'p_expression','Parser.py',32),
+  ('arithmetic_expression -> binary_operators','arithmetic_expression',1,'p_arithmetic_expression','BaseParser.py',33),
+  ('arithmetic_expression -> arithmetic_negation','arithmetic_expression',1,'p_arithmetic_expression','BaseParser.py',34),
+  ('textual_expression -> for_expression','textual_expression',1,'p_textual_expression','Parser.py',37),
+  ('textual_expression -> if_expression','textual_expression',1,'p_textual_expression','Parser.py',38),
+  ('textual_expression -> quantified_expression','textual_expression',1,'p_textual_expression','Parser.py',39),
+  ('textual_expression -> disjunction','textual_expression',1,'p_textual_expression','Parser.py',40),
+  ('textual_expression -> conjunction','textual_expression',1,'p_textual_expression','Parser.py',41),
+  ('textual_expression -> comparison','textual_expression',1,'p_textual_expression','Parser.py',42),
+  ('textual_expression -> arithmetic_expression','textual_expression',1,'p_textual_expression','Parser.py',43),
+  ('textual_expression -> instance_of','textual_expression',1,'p_textual_expression','Parser.py',44),
+  ('textual_expression -> path_expression','textual_expression',1,'p_textual_expression','Parser.py',45),
+  ('textual_expression -> filter_expression','textual_expression',1,'p_textual_expression','Parser.py',46),
+  ('textual_expression -> function_invocation','textual_expression',1,'p_textual_expression','Parser.py',47),
+  ('textual_expression -> literal','textual_expression',1,'p_textual_expression','Parser.py',48),
+  ('textual_expression -> name','textual_expression',1,'p_textual_expression','Parser.py',49),
+  ('textual_expression -> par_textual_expression','textual_expression',1,'p_textual_expression','Parser.py',50),
+  ('simple_value -> qualified_name','simple_value',1,'p_simple_value','BaseParser.py',39),
+  ('simple_value -> simple_literal','simple_value',1,'p_simple_value','BaseParser.py',40),
+  ('qualified_name -> name dot_names','qualified_name',2,'p_qualified_name','BaseParser.py',45),
+  ('dot_names -> <empty>','dot_names',0,'p_dot_names','BaseParser.py',49),
+  ('dot_names -> . name dot_names','dot_names',3,'p_dot_names','BaseParser.py',50),
+  ('binary_operators -> expression + expression','binary_operators',3,'p_binary_operators','BaseParser.py',55),
+  ('binary_operators -> expression - expression','binary_operators',3,'p_binary_operators','BaseParser.py',56),
+  ('binary_operators -> expression * expression','binary_operators',3,'p_binary_operators','BaseParser.py',57),
+  ('binary_operators -> expression / expression','binary_operators',3,'p_binary_operators','BaseParser.py',58),
+  ('binary_operators -> expression EXPONENT expression','binary_operators',3,'p_binary_operators','BaseParser.py',59),
+  ('simple_positive_unary_test -> endpoint','simple_positive_unary_test',1,'p_simple_positive_unary_test','Parser.py',55),
+  ('simple_positive_unary_test -> op_endpoint','simple_positive_unary_test',1,'p_simple_positive_unary_test','Parser.py',56),
+  ('simple_positive_unary_test -> interval','simple_positive_unary_test',1,'p_simple_positive_unary_test','Parser.py',57),
+  ('op_endpoint -> < endpoint','op_endpoint',2,'p_op_endpoint','Parser.py',61),
+  ('op_endpoint -> GTE endpoint','op_endpoint',2,'p_op_endpoint','Parser.py',62),
+  ('op_endpoint -> > endpoint','op_endpoint',2,'p_op_endpoint','Parser.py',63),
+  ('op_endpoint -> LTE endpoint','op_endpoint',2,'p_op_endpoint','Parser.py',64),
+  ('arithmetic_negation -> - expression','arithmetic_negation',2,'p_arithmetic_negation','BaseParser.py',71),
+  ('interval -> interval_starts endpoint DOTS endpoint interval_ends','interval',5,'p_interval','Parser.py',74),
+  ('name -> NAME','name',1,'p_name','BaseParser.py',76),
+  ('interval_starts -> (','interval_starts',1,'p_interval_starts','Parser.py',79),
+  ('interval_starts -> ]','interval_starts',1,'p_interval_starts','Parser.py',80),
+  ('interval_starts -> [','interval_starts',1,'p_interval_starts','Parser.py',81),
+  ('simple_literal -> numeric_literal','simple_literal',1,'p_simple_literal','BaseParser.py',81),
+  ('simple_literal -> string_literal','simple_literal',1,'p_simple_literal','BaseParser.py',82),
+  ('simple_literal -> boolean_literal','simple_literal',1,'p_simple_literal','BaseParser.py',83),
+  ('simple_literal -> date_time_literal','simple_literal',1,'p_simple_literal','BaseParser.py',84),
+  ('string_literal -> STRING_LITERAL','string_literal',1,'p_string_literal','BaseParser.py',89),
+  ('interval_ends -> )','interval_ends',1,'p_interval_ends','Parser.py',90),
+  ('interval_ends -> [','interval_ends',1,'p_interval_ends','Parser.py',91),
+  ('interval_ends -> ]','interval_ends',1,'p_interval_ends','Parser.py',92),
+  ('boolean_literal -> TRUE','boolean_literal',1,'p_boolean_literal','BaseParser.py',94),
+  ('boolean_literal -> FALSE','boolean_literal',1,'p_boolean_literal','BaseParser.py',95),
+  ('numeric_literal -> NUMERIC_LITERAL','numeric_literal',1,'p_numeric_literal','BaseParser.py',100),
+  ('positive_unary_test -> null','positive_unary_test',1,'p_positive_unary_test','Parser.py',101),
+  ('positive_unary_test -> simple_positive_unary_test','positive_unary_test',1,'p_positive_unary_test','Parser.py',102),
+  ('positive_unary_tests -> many_positive_unary_tests','positive_unary_tests',1,'p_positive_unary_tests','Parser.py',107),
+  ('operator -> expression = expression','operator',3,'p_operator','BaseParser.py',110),
+  ('operator -> expression NEQ expression','operator',3,'p_operator','BaseParser.py',111),
+  ('operator -> expression < expression','operator',3,'p_operator','BaseParser.py',112),
+  ('operator -> expression LTE expression','operator',3,'p_operator','BaseParser.py',113),
+  ('operator -> expression > expression','operator',3,'p_operator','BaseParser.py',114),
+  ('operator -> expression GTE expression','operator',3,'p_operator','BaseParser.py',115),
+  ('many_positive_unary_tests -> positive_unary_test','many_positive_unary_tests',1,'p_many_positive_unary_tests','Parser.py',111),
+  ('many_positive_unary_tests -> many_positive_unary_tests , positive_unary_test','many_positive_unary_tests',3,'p_many_positive_unary_tests','Parser.py',112),
+  ('par_textual_expression -> ( textual_expression )','par_textual_expression',3,'p_par_textual_expression','Parser.py',120),
+  ('endpoint -> simple_value','endpoint',1,'p_endpoint','Parser.py',125),
+  ('date_time_literal -> DATE ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',127),
+  ('date_time_literal -> TIME ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',128),
+  ('date_time_literal -> DATE_AND_TIME ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',129),
+  ('date_time_literal -> DATE_AND_TIME ( STRING_LITERAL NEWLINE )','date_time_literal',5,'p_date_time_literal','BaseParser.py',130),
+  ('date_time_literal -> DURATION ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',131),
+  ('literal -> simple_literal','literal',1,'p_literal','Parser.py',130),
+  ('literal -> null','literal',1,'p_literal','Parser.py',131),
+  ('function_invocation -> expression parameters','function_invocation',2,'p_function_invocation','Parser.py',136),
+  ('parameters -> ( positional_parameters )','parameters',3,'p_parameters','Parser.py',141),
+  ('parameters -> ( named_parameters )','parameters',3,'p_parameters','Parser.py',142),
+  ('named_parameters -> one_param_pair','named_parameters',1,'p_named_parameters','Parser.py',147),
+  ('named_parameters -> many_param_pairs','named_parameters',1,'p_named_parameters','Parser.py',148),
+  ('one_param_pair -> parameter_name : expression','one_param_pair',3,'p_one_param_pair','Parser.py',152),
+  ('many_param_pairs -> named_parameters , parameter_name : expression','many_param_pairs',5,'p_many_param_pairs','Parser.py',156),
+  ('parameter_name -> name','parameter_name',1,'p_parameter_name','Parser.py',162),
+  ('positional_parameters -> expressions','positional_parameters',1,'p_positional_parameters','Parser.py',167),
+  ('positional_parameters -> empty_list','positional_parameters',1,'p_positional_parameters','Parser.py',168),
+  ('expressions -> single_expression','expressions',1,'p_expressions','Parser.py',172),
+  ('expressions -> many_expressions','expressions',1,'p_expressions','Parser.py',173),
+  ('single_expression -> expression','single_expression',1,'p_single_expression','Parser.py',177),
+  ('many_expressions -> expressions , expression','many_expressions',3,'p_many_expressions','Parser.py',181),
+  ('path_expression -> expression . name','path_expression',3,'p_path_expression','Parser.py',187),
+  ('for_expression -> FOR in_pairs RETURN expression','for_expression',4,'p_for_expression','Parser.py',192),
+  ('if_expression -> valid_if','if_expression',1,'p_if_expression','Parser.py',197),
+  ('if_expression -> invalid_if_error','if_expression',1,'p_if_expression','Parser.py',198),
+  ('valid_if -> IF expression THEN expression ELSE expression','valid_if',6,'p_valid_if','Parser.py',202),
+  ('invalid_if_error -> missing_then_error','invalid_if_error',1,'p_invalid_if','Parser.py',206),
+  ('invalid_if_error -> missing_else_error','invalid_if_error',1,'p_invalid_if','Parser.py',207),
+  ('missing_then_error -> IF expression error ELSE','missing_then_error',4,'p_missing_then_error','Parser.py',211),
+  ('missing_else_error -> IF expression THEN expression error','missing_else_error',5,'p_missing_else_error','Parser.py',217),
+  ('quantified_expression -> SOME in_pairs SATISFIES expression','quantified_expression',4,'p_quantified_expression','Parser.py',224),
+  ('quantified_expression -> EVERY in_pairs SATISFIES expression','quantified_expression',4,'p_quantified_expression','Parser.py',225),
+  ('in_pairs -> one_in_pair','in_pairs',1,'p_in_pairs','Parser.py',229),
+  ('in_pairs -> many_in_pairs','in_pairs',1,'p_in_pairs','Parser.py',230),
+  ('one_in_pair -> name IN expression','one_in_pair',3,'p_one_in_pair','Parser.py',234),
+  ('many_in_pairs -> in_pairs name IN expression','many_in_pairs',4,'p_many_in_pairs','Parser.py',238),
+  ('disjunction -> expression OR expression','disjunction',3,'p_disjunction','Parser.py',244),
+  ('conjunction -> expression AND expression','conjunction',3,'p_conjunction','Parser.py',249),
+  ('comparison -> operator','comparison',1,'p_comparison','Parser.py',254),
+  ('comparison -> between','comparison',1,'p_comparison','Parser.py',255),
+  ('comparison -> in1','comparison',1,'p_comparison','Parser.py',256),
+  ('comparison -> in2','comparison',1,'p_comparison','Parser.py',257),
+  ('between -> between1 AND expression','between',3,'p_between','Parser.py',262),
+  ('between1 -> expression BETWEEN expression','between1',3,'p_between1','Parser.py',268),
+  ('in1 -> expression IN positive_unary_test','in1',3,'p_in1','Parser.py',273),
+  ('in2 -> expression IN ( positive_unary_tests )','in2',5,'p_in2','Parser.py',278),
+  ('filter_expression -> expression [ expression ]','filter_expression',4,'p_filter_expression','Parser.py',283),
+  ('instance_of -> expression INSTANCE OF type','instance_of',4,'p_instance_of','Parser.py',288),
+  ('type -> qualified_name','type',1,'p_type','Parser.py',293),
+  ('boxes_expression -> list','boxes_expression',1,'p_boxes_expression','Parser.py',298),
+  ('boxes_expression -> function_definition','boxes_expression',1,'p_boxes_expression','Parser.py',299),
+  ('boxes_expression -> context','boxes_expression',1,'p_boxes_expression','Parser.py',300),
+  ('list -> [ positional_parameters ]','list',3,'p_list','Parser.py',305),
+  ('function_definition -> FUNCTION ( empty_list ) external expression','function_definition',6,'p_function_definition','Parser.py',310),
+  ('function_definition -> FUNCTION ( formal_parameters ) external expression','function_definition',6,'p_function_definition','Parser.py',311),
+  ('formal_parameters -> single_formal_parameter','formal_parameters',1,'p_formal_parameters','Parser.py',315),
+  ('formal_parameters -> many_formal_parameters','formal_parameters',1,'p_formal_parameters','Parser.py',316),
+  ('single_formal_parameter -> formal_parameter','single_formal_parameter',1,'p_single_formal_parameter','Parser.py',320),
+  ('many_formal_parameters -> formal_parameters , formal_parameter','many_formal_parameters',3,'p_many_formal_parameters','Parser.py',324),
+  ('external -> EXTERNAL','external',1,'p_external','Parser.py',329),
+  ('external -> empty_list','external',1,'p_external','Parser.py',330),
+  ('formal_parameter -> parameter_name','formal_parameter',1,'p_formal_parameter','Parser.py',335),
+  ('context -> { context_entries }','context',3,'p_context','Parser.py',340),
+  ('context -> { empty_list }','context',3,'p_context','Parser.py',341),
+  ('context_entries -> single_context_entry','context_entries',1,'p_context_entries','Parser.py',345),
+  ('context_entries -> many_context_entries','context_entries',1,'p_context_entries','Parser.py',346),
+  ('context_entries -> missing_comma_error','context_entries',1,'p_context_entries','Parser.py',347),
+  ('single_context_entry -> context_entry','single_context_entry',1,'p_single_context_entry','Parser.py',351),
+  ('many_context_entries -> context_entries , context_entry','many_context_entries',3,'p_many_context_entries','Parser.py',355),
+  ('missing_comma_error -> context_entries , error','missing_comma_error',3,'p_missing_comma_error','Parser.py',360),
+  ('context_entry -> key : expression','context_entry',3,'p_context_entry','Parser.py',367),
+  ('key -> name','key',1,'p_key','Parser.py',372),
+  ('key -> STRING_LITERAL','key',1,'p_key','Parser.py',373),
+  ('null -> NULL','null',1,'p_null','Parser.py',377),
+  ('empty_list -> <empty>','empty_list',0,'p_empty_list','Parser.py',382),
+]
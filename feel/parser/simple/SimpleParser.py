@@ -1,13 +1,15 @@
+from feel.Diagnostics import Diagnostics, ParseResult
+from feel.ErrorPrinters import limit_error
+from feel.Limits import LimitExceeded
 from feel.lexer.BaseLexer import BaseLexer
 from feel.parser import AST
 from feel.parser.common.BaseParser import BaseParser
+from feel.parser.common.ParserPool import ParserPool
+from feel.parser.common.Spans import shift_spans
+from feel.parser.common.Streaming import split
 
 
 # noinspection PyMethodMayBeStatic
-from feel.parser.simple import parsetab
-from utils.PrintLogger import PrintLogger
-
-
 class SimpleParser(BaseParser):
     tokens = BaseLexer.tokens
 
@@ -41,16 +43,39 @@ class SimpleParser(BaseParser):
         p[0] = AST.SimpleExpressions(p[1])
 
     def p_many_simple_expressions(self, p):
-        """many_simple_expressions : expression more_simple_expressions"""
-        p[0] = [p[1]] + p[2]
+        """many_simple_expressions : expression
+                                   | many_simple_expressions ',' expression"""
+        if len(p) == 2:
+            p[0] = [p[1]]
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
+
+    def __init__(self, logger=None, **kwargs):
+        super(SimpleParser, self).__init__('feel.parser.simple.parsetab', logger, start='simple_expressions', **kwargs)
 
-    def p_more_simple_expressions(self, p):
-        """more_simple_expressions : empty_list empty_list
-                                   | ',' many_simple_expressions"""
-        p[0] = p[2]
+    def iterparse(self, source):
+        """Parses simple expressions from a file object or an iterable of text chunks, one at a time.
 
-    def __init__(self, logger=PrintLogger(), **kwargs):
-        super(SimpleParser, self).__init__(parsetab, logger, start='simple_expressions', **kwargs)
+        Yields a ``ParseResult(tree, diagnostics)`` for every top-level expression as soon as the comma
+        after it is read, as ``diagnose`` gives it for that expression: the diagnostics are its own, and
+        the tree is what ``parse`` returns, so an expression with errors may still have the partial tree
+        yacc recovered. Memory is bounded by the longest expression, not by the size of the input. Spans
+        are offsets in the whole input.
+        """
+        line, offset = 1, 0
+        try:
+            for piece in split(source, self.limits):
+                result = self.parse(piece, lineno=line)
+                if offset and result is not None and self.spans:
+                    shift_spans(result, offset)
+                line += piece.count('\n')
+                offset += len(piece) + 1
+                yield ParseResult(None if result is None else result.value[0], self.diagnostics)
+        except LimitExceeded as e:
+            self.lexer.diagnostics = Diagnostics(self.logger)
+            self.diagnostics.report(limit_error(e))
+            yield ParseResult(None, self.diagnostics)
 
 
-parser = SimpleParser()
+parser = ParserPool(SimpleParser)
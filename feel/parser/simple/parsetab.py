@@ -0,0 +1,71 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "simple_expressionsleft=NEQ<LTE>GTEleft,left+-left*/leftEXPONENTrightnegation_pleftINSTANCEleftpath_expression_pright.DATE DATE_AND_TIME DURATION EXPONENT FALSE GTE LTE NAME NEQ NEWLINE NUMERIC_LITERAL STRING_LITERAL TIME TRUEexpression : simple_expressionarithmetic_expression : binary_operators\n                                 | arithmetic_negationsimple_expression : arithmetic_expression\n                             | simple_value\n                             | comparisonsimple_value : qualified_name\n                        | simple_literalsimple_expressions : many_simple_expressionsqualified_name : name dot_namesmany_simple_expressions : expression\n                                   | many_simple_expressions ',' expressiondot_names :                    %prec INSTANCE\n                     | '.' name dot_names %prec path_expression_pbinary_operators : expression '+'      expression\n                            | expression '-'      expression\n                            | expression '*'      expression\n                            | expression '/'      expression\n                            | expression EXPONENT expressionarithmetic_negation : '-' expression %prec negation_pname : NAMEsimple_literal : numeric_literal\n                          | string_literal\n                          | boolean_literal\n                          | date_time_literalstring_literal : STRING_LITERALboolean_literal : TRUE\n                           | FALSEnumeric_literal : NUMERIC_LITERALcomparison : operatoroperator : expression '=' expression\n                    | expression NEQ expression\n                    | expression '<' expression\n                    | expression LTE expression\n                    | expression '>' expression\n                    | expression GTE expressiondate_time_literal : DATE          '(' STRING_LITERAL ')'\n                             | TIME          '(' STRING_LITERAL ')'\n                             | DATE_AND_TIME '(' STRING_LITERAL ')'\n                             | DATE_AND_TIME '(' STRING_LITERAL NEWLINE ')'\n                             | DURATION      '(' STRING_LITERAL ')'"
+    
+_lr_action_items = {'-':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,28,29,30,31,32,33,34,35,36,37,38,39,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[13,30,-1,-4,-5,-6,-2,-3,-7,-8,-30,13,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,13,13,13,13,13,13,13,13,13,13,13,13,-20,-10,30,-15,-16,-17,-18,-19,30,30,30,30,30,30,-13,-14,-37,-38,-39,-41,-40,]),'NAME':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,42,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'NUMERIC_LITERAL':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'STRING_LITERAL':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,43,44,45,46,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,60,61,62,63,]),'TRUE':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'FALSE':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'DATE':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'TIME':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'DATE_AND_TIME':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'DURATION':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[0,-9,-11,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,-12,-15,-16,-17,-18,-19,-31,-32,-33,-34,-35,-36,-13,-14,-37,-38,-39,-41,-40,]),',':([2,3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[28,-11,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,-12,-15,-16,-17,-18,-19,-31,-32,-33,-34,-35,-36,-13,-14,-37,-38,-39,-41,-40,]),'+':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[29,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,29,-15,-16,-17,-18,-19,29,29,29,29,29,29,-13,-14,-37,-38,-39,-41,-40,]),'*':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[31,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,31,31,31,-17,-18,-19,31,31,31,31,31,31,-13,-14,-37,-38,-39,-41,-40,]),'/':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[32,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,32,32,32,-17,-18,-19,32,32,32,32,32,32,-13,-14,-37,-38,-39,-41,-40,]),'EXPONENT':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[33,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,33,33,33,33,33,-19,33,33,33,33,33,33,-13,-14,-37,-38,-39,-41,-40,]),'=':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[34,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,34,-15,-16,-17,-18,-19,-31,-32,-33,-34,-35,-36,-13,-14,-37,-38,-39,-41,-40,]),'NEQ':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[35,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,35,-15,-16,-17,-18,-19,-31,-32,-33,-34,-35,-36,-13,-14,-37,-38,-39,-41,-40,]),'<':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[36,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,36,-15,-16,-17,-18,-19,-31,-32,-33,-34,-35,-36,-13,-14,-37,-38,-39,-41,-40,]),'LTE':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[37,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,37,-15,-16,-17,-18,-19,-31,-32,-33,-34,-35,-36,-13,-14,-37,-38,-39,-41,-40,]),'>':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[38,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,38,-15,-16,-17,-18,-19,-31,-32,-33,-34,-35,-36,-13,-14,-37,-38,-39,-41,-40,]),'GTE':([3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,40,41,47,48,49,50,51,52,53,54,55,56,57,58,59,64,65,66,67,69,70,],[39,-1,-4,-5,-6,-2,-3,-7,-8,-30,-13,-22,-23,-24,-25,-21,-29,-26,-27,-28,-20,-10,39,-15,-16,-17,-18,-19,-31,-32,-33,-34,-35,-36,-13,-14,-37,-38,-39,-41,-40,]),'.':([14,19,59,],[42,-21,42,]),'(':([24,25,26,27,],[43,44,45,46,]),')':([60,61,62,63,68,],[65,66,67,69,70,]),'NEWLINE':([62,],[68,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'simple_expressions':([0,],[1,]),'many_simple_expressions':([0,],[2,]),'expression':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[3,40,47,48,49,50,51,52,53,54,55,56,57,58,]),'simple_expression':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'arithmetic_expression':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'simple_value':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'comparison':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'binary_operators':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'arithmetic_negation':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'qualified_name':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'simple_literal':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'operator':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'name':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,42,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,59,]),'numeric_literal':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'string_literal':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'boolean_literal':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'date_time_literal':([0,13,28,29,30,31,32,33,34,35,36,37,38,39,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'dot_names':([14,59,],[41,64,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> simple_expressions","S'",1,None,None,None),
+  ('expression -> simple_expression','expression',1,'p_expression','SimpleParser.py',29),
+  ('arithmetic_expression -> binary_operators','arithmetic_expression',1,'p_arithmetic_expression','BaseParser.py',33),
+  ('arithmetic_expression -> arithmetic_negation','arithmetic_expression',1,'p_arithmetic_expression','BaseParser.py',34),
+  ('simple_expression -> arithmetic_expression','simple_expression',1,'p_simple_expression','SimpleParser.py',34),
+  ('simple_expression -> simple_value','simple_expression',1,'p_simple_expression','SimpleParser.py',35),
+  ('simple_expression -> comparison','simple_expression',1,'p_simple_expression','SimpleParser.py',36),
+  ('simple_value -> qualified_name','simple_value',1,'p_simple_value','BaseParser.py',39),
+  ('simple_value -> simple_literal','simple_value',1,'p_simple_value','BaseParser.py',40),
+  ('simple_expressions -> many_simple_expressions','simple_expressions',1,'p_simple_expressions','SimpleParser.py',41),
+  ('qualified_name -> name dot_names','qualified_name',2,'p_qualified_name','BaseParser.py',45),
+  ('many_simple_expressions -> expression','many_simple_expressions',1,'p_many_simple_expressions','SimpleParser.py',45),
+  ('many_simple_expressions -> many_simple_expressions , expression','many_simple_expressions',3,'p_many_simple_expressions','SimpleParser.py',46),
+  ('dot_names -> <empty>','dot_names',0,'p_dot_names','BaseParser.py',49),
+  ('dot_names -> . name dot_names','dot_names',3,'p_dot_names','BaseParser.py',50),
+  ('binary_operators -> expression + expression','binary_operators',3,'p_binary_operators','BaseParser.py',55),
+  ('binary_operators -> expression - expression','binary_operators',3,'p_binary_operators','BaseParser.py',56),
+  ('binary_operators -> expression * expression','binary_operators',3,'p_binary_operators','BaseParser.py',57),
+  ('binary_operators -> expression / expression','binary_operators',3,'p_binary_operators','BaseParser.py',58),
+  ('binary_operators -> expression EXPONENT expression','binary_operators',3,'p_binary_operators','BaseParser.py',59),
+  ('arithmetic_negation -> - expression','arithmetic_negation',2,'p_arithmetic_negation','BaseParser.py',71),
+  ('name -> NAME','name',1,'p_name','BaseParser.py',76),
+  ('simple_literal -> numeric_literal','simple_literal',1,'p_simple_literal','BaseParser.py',81),
+  ('simple_literal -> string_literal','simple_literal',1,'p_simple_literal','BaseParser.py',82),
+  ('simple_literal -> boolean_literal','simple_literal',1,'p_simple_literal','BaseParser.py',83),
+  ('simple_literal -> date_time_literal','simple_literal',1,'p_simple_literal','BaseParser.py',84),
+  ('string_literal -> STRING_LITERAL','string_literal',1,'p_string_literal','BaseParser.py',89),
+  ('boolean_literal -> TRUE','boolean_literal',1,'p_boolean_literal','BaseParser.py',94),
+  ('boolean_literal -> FALSE','boolean_literal',1,'p_boolean_literal','BaseParser.py',95),
+  ('numeric_literal -> NUMERIC_LITERAL','numeric_literal',1,'p_numeric_literal','BaseParser.py',100),
+  ('comparison -> operator','comparison',1,'p_comparison','BaseParser.py',105),
+  ('operator -> expression = expression','operator',3,'p_operator','BaseParser.py',110),
+  ('operator -> expression NEQ expression','operator',3,'p_operator','BaseParser.py',111),
+  ('operator -> expression < expression','operator',3,'p_operator','BaseParser.py',112),
+  ('operator -> expression LTE expression','operator',3,'p_operator','BaseParser.py',113),
+  ('operator -> expression > expression','operator',3,'p_operator','BaseParser.py',114),
+  ('operator -> expression GTE expression','operator',3,'p_operator','BaseParser.py',115),
+  ('date_time_literal -> DATE ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',127),
+  ('date_time_literal -> TIME ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',128),
+  ('date_time_literal -> DATE_AND_TIME ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',129),
+  ('date_time_literal -> DATE_AND_TIME ( STRING_LITERAL NEWLINE )','date_time_literal',5,'p_date_time_literal','BaseParser.py',130),
+  ('date_time_literal -> DURATION ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','BaseParser.py',131),
+]
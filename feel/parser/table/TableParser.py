@@ -1,16 +1,14 @@
-from ply import yacc
-
-from feel.ErrorPrinters import unexpected_token
 from feel.lexer.TableLexer import TableLexer
 from feel.parser import AST
-from feel.parser.table import parsetab
-
-from utils.PrintLogger import PrintLogger
+from feel.parser.common.CommonParser import CommonParser
+from feel.parser.common.ParserPool import ParserPool
 
 
 # noinspection PyMethodMayBeStatic
-class TableParser(object):
+class TableParser(CommonParser):
     tokens = TableLexer.tokens
+    recovery_symbols = ('positive_unary_test', 'endpoint')
+    lexer_class = TableLexer
     precedence = [
         ('left', 'comparison_p'),
         ('left', 'INSTANCE'),
@@ -75,13 +73,13 @@ class TableParser(object):
         p[0] = AST.PositiveUnaryTests(p[1])
 
     def p_many_positive_unary_tests(self, p):
-        """many_positive_unary_tests : positive_unary_test more_positive_unary_tests"""
-        p[0] = [p[1]] + p[2]
-
-    def p_more_positive_unary_tests(self, p):
-        """more_positive_unary_tests : empty_list empty_list
-                                     | ',' many_positive_unary_tests"""
-        p[0] = p[2]
+        """many_positive_unary_tests : positive_unary_test
+                                     | many_positive_unary_tests ',' positive_unary_test"""
+        if len(p) == 2:
+            p[0] = [p[1]]
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
 
     # 17
     def p_unary_tests(self, p):
@@ -119,7 +117,7 @@ class TableParser(object):
     def p_dot_names(self, p):
         """dot_names :                    %prec INSTANCE
                      | '.' name dot_names %prec path_expression_p"""
-        p[0] = [p[2]] + p[3] if len(p.slice) == 4 else []
+        p[0] = [p[2]] + p[3] if len(p) == 4 else []
 
     # 27-32
     def p_name(self, p):
@@ -165,27 +163,12 @@ class TableParser(object):
         }[p[1]](p[3])
 
     # helper rules
-    def p_empty_list(self, p):
-        """empty_list : """
-        p[0] = []
-
     def p_null(self, p):
         """null : NULL"""
         p[0] = AST.Null()
 
-    def p_error(self, p):
-        if p:
-            unexpected_token(p, self.logger)
-        else:
-            self.logger.log('unexpected end of file')
-
-    def __init__(self, logger=PrintLogger(), **kwargs):
-        self.logger = logger
-        self.lexer = TableLexer()
-        self.parser = yacc.yacc(tabmodule=parsetab, module=self, start='unary_tests', **kwargs)
-
-    def parse(self, *args, **kwargs):
-        return self.parser.parse(*args, lexer=self.lexer.lexer, **kwargs)
+    def __init__(self, logger=None, **kwargs):
+        super(TableParser, self).__init__('feel.parser.table.parsetab', logger, start='unary_tests', **kwargs)
 
 
-parser = TableParser()
+parser = ParserPool(TableParser)
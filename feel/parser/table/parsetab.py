@@ -0,0 +1,75 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "unary_testsleftcomparison_pleftINSTANCEleftpath_expression_pDATE DATE_AND_TIME DOTS DURATION FALSE GTE LTE NAME NEWLINE NOT NULL NUMERIC_LITERAL STRING_LITERAL TIME TRUEsimple_positive_unary_test : endpoint\n                                      | op_endpoint\n                                      | intervalop_endpoint : '<' endpoint\n                       | GTE endpoint\n                       | '>' endpoint\n                       | LTE endpointinterval : interval_starts endpoint DOTS endpoint interval_endsinterval_starts : '(' %prec comparison_p\n                           | ']' %prec comparison_p\n                           | '[' %prec comparison_pinterval_ends : ')'\n                         | '['\n                         | ']'positive_unary_test : null\n                               | simple_positive_unary_testpositive_unary_tests : many_positive_unary_testsmany_positive_unary_tests : positive_unary_test\n                                     | many_positive_unary_tests ',' positive_unary_testunary_tests : positive_unary_tests\n                       | not_positive_unary_tests\n                       | no_testsnot_positive_unary_tests : NOT '(' positive_unary_tests ')'no_tests : '-'endpoint : simple_valuesimple_value : qualified_name\n                        | simple_literalqualified_name : name dot_namesdot_names :                    %prec INSTANCE\n                     | '.' name dot_names %prec path_expression_pname : NAMEsimple_literal : numeric_literal\n                          | string_literal\n                          | boolean_literal\n                          | date_time_literalstring_literal : STRING_LITERALboolean_literal : TRUE\n                           | FALSEnumeric_literal : NUMERIC_LITERALdate_time_literal : DATE          '(' STRING_LITERAL ')'\n                             | TIME          '(' STRING_LITERAL ')'\n                             | DATE_AND_TIME '(' STRING_LITERAL ')'\n                             | DATE_AND_TIME '(' STRING_LITERAL NEWLINE ')'\n                             | DURATION      '(' STRING_LITERAL ')'null : NULL"
+    
+_lr_action_items = {'NOT':([0,],[6,]),'-':([0,],[8,]),'NULL':([0,40,41,],[12,12,12,]),'<':([0,40,41,],[17,17,17,]),'GTE':([0,40,41,],[18,18,18,]),'>':([0,40,41,],[19,19,19,]),'LTE':([0,40,41,],[20,20,20,]),'(':([0,6,36,37,38,39,40,41,],[7,41,49,50,51,52,7,7,]),']':([0,16,22,23,26,27,28,29,30,31,32,33,34,35,40,41,47,56,62,63,64,65,66,68,73,],[24,-25,-26,-27,-29,-32,-33,-34,-35,-31,-39,-36,-37,-38,24,24,-28,-29,72,-30,-40,-41,-42,-44,-43,]),'[':([0,16,22,23,26,27,28,29,30,31,32,33,34,35,40,41,47,56,62,63,64,65,66,68,73,],[25,-25,-26,-27,-29,-32,-33,-34,-35,-31,-39,-36,-37,-38,25,25,-28,-29,71,-30,-40,-41,-42,-44,-43,]),'NAME':([0,7,17,18,19,20,21,24,25,40,41,48,55,],[31,-9,31,31,31,31,31,-10,-11,31,31,31,31,]),'NUMERIC_LITERAL':([0,7,17,18,19,20,21,24,25,40,41,55,],[32,-9,32,32,32,32,32,-10,-11,32,32,32,]),'STRING_LITERAL':([0,7,17,18,19,20,21,24,25,40,41,49,50,51,52,55,],[33,-9,33,33,33,33,33,-10,-11,33,33,57,58,59,60,33,]),'TRUE':([0,7,17,18,19,20,21,24,25,40,41,55,],[34,-9,34,34,34,34,34,-10,-11,34,34,34,]),'FALSE':([0,7,17,18,19,20,21,24,25,40,41,55,],[35,-9,35,35,35,35,35,-10,-11,35,35,35,]),'DATE':([0,7,17,18,19,20,21,24,25,40,41,55,],[36,-9,36,36,36,36,36,-10,-11,36,36,36,]),'TIME':([0,7,17,18,19,20,21,24,25,40,41,55,],[37,-9,37,37,37,37,37,-10,-11,37,37,37,]),'DATE_AND_TIME':([0,7,17,18,19,20,21,24,25,40,41,55,],[38,-9,38,38,38,38,38,-10,-11,38,38,38,]),'DURATION':([0,7,17,18,19,20,21,24,25,40,41,55,],[39,-9,39,39,39,39,39,-10,-11,39,39,39,]),'$end':([1,2,3,4,5,8,9,10,11,12,13,14,15,16,22,23,26,27,28,29,30,31,32,33,34,35,42,43,44,45,47,53,56,61,63,64,65,66,68,69,70,71,72,73,],[0,-20,-21,-22,-17,-24,-18,-15,-16,-45,-1,-2,-3,-25,-26,-27,-29,-32,-33,-34,-35,-31,-39,-36,-37,-38,-4,-5,-6,-7,-28,-19,-29,-23,-30,-40,-41,-42,-44,-8,-12,-13,-14,-43,]),')':([5,9,10,11,12,13,14,15,16,22,23,26,27,28,29,30,31,32,33,34,35,42,43,44,45,47,53,54,56,57,58,59,60,62,63,64,65,66,67,68,69,70,71,72,73,],[-17,-18,-15,-16,-45,-1,-2,-3,-25,-26,-27,-29,-32,-33,-34,-35,-31,-39,-36,-37,-38,-4,-5,-6,-7,-28,-19,61,-29,64,65,66,68,70,-30,-40,-41,-42,73,-44,-8,-12,-13,-14,-43,]),',':([5,9,10,11,12,13,14,15,16,22,23,26,27,28,29,30,31,32,33,34,35,42,43,44,45,47,53,56,63,64,65,66,68,69,70,71,72,73,],[40,-18,-15,-16,-45,-1,-2,-3,-25,-26,-27,-29,-32,-33,-34,-35,-31,-39,-36,-37,-38,-4,-5,-6,-7,-28,-19,-29,-30,-40,-41,-42,-44,-8,-12,-13,-14,-43,]),'DOTS':([16,22,23,26,27,28,29,30,31,32,33,34,35,46,47,56,63,64,65,66,68,73,],[-25,-26,-27,-29,-32,-33,-34,-35,-31,-39,-36,-37,-38,55,-28,-29,-30,-40,-41,-42,-44,-43,]),'.':([26,31,56,],[48,-31,48,]),'NEWLINE':([59,],[67,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'unary_tests':([0,],[1,]),'positive_unary_tests':([0,41,],[2,54,]),'not_positive_unary_tests':([0,],[3,]),'no_tests':([0,],[4,]),'many_positive_unary_tests':([0,41,],[5,5,]),'positive_unary_test':([0,40,41,],[9,53,9,]),'null':([0,40,41,],[10,10,10,]),'simple_positive_unary_test':([0,40,41,],[11,11,11,]),'endpoint':([0,17,18,19,20,21,40,41,55,],[13,42,43,44,45,46,13,13,62,]),'op_endpoint':([0,40,41,],[14,14,14,]),'interval':([0,40,41,],[15,15,15,]),'simple_value':([0,17,18,19,20,21,40,41,55,],[16,16,16,16,16,16,16,16,16,]),'interval_starts':([0,40,41,],[21,21,21,]),'qualified_name':([0,17,18,19,20,21,40,41,55,],[22,22,22,22,22,22,22,22,22,]),'simple_literal':([0,17,18,19,20,21,40,41,55,],[23,23,23,23,23,23,23,23,23,]),'name':([0,17,18,19,20,21,40,41,48,55,],[26,26,26,26,26,26,26,26,56,26,]),'numeric_literal':([0,17,18,19,20,21,40,41,55,],[27,27,27,27,27,27,27,27,27,]),'string_literal':([0,17,18,19,20,21,40,41,55,],[28,28,28,28,28,28,28,28,28,]),'boolean_literal':([0,17,18,19,20,21,40,41,55,],[29,29,29,29,29,29,29,29,29,]),'date_time_literal':([0,17,18,19,20,21,40,41,55,],[30,30,30,30,30,30,30,30,30,]),'dot_names':([26,56,],[47,63,]),'interval_ends':([62,],[69,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> unary_tests","S'",1,None,None,None),
+  ('simple_positive_unary_test -> endpoint','simple_positive_unary_test',1,'p_simple_positive_unary_test','TableParser.py',25),
+  ('simple_positive_unary_test -> op_endpoint','simple_positive_unary_test',1,'p_simple_positive_unary_test','TableParser.py',26),
+  ('simple_positive_unary_test -> interval','simple_positive_unary_test',1,'p_simple_positive_unary_test','TableParser.py',27),
+  ('op_endpoint -> < endpoint','op_endpoint',2,'p_op_endpoint','TableParser.py',31),
+  ('op_endpoint -> GTE endpoint','op_endpoint',2,'p_op_endpoint','TableParser.py',32),
+  ('op_endpoint -> > endpoint','op_endpoint',2,'p_op_endpoint','TableParser.py',33),
+  ('op_endpoint -> LTE endpoint','op_endpoint',2,'p_op_endpoint','TableParser.py',34),
+  ('interval -> interval_starts endpoint DOTS endpoint interval_ends','interval',5,'p_interval','TableParser.py',44),
+  ('interval_starts -> (','interval_starts',1,'p_interval_starts','TableParser.py',49),
+  ('interval_starts -> ]','interval_starts',1,'p_interval_starts','TableParser.py',50),
+  ('interval_starts -> [','interval_starts',1,'p_interval_starts','TableParser.py',51),
+  ('interval_ends -> )','interval_ends',1,'p_interval_ends','TableParser.py',60),
+  ('interval_ends -> [','interval_ends',1,'p_interval_ends','TableParser.py',61),
+  ('interval_ends -> ]','interval_ends',1,'p_interval_ends','TableParser.py',62),
+  ('positive_unary_test -> null','positive_unary_test',1,'p_positive_unary_test','TableParser.py',71),
+  ('positive_unary_test -> simple_positive_unary_test','positive_unary_test',1,'p_positive_unary_test','TableParser.py',72),
+  ('positive_unary_tests -> many_positive_unary_tests','positive_unary_tests',1,'p_positive_unary_tests','TableParser.py',77),
+  ('many_positive_unary_tests -> positive_unary_test','many_positive_unary_tests',1,'p_many_positive_unary_tests','TableParser.py',81),
+  ('many_positive_unary_tests -> many_positive_unary_tests , positive_unary_test','many_positive_unary_tests',3,'p_many_positive_unary_tests','TableParser.py',82),
+  ('unary_tests -> positive_unary_tests','unary_tests',1,'p_unary_tests','TableParser.py',91),
+  ('unary_tests -> not_positive_unary_tests','unary_tests',1,'p_unary_tests','TableParser.py',92),
+  ('unary_tests -> no_tests','unary_tests',1,'p_unary_tests','TableParser.py',93),
+  ('not_positive_unary_tests -> NOT ( positive_unary_tests )','not_positive_unary_tests',4,'p_not_positive_tests','TableParser.py',98),
+  ('no_tests -> -','no_tests',1,'p_no_tests','TableParser.py',103),
+  ('endpoint -> simple_value','endpoint',1,'p_endpoint','TableParser.py',108),
+  ('simple_value -> qualified_name','simple_value',1,'p_simple_value','TableParser.py',113),
+  ('simple_value -> simple_literal','simple_value',1,'p_simple_value','TableParser.py',114),
+  ('qualified_name -> name dot_names','qualified_name',2,'p_qualified_name','TableParser.py',119),
+  ('dot_names -> <empty>','dot_names',0,'p_dot_names','TableParser.py',123),
+  ('dot_names -> . name dot_names','dot_names',3,'p_dot_names','TableParser.py',124),
+  ('name -> NAME','name',1,'p_name','TableParser.py',129),
+  ('simple_literal -> numeric_literal','simple_literal',1,'p_simple_literal','TableParser.py',134),
+  ('simple_literal -> string_literal','simple_literal',1,'p_simple_literal','TableParser.py',135),
+  ('simple_literal -> boolean_literal','simple_literal',1,'p_simple_literal','TableParser.py',136),
+  ('simple_literal -> date_time_literal','simple_literal',1,'p_simple_literal','TableParser.py',137),
+  ('string_literal -> STRING_LITERAL','string_literal',1,'p_string_literal','TableParser.py',142),
+  ('boolean_literal -> TRUE','boolean_literal',1,'p_boolean_literal','TableParser.py',147),
+  ('boolean_literal -> FALSE','boolean_literal',1,'p_boolean_literal','TableParser.py',148),
+  ('numeric_literal -> NUMERIC_LITERAL','numeric_literal',1,'p_numeric_literal','TableParser.py',153),
+  ('date_time_literal -> DATE ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','TableParser.py',158),
+  ('date_time_literal -> TIME ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','TableParser.py',159),
+  ('date_time_literal -> DATE_AND_TIME ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','TableParser.py',160),
+  ('date_time_literal -> DATE_AND_TIME ( STRING_LITERAL NEWLINE )','date_time_literal',5,'p_date_time_literal','TableParser.py',161),
+  ('date_time_literal -> DURATION ( STRING_LITERAL )','date_time_literal',4,'p_date_time_literal','TableParser.py',162),
+  ('null -> NULL','null',1,'p_null','TableParser.py',172),
+]
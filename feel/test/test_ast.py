@@ -0,0 +1,79 @@
+import copy
+import pickle
+import unittest
+
+from feel.parser import AST
+
+
+class TestAST(unittest.TestCase):
+    def test_no_instance_dict(self):
+        nodes = [AST.Number(1), AST.Sum(AST.Number(1), AST.Name('a')), AST.Null(), AST.OpenIntervalEnd(),
+                 AST.Interval(AST.ClosedIntervalStart(), AST.Number(1), AST.Number(2), AST.OpenIntervalEnd())]
+        for node in nodes:
+            self.assertFalse(hasattr(node, '__dict__'), node.__class__.__name__)
+
+    def test_stateless_nodes_are_shared(self):
+        for cls in (AST.Null, AST.NoTest, AST.OpenIntervalStart, AST.ClosedIntervalStart,
+                    AST.OpenIntervalEnd, AST.ClosedIntervalEnd):
+            node = cls()
+            self.assertIs(node, cls())
+            self.assertIs(node, copy.deepcopy(node))
+            self.assertIs(node, pickle.loads(pickle.dumps(node)))
+            self.assertIsNone(node.value)
+        self.assertNotEqual(AST.Null(), AST.NoTest())
+        self.assertEqual('[', str(AST.ClosedIntervalStart()))
+
+    def test_copies(self):
+        tree = AST.If(AST.Gt(AST.Name('a'), AST.Number(1)), AST.StringLiteral('b'), AST.Null())
+        for other in (copy.deepcopy(tree), pickle.loads(pickle.dumps(tree))):
+            self.assertEqual(tree, other)
+            self.assertIsNot(tree.then, other.then)
+            self.assertIs(tree.else_, other.else_)
+
+    def test_structural_hash(self):
+        def tree(name, number):
+            return AST.Interval(AST.ClosedIntervalStart(), AST.Sum(AST.Name(name), AST.Number(number)),
+                                AST.Invocation(AST.Name('f'), [AST.Number(2), AST.StringLiteral(name)]),
+                                AST.OpenIntervalEnd())
+        self.assertEqual(tree('a', 1), tree('a', 1))
+        self.assertEqual(hash(tree('a', 1)), hash(tree('a', 1)))
+        self.assertEqual(hash(tree('a', 1)), hash(tree('a', 1.0)))
+        self.assertNotEqual(tree('a', 1), tree('b', 1))
+        self.assertNotEqual(tree('a', 1), tree('a', 2))
+        self.assertNotEqual(AST.Sum(AST.Number(1), AST.Number(2)), AST.Mul(AST.Number(1), AST.Number(2)))
+        self.assertNotEqual(AST.List([AST.Number(1)]), AST.List((AST.Number(1),)))
+        self.assertNotEqual(AST.Name('a'), 'a')
+        self.assertEqual(2, len({tree('a', 1), tree('a', 1), tree('b', 1)}))
+
+    def test_all_fields_compare(self):
+        body = AST.Sum(AST.Name('x'), AST.Number(1))
+        function = AST.FunctionDefinition([AST.Name('x')], False, body)
+        self.assertEqual(function, AST.FunctionDefinition([AST.Name('x')], False, copy.deepcopy(body)))
+        self.assertNotEqual(function, AST.FunctionDefinition([AST.Name('x')], False, AST.Name('x')))
+        self.assertNotEqual(function, AST.FunctionDefinition([AST.Name('x')], True, body))
+
+    def test_cached_hash_is_not_copied(self):
+        tree = AST.Sum(AST.Name('a'), AST.StringLiteral('b'))
+        hash(tree)
+        for other in (copy.copy(tree), copy.deepcopy(tree), pickle.loads(pickle.dumps(tree))):
+            self.assertFalse(hasattr(other, '_hash'))
+            self.assertEqual(hash(tree), hash(other))
+
+    def test_deep_trees(self):
+        def chain(last):
+            tree = AST.Number(0)
+            for i in range(1, 50000):
+                tree = AST.Sum(tree, AST.Number(last if i == 49999 else i))
+            return tree
+        first, second = chain(1), chain(1)
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, chain(2))
+        other = copy.deepcopy(first)
+        self.assertEqual(first, other)
+        self.assertIsNot(first.value, other.value)
+        self.assertEqual(first, pickle.loads(pickle.dumps(first, pickle.HIGHEST_PROTOCOL)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from feel.Limits import Limits
+from feel.parser.common.BulkParse import parse_many
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+
+EXPRESSIONS = ['a  *  %d  +  b', 'if  a > %d  then  "big"  else  "small"', '{"limit": %d}', '%d  +', '[1, %d]']
+UNARY_TESTS = ['[%d..100]', '<  %d', '%d..', 'not(%d)']
+
+
+def serial(parser, texts):
+    return [parser.diagnose(text) for text in texts]
+
+
+class TestBulkParse(unittest.TestCase):
+    def test_same_as_parse(self):
+        texts = [EXPRESSIONS[i % len(EXPRESSIONS)] % i for i in range(60)]
+        expected = serial(Parser(), texts)
+        self.assertEqual(expected, list(parse_many(texts, workers=1, batch_size=7)))
+        self.assertEqual(expected, list(parse_many(texts, workers=2, batch_size=7)))
+
+    def test_grammar(self):
+        texts = [UNARY_TESTS[i % len(UNARY_TESTS)] % i for i in range(20)]
+        self.assertEqual(serial(TableParser(), texts), list(parse_many(texts, grammar='table', workers=2)))
+
+    def test_diagnostics(self):
+        results = list(parse_many(['1  +', '2', '1  +  2  +  3'], workers=2, batch_size=1, limits=Limits(tokens=3)))
+        self.assertEqual([None, 2, None], [tree and tree.value for tree, _ in results])
+        self.assertEqual('unexpected end of file', results[0].diagnostics[-1].message)
+        self.assertEqual([], results[1].diagnostics)
+        self.assertEqual(['input exceeds the limit of 3 tokens'], [str(d) for d in results[2].diagnostics])
+
+    def test_deep_trees(self):
+        texts = ['  +  '.join(['1'] * 2000), '1  +  2']
+        self.assertEqual(serial(Parser(), texts), list(parse_many(texts, workers=2, batch_size=1)))
+
+    def test_empty(self):
+        self.assertEqual([], list(parse_many([], workers=2)))
+        self.assertEqual([], list(parse_many(iter([]), workers=1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+from feel.evaluator.Compiler import Compiler, Constant
+from feel.parser import AST
+from feel.test import test_evaluator
+
+
+class TestCompiler(test_evaluator.TestEvaluator):
+    """Runs every evaluator case through compiled closures."""
+
+    # noinspection PyPep8Naming
+    def __init__(self, methodName='runTest'):
+        super(TestCompiler, self).__init__(methodName)
+        self.evaluator = Compiler()
+
+    def test_constant_folding(self):
+        self.assertIsInstance(self.evaluator.expression(self.parser.parse('1 + 2 * 3')), Constant)
+        self.assertIsInstance(self.evaluator.expression(self.parser.parse('if  1 > 2  then  a  else  "b"')), Constant)
+        self.assertNotIsInstance(self.evaluator.expression(self.parser.parse('1 + a')), Constant)
+
+    def test_cache(self):
+        ast = AST.Sum(AST.Name('a'), AST.Number(1))
+        function = self.evaluator.compile(ast)
+        self.assertIs(function, self.evaluator.compile(ast))
+        self.assertEqual(3, function({'a': 2}))
+        self.assertEqual(1, len(self.evaluator.cache))
+        del ast
+        self.assertEqual(0, len(self.evaluator.cache))
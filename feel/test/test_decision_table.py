@@ -0,0 +1,113 @@
+import datetime
+import random
+import unittest
+from decimal import Decimal
+
+from feel.evaluator.DecisionTable import DecisionTable, HitPolicyError, RangeIndex
+from feel.evaluator.Evaluator import EvaluationError
+
+DISCOUNTS = [
+    ['< 18', '-', '0'],
+    ['[18..65[', '"gold", "silver"', '0.1'],
+    ['[18..65[', 'not ("gold", "silver")', '0.05'],
+    ['>= 65', '-', '0.2'],
+]
+
+OVERLAPPING = [
+    ['>= 0', '"a"', '"low"', '1'],
+    ['> 10', '-', '"high"', '2'],
+    ['[5..20]', '"a", "b"', '"medium"', '3'],
+    ['limit', '-', '"limit"', '4'],
+]
+
+
+class TestDecisionTable(unittest.TestCase):
+    def table(self, rules=OVERLAPPING, hit_policy='COLLECT', **kwargs):
+        outputs = ['level', 'points'] if rules is OVERLAPPING else ['discount']
+        return DecisionTable(['x', 'y'], outputs, rules, hit_policy=hit_policy, **kwargs)
+
+    def test_unique(self):
+        table = self.table(DISCOUNTS, 'UNIQUE')
+        self.assertEqual(0, table.evaluate({'x': 10, 'y': 'gold'}))
+        self.assertEqual(Decimal('0.1'), table.evaluate({'x': 20, 'y': 'gold'}))
+        self.assertEqual(Decimal('0.05'), table.evaluate({'x': 20, 'y': 'bronze'}))
+        self.assertEqual(Decimal('0.2'), table.evaluate({'x': 65, 'y': 'bronze'}))
+        self.assertEqual(None, table.evaluate({'x': 'old', 'y': 'bronze'}))
+        with self.assertRaises(HitPolicyError):
+            self.table(hit_policy='UNIQUE').evaluate({'x': 15, 'y': 'a'})
+
+    def test_first_and_any(self):
+        self.assertEqual({'level': 'low', 'points': 1}, self.table(hit_policy='FIRST').evaluate({'x': 15, 'y': 'a'}))
+        self.assertEqual({'level': 'high', 'points': 2}, self.table(hit_policy='FIRST').evaluate({'x': 30, 'y': 'c'}))
+        with self.assertRaises(HitPolicyError):
+            self.table(hit_policy='ANY').evaluate({'x': 15, 'y': 'a'})
+
+    def test_priority(self):
+        table = self.table(hit_policy='PRIORITY', output_values={'level': ['high', 'medium', 'low']})
+        self.assertEqual({'level': 'high', 'points': 2}, table.evaluate({'x': 15, 'y': 'a'}))
+        self.assertEqual({'level': 'medium', 'points': 3}, table.evaluate({'x': 6, 'y': 'a'}))
+        table = self.table(hit_policy='OUTPUT ORDER', output_values={'level': ['high', 'medium', 'low']})
+        self.assertEqual(['high', 'medium', 'low'], [o['level'] for o in table.evaluate({'x': 15, 'y': 'a'})])
+
+    def test_collect(self):
+        self.assertEqual(['low', 'high', 'medium'],
+                         [o['level'] for o in self.table().evaluate({'x': 15, 'y': 'a'})])
+        rules = [row[:2] + row[3:] for row in OVERLAPPING]
+        context = {'x': 15, 'y': 'a', 'limit': 15}
+        self.assertEqual(10, DecisionTable(['x', 'y'], ['points'], rules, 'COLLECT', 'SUM').evaluate(context))
+        self.assertEqual(4, DecisionTable(['x', 'y'], ['points'], rules, 'COLLECT', 'COUNT').evaluate(context))
+        self.assertEqual(1, DecisionTable(['x', 'y'], ['points'], rules, 'COLLECT', 'MIN').evaluate(context))
+        self.assertEqual(4, DecisionTable(['x', 'y'], ['points'], rules, 'COLLECT', 'MAX').evaluate(context))
+        self.assertEqual(None, DecisionTable(['x', 'y'], ['points'], rules, 'COLLECT', 'SUM').evaluate({'x': -1}))
+
+    def test_aggregation_of_mixed_outputs(self):
+        rules = [['-', '-', 'a'], ['-', '-', 'b']]
+        numbers = {'a': Decimal('1.5'), 'b': 0.25}
+        self.assertEqual(Decimal('1.75'), DecisionTable(['x', 'y'], ['o'], rules, 'COLLECT', 'SUM').evaluate(numbers))
+        self.assertEqual(0.25, DecisionTable(['x', 'y'], ['o'], rules, 'COLLECT', 'MIN').evaluate(numbers))
+        self.assertEqual(Decimal('1.5'), DecisionTable(['x', 'y'], ['o'], rules, 'COLLECT', 'MAX').evaluate(numbers))
+        for aggregation in ('SUM', 'MIN', 'MAX'):
+            table = DecisionTable(['x', 'y'], ['o'], rules, 'COLLECT', aggregation)
+            self.assertEqual(None, table.evaluate({'a': 'a', 'b': 1}))
+            self.assertEqual(None, table.evaluate({'a': True, 'b': False}))
+
+    def test_invalid_tables(self):
+        with self.assertRaises(EvaluationError):
+            self.table(hit_policy='SOMETIMES')
+        with self.assertRaises(EvaluationError):
+            self.table(hit_policy='FIRST', aggregation='SUM')
+        with self.assertRaises(EvaluationError):
+            self.table([['[1..', '-', '1', '2']])
+
+    def test_range_index(self):
+        index = RangeIndex([(0, 1, True, 5, False), (1, 5, True, None, False), (2, None, False, 3, True)])
+        self.assertEqual({2}, set(index.lookup(0)))
+        self.assertEqual({0, 2}, set(index.lookup(1)))
+        self.assertEqual({0, 2}, set(index.lookup(3)))
+        self.assertEqual({0}, set(index.lookup(4)))
+        self.assertEqual({1}, set(index.lookup(5)))
+        self.assertEqual({1}, set(index.lookup(100)))
+
+    def test_index_matches_scan(self):
+        generator = random.Random(7)
+        cells = ['-', '< 50', '<= 50', '> 20', '>= 20', '[10..30]', ']10..30[', '(10..30]', '[10..30)',
+                 '20', '20, 40', '"a"', '"a", "b"', 'null', 'not (20)', 'not ("a")', 'limit', '< limit']
+        rules = [[generator.choice(cells), generator.choice(cells), str(i)] for i in range(300)]
+        indexed = DecisionTable(['x', 'y'], ['rule'], rules, 'RULE ORDER')
+        scanned = DecisionTable(['x', 'y'], ['rule'], rules, 'RULE ORDER', indexed=False)
+        for x in [None, 0, 10, 10.5, 20, 30, 40, 50, 60, 'a', 'b', True]:
+            for y in [None, 5, 20, 30, 'a', 'c']:
+                context = {'x': x, 'y': y, 'limit': 25}
+                self.assertEqual(scanned.evaluate(context), indexed.evaluate(context))
+
+    def test_naive_and_aware_bounds(self):
+        cells = ['< date and time("2020-01-01T00:00:00")', '>= date and time("2020-01-01T00:00:00Z")',
+                 '[date and time("2019-01-01T00:00:00")..date and time("2021-01-01T00:00:00Z")]',
+                 '< time("11:00:00Z")', '> time("09:00:00")', '[time("10:00:00")..time("12:00:00+01:00")]']
+        rules = [[cell, str(i)] for i, cell in enumerate(cells)]
+        indexed = DecisionTable(['x'], ['rule'], rules, 'RULE ORDER')
+        scanned = DecisionTable(['x'], ['rule'], rules, 'RULE ORDER', indexed=False)
+        utc = datetime.timezone.utc
+        for x in [datetime.datetime(2019, 6, 1), datetime.datetime(2020, 6, 1, tzinfo=utc), datetime.time(10),
+                  datetime.time(10, tzinfo=utc), datetime.date(2020, 1, 1)]:
+            self.assertEqual(scanned.evaluate({'x': x}), indexed.evaluate({'x': x}))
@@ -0,0 +1,83 @@
+import contextlib
+import io
+import unittest
+
+from feel.Diagnostics import LEXICAL, LIMIT, SYNTAX
+from feel.Limits import Limits
+from feel.lexer.Lexer import Lexer
+from feel.parser.common.ParseCache import ParseCache
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+
+class TestDiagnostics(unittest.TestCase):
+    def test_syntax_error(self):
+        tree, diagnostics = Parser().diagnose('[1,\n 2  "c"]')
+        self.assertIsNone(tree)
+        diagnostic, = diagnostics
+        self.assertEqual(SYNTAX, diagnostic.kind)
+        self.assertEqual('unexpected token STRING_LITERAL{c}', diagnostic.message)
+        self.assertEqual((2, 4), (diagnostic.line, diagnostic.column))
+        self.assertEqual((8, 11), diagnostic.span)
+        self.assertIn(',', diagnostic.expected)
+        self.assertIn(']', diagnostic.expected)
+        self.assertNotIn('error', diagnostic.expected)
+        self.assertEqual((' 2  "c"]', '~~~~^^^~'), diagnostic.context())
+
+    def test_lexical_error(self):
+        tree, diagnostics = Parser().diagnose('a  +  @  b')
+        self.assertIsNotNone(tree)
+        self.assertEqual([(LEXICAL, "Unexpected character: '@'", (6, 7))],
+                         [(d.kind, d.message, d.span) for d in diagnostics])
+        self.assertEqual(["Unexpected character: '@'", 'at position 6:1', 'a  +  @  b', '~~~~~~^~~~'],
+                         diagnostics[0].lines())
+
+    def test_recovered_error(self):
+        tree, diagnostics = Parser().diagnose('if  a  else  b')
+        self.assertEqual("missing 'then' branch in 'if' expression; a token ELSE{else} found instead",
+                         diagnostics[1].message)
+
+    def test_end_of_file(self):
+        diagnostic, = TableParser().diagnose('[1..').diagnostics
+        self.assertEqual('unexpected end of file', str(diagnostic))
+        self.assertIsNone(diagnostic.column)
+        self.assertIn('NUMERIC_LITERAL', diagnostic.expected)
+
+    def test_limit(self):
+        diagnostic, = Parser(limits=Limits(tokens=2)).diagnose('1  +  2').diagnostics
+        self.assertEqual((LIMIT, 'input exceeds the limit of 2 tokens'), (diagnostic.kind, diagnostic.message))
+
+    def test_nothing_printed(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            parser = Parser()
+            parser.parse('1  +  @')
+            parser.parse('if  a  else  b')
+            lexer = Lexer()
+            lexer.input('#')
+            lexer.token()
+        self.assertEqual('', output.getvalue())
+        self.assertEqual(1, len(lexer.diagnostics))
+
+    def test_reset_per_parse(self):
+        parser = Parser()
+        first = parser.diagnose('1  +').diagnostics
+        self.assertEqual([], parser.diagnose('1').diagnostics)
+        self.assertEqual(1, len(first))
+
+    def test_logger(self):
+        logger = StoreLogger()
+        result = Parser(logger).diagnose('1  +  @')
+        self.assertEqual([line for d in result.diagnostics for line in d.lines()], logger.messages)
+
+    def test_cached_failure(self):
+        cache = ParseCache(cache_failures=True)
+        self.assertIsNone(cache.parse('1  +'))
+        diagnostics = cache.diagnostics('1  +')
+        self.assertEqual(['unexpected end of file'], [d.message for d in diagnostics])
+        self.assertEqual('syntax', diagnostics[0].kind)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import unittest
+from decimal import Decimal
+
+from feel.Numbers import DECIMAL, FLOAT
+from feel.parser import AST
+from feel.parser.common.DiskCache import DiskCache, FORMAT
+from utils.StoreLogger import StoreLogger
+
+SUM_AST = AST.Sum(AST.Number(1), AST.Number(2))
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'trees.cache')
+        self.logger = StoreLogger()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def cache(self):
+        return DiskCache(self.path, logger=self.logger)
+
+    def test_warm_start(self):
+        cold = self.cache()
+        self.assertEqual(SUM_AST, cold.parse('1 + 2'))
+        self.assertEqual(AST.NoTest(), cold.parse('-', grammar='table'))
+        self.assertEqual((0, 2), (cold.hits, cold.misses))
+        cold.save()
+
+        warm = self.cache()
+        self.assertEqual([SUM_AST, AST.Number(3)], warm.parse_all(['1 + 2', '3']))
+        self.assertEqual(AST.NoTest(), warm.parse('-', grammar='table'))
+        self.assertEqual((2, 1), (warm.hits, warm.misses))
+        self.assertIs(warm.parse('1 + 2'), warm.parse('1 + 2'))
+
+    def test_deep_trees(self):
+        text = '  +  '.join(['1'] * 2000)
+        cold = self.cache()
+        tree = cold.parse(text)
+        cold.save()
+        warm = self.cache()
+        self.assertEqual(tree, warm.parse(text))
+        self.assertEqual(1, warm.hits)
+
+    def test_failures_not_stored(self):
+        cache = self.cache()
+        self.assertIsNone(cache.parse('if  a  else  c'))
+        self.assertIsNone(cache.parse('if  a  else  c'))
+        self.assertEqual(2, cache.misses)
+        self.assertFalse(cache.dirty)
+
+    def test_other_grammar_version(self):
+        cold = self.cache()
+        cold.parse('1 + 2')
+        cold.versions['feel'] = 'outdated'
+        cold.save()
+        warm = self.cache()
+        self.assertEqual({}, warm.entries['feel'])
+        self.assertEqual(SUM_AST, warm.parse('1 + 2'))
+        self.assertEqual(1, warm.misses)
+
+    def test_number_modes(self):
+        cold = DiskCache(self.path, numbers=FLOAT)
+        self.assertEqual(AST.Number(1.5), cold.parse('1.5'))
+        cold.save()
+        warm = DiskCache(self.path, numbers=DECIMAL)
+        self.assertEqual({}, warm.entries['feel'])
+        self.assertIs(Decimal, warm.parse('1.5').value.__class__)
+        same = DiskCache(self.path, numbers=FLOAT)
+        self.assertIs(float, same.parse('1.5').value.__class__)
+        self.assertEqual(1, same.hits)
+
+    def test_concurrent_saves(self):
+        caches = [self.cache() for _ in range(4)]
+        for i, cache in enumerate(caches):
+            cache.parse('%d  +  1' % i)
+        threads = [threading.Thread(target=cache.save) for cache in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(['trees.cache'], os.listdir(self.directory))
+        self.assertEqual(1, len(self.cache().entries['feel']))
+
+    def test_unreadable_files(self):
+        with open(self.path, 'wb') as cache_file:
+            cache_file.write(b'not a cache')
+        self.assertEqual(SUM_AST, self.cache().parse('1 + 2'))
+        with open(self.path, 'wb') as cache_file:
+            pickle.dump((FORMAT + 1, {}), cache_file)
+        self.assertEqual(SUM_AST, self.cache().parse('1 + 2'))
+
+
+if __name__ == '__main__':
+    unittest.main()
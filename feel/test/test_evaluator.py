@@ -0,0 +1,142 @@
+# coding: utf8
+import datetime
+import unittest
+
+from feel.evaluator.Evaluator import Evaluator, EvaluationError, FeelFunction
+from feel.parser import AST
+from feel.parser.parser.Parser import Parser
+from feel.parser.simple.SimpleParser import SimpleParser
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+CONTEXT = {
+    'a': 5,
+    'numbers': [1, 2, 3, 4],
+    'person': {'age': 30, 'name': 'Jo'},
+    'items': [{'x': 1}, {'x': 5}],
+}
+
+
+class TestEvaluator(unittest.TestCase):
+
+    # noinspection PyPep8Naming
+    def __init__(self, methodName='runTest'):
+        super(TestEvaluator, self).__init__(methodName)
+        self.logger = StoreLogger()
+        self.parser = Parser(self.logger)
+        self.simple_parser = SimpleParser(self.logger)
+        self.table_parser = TableParser(self.logger)
+        self.evaluator = Evaluator()
+
+    def check(self, str_input, value, context=CONTEXT):
+        self.assertEqual(value, self.evaluator.evaluate(self.parser.parse(str_input), context))
+
+    def check_test(self, str_input, value, result):
+        self.assertEqual(result, self.evaluator.test(self.table_parser.parse(str_input), value, CONTEXT))
+
+    def test_literals(self):
+        self.check('1.5', 1.5)
+        self.check('"ala"', 'ala')
+        self.check('true', True)
+        self.check('null', None)
+        self.check('date("2017-09-10")', datetime.date(2017, 9, 10))
+        self.check('time("10:11:12")', datetime.time(10, 11, 12))
+        self.check('date and time("2017-09-10T10:11:12")', datetime.datetime(2017, 9, 10, 10, 11, 12))
+        self.check('duration("P1DT2H")', datetime.timedelta(days=1, hours=2))
+        self.check('date("2017-13-10")', None)
+
+    def test_arithmetic(self):
+        self.check('1 + 2 * 3', 7)
+        self.check('(1 + 2) * 3', 9)
+        self.check('2 ** 3 - 1', 7)
+        self.check('a  /  2', 2.5)
+        self.check('-a', -5)
+        self.check('"a" + "b"', 'ab')
+        self.check('date("2017-01-31") + duration("P1D")', datetime.date(2017, 2, 1))
+        self.check('1 / 0', None)
+        self.check('1 + "a"', None)
+        self.check('1 + null', None)
+
+    def test_comparison(self):
+        self.check('a > 3', True)
+        self.check('a >= 6', False)
+        self.check('a != 5', False)
+        self.check('null = null', True)
+        self.check('1 = "a"', None)
+        self.check('a  between  1  and  5', True)
+        self.check('a  between  6  and  7', False)
+
+    def test_logic(self):
+        self.check('a > 3  and  a < 4', False)
+        self.check('a > 3  or  a < 4', True)
+        self.check('false  and  null', False)
+        self.check('true  and  null', None)
+        self.check('true  or  null', True)
+
+    def test_in(self):
+        self.check('a  in  [1..5]', True)
+        self.check('a  in  [1..5[', False)
+        self.check('a  in  (<= 2, 5)', True)
+        self.check('a  in  null', False)
+        self.check('null  in  null', True)
+
+    def test_if(self):
+        self.check('if  a > 3  then  "big"  else  "small"', 'big')
+        self.check('if  null  then  1  else  2', 2)
+
+    def test_for_and_quantified(self):
+        self.check('for  x  in  numbers  return  x  *  2', [2, 4, 6, 8])
+        self.check('for  x  in  [1, 2]  y  in  [10, 20]  return  x  +  y', [11, 21, 12, 22])
+        self.check('some  x  in  numbers  satisfies  x > 3', True)
+        self.check('every  x  in  numbers  satisfies  x > 3', False)
+
+    def test_filter_and_path(self):
+        self.check('numbers[item > 2]', [3, 4])
+        self.check('numbers[2]', 2)
+        self.check('numbers[-1]', 4)
+        self.check('numbers[7]', None)
+        self.check('items[x > 2]', [{'x': 5}])
+        self.check('person.age', 30)
+        self.check('items.x', [1, 5])
+        self.check('date("2017-09-10").year', 2017)
+        self.check('unknown', None)
+
+    def test_context_and_functions(self):
+        self.check('{c: 1, "d": c  +  1}', {'c': 1, 'd': 2})
+        self.check('{f: function(x, y) x  -  y, r: f(5, 1)}.r', 4)
+        self.check('{f: function(x, y) x  -  y, r: f(y: 1, x: 5)}.r', 4)
+        self.assertIsInstance(self.evaluator.evaluate(self.parser.parse('function(x) x')), FeelFunction)
+        self.check('f(2)', 3, {'f': lambda x: x + 1})
+        self.check('string length("ala")', 3)
+        self.check('count(numbers)', 4)
+        self.check('sum(numbers)', 10)
+        self.check('a(1)', None)
+        with self.assertRaises(EvaluationError):
+            self.evaluator.evaluate(self.parser.parse('function(x) external {}'))
+
+    def test_instance_of(self):
+        self.check('a  instance  of  number', True)
+        self.check('person  instance  of  context', True)
+        self.check('a  instance  of  string', False)
+
+    def test_simple_expressions(self):
+        self.assertEqual([6, 'a'], self.evaluator.evaluate(self.simple_parser.parse('a  +  1, "a"'), CONTEXT))
+
+    def test_unary_tests(self):
+        self.check_test('>= 5', 5, True)
+        self.check_test('>= 5', 4, False)
+        self.check_test('not ("a", "b")', 'c', True)
+        self.check_test('not ("a", "b")', 'a', False)
+        self.check_test('-', 1, True)
+        self.check_test('null', None, True)
+        self.check_test('a', 5, True)
+
+    def test_every_node_is_dispatched(self):
+        tests = {AST.PositiveUnaryTests, AST.Not, AST.NoTest, AST.Interval,
+                 AST.LtEp, AST.LteEp, AST.GtEp, AST.GteEp}
+        borders = {AST.IntervalBorders, AST.OpenIntervalStart, AST.ClosedIntervalStart,
+                   AST.OpenIntervalEnd, AST.ClosedIntervalEnd}
+        abstract = {AST.AST, AST.BinOp, AST.Stateless}
+        nodes = set(cls for cls in vars(AST).values() if isinstance(cls, type) and issubclass(cls, AST.AST))
+        self.assertEqual(set(), nodes - tests - borders - abstract - set(self.evaluator.evaluators))
+        self.assertEqual(set(), tests - set(self.evaluator.testers))
@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from feel.parser import AST
+from feel.parser.FlatAST import FlatTrees
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+EXPRESSIONS = [
+    'for  x  in  [1, 2]  return  x  *  2',
+    '{"a": 1, b: "c"}',
+    'function(a, b)  a  +  b',
+    'some  x  in  [1]  satisfies  x > 1',
+    'if  a  then  1  else  null',
+    'f(a: 1, b: true)',
+    'if  a  else  c',
+]
+UNARY_TESTS = ['-', '[1..2[', '-', 'not (>= 5, "a")', '(1..2]']
+
+
+class TestFlatAST(unittest.TestCase):
+    def __init__(self, methodName='runTest'):
+        super(TestFlatAST, self).__init__(methodName)
+        logger = StoreLogger()
+        self.trees = [Parser(logger).parse(e) for e in EXPRESSIONS] + [TableParser(logger).parse(t) for t in UNARY_TESTS]
+
+    def test_round_trip(self):
+        flat = FlatTrees.from_trees(self.trees)
+        self.assertEqual(self.trees, flat.trees())
+        self.assertIsNone(flat[6])
+        self.assertIs(AST.NoTest(), flat[9])
+
+    def test_walk(self):
+        flat = FlatTrees.from_trees(self.trees)
+        self.assertEqual([AST.FunctionDefinition, AST.Sum, AST.Name, AST.Name, list, AST.Name, AST.Name],
+                         [flat.kind(n) for n in flat.walk(2)])
+        root = flat.roots[0]
+        self.assertEqual(AST.Mul, flat.kind(flat.field(root, 'result')))
+        self.assertEqual('x', flat.field(flat.field(flat.field(root, 'result'), 'value'), 'value'))
+        self.assertEqual([], list(flat.walk(6)))
+
+    def test_shared_stateless_nodes(self):
+        flat = FlatTrees.from_trees([AST.NoTest()] * 3)
+        self.assertEqual(1, len(flat.kinds))
+        self.assertEqual([0, 0, 0], list(flat.roots))
+
+    def test_buffers(self):
+        flat = FlatTrees.from_trees(self.trees)
+        self.assertEqual(self.trees, FlatTrees.from_buffer(flat.to_bytes()).trees())
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'trees.flat')
+            flat.save(path)
+            self.assertEqual(self.trees, FlatTrees.load(path).trees())
+        finally:
+            shutil.rmtree(directory)
+        self.assertRaises(ValueError, FlatTrees.from_buffer, b'x' * 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import random
+import unittest
+
+from feel.parser.common.Incremental import IncrementalParser, children
+from feel.parser.parser.Parser import Parser
+
+TEXT = '{"a": [1,  2,  x  +  y],  "b": f(q: if  c  then  3  else  4),  "c": {"d": 1.5 * (z - 2)}}'
+
+
+class TestIncremental(unittest.TestCase):
+    def setUp(self):
+        self.parser = Parser()
+        self.incremental = IncrementalParser(Parser())
+
+    def assertParsed(self, document):
+        expected = self.incremental.parse(document.text)
+        self.assertEqual(self.parser.parse(document.text), document.tree)
+        self.assertEqual(str(expected.tree), str(document.tree))
+        pending = [(expected.tree, document.tree)]
+        while pending:
+            a, b = pending.pop()
+            self.assertEqual(expected.span(a), document.span(b))
+            pending.extend(zip(children(a), children(b)))
+
+    def test_spans(self):
+        document = self.incremental.parse('[1,  x  +  22]')
+        item = document.tree.value[1]
+        self.assertEqual((5, 13), document.span(item))
+        self.assertEqual((11, 13), document.span(item.rhs))
+        self.assertEqual((0, 14), document.span(document.tree))
+        self.assertIsNone(item.span)
+        edited = self.incremental.edit(document, 11, 2, '3')
+        self.assertIsNone(edited.tree.value[1].span)
+        self.assertEqual((5, 12), edited.span(edited.tree.value[1]))
+
+    def test_reuses_unchanged_subtrees(self):
+        document = self.incremental.parse(TEXT)
+        offset = TEXT.index('1.5')
+        edited = self.incremental.edit(document, offset, 3, '2.75')
+        self.assertParsed(edited)
+        self.assertIsNot(document.tree, edited.tree)
+        old, new = document.tree.value, edited.tree.value
+        self.assertIs(old[0][1], new[0][1])
+        self.assertIs(old[1][1], new[1][1])
+        self.assertIsNot(old[2][1], new[2][1])
+        self.assertEqual('"a": [1,  2,  x  +  y]', TEXT[:TEXT.index(',  "b"')][1:])
+
+    def test_old_document_unchanged(self):
+        document = self.incremental.parse(TEXT)
+        tree = str(document.tree)
+        self.incremental.edit(document, TEXT.index('3'), 1, '33')
+        self.assertEqual(tree, str(document.tree))
+        self.assertParsed(document)
+
+    def test_errors(self):
+        document = self.incremental.parse(TEXT)
+        broken = self.incremental.edit(document, TEXT.index('then'), 4, '')
+        self.assertEqual(self.parser.parse(broken.text), broken.tree)
+        self.assertTrue(broken.diagnostics)
+        fixed = self.incremental.edit(broken, broken.text.index('3  else'), 0, 'then  ')
+        self.assertEqual([], fixed.diagnostics)
+        self.assertParsed(fixed)
+
+    def test_random_edits(self):
+        generator = random.Random(0)
+        document = self.incremental.parse(TEXT)
+        for _ in range(300):
+            text = document.text
+            offset = generator.randint(0, len(text))
+            deleted = min(generator.choice([0, 1, 2]), len(text) - offset)
+            inserted = ''.join(generator.choice('ax 12+*,()[]{}:"') for _ in range(generator.choice([0, 1, 2])))
+            edited = self.incremental.edit(document, offset, deleted, inserted)
+            self.assertEqual(text[:offset] + inserted + text[offset + deleted:], edited.text)
+            if edited.diagnostics:
+                self.assertEqual(self.parser.parse(edited.text), edited.tree)
+            else:
+                self.assertParsed(edited)
+            document = edited if edited.tree is not None and len(edited.text) < 200 else self.incremental.parse(TEXT)
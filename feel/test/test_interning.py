@@ -0,0 +1,80 @@
+import unittest
+from decimal import Decimal
+
+from feel.evaluator.DecisionTable import DecisionTable
+from feel.parser import AST
+from feel.parser.Interning import Interner
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+
+
+class TestInterning(unittest.TestCase):
+    def setUp(self):
+        self.interner = Interner()
+        self.parser = Parser()
+
+    def test_equal_trees_are_shared(self):
+        first = self.interner.intern(self.parser.parse('x  +  f(1, [2, 3])'))
+        second = self.interner.intern(self.parser.parse('x  +  f(1, [2, 3])'))
+        self.assertIs(first, second)
+        self.assertEqual(self.parser.parse('x  +  f(1, [2, 3])'), first)
+
+    def test_equal_subtrees_are_shared(self):
+        first = self.interner.intern(self.parser.parse('a  *  (b  +  1)'))
+        second = self.interner.intern(self.parser.parse('(b  +  1)  -  a'))
+        self.assertIs(first.rhs, second.value)
+        self.assertIs(first.value, second.rhs)
+
+    def test_input_is_unchanged(self):
+        tree = self.parser.parse('[1, 2]')
+        items = tree.value
+        interned = self.interner.intern(tree)
+        self.assertIsNot(interned, tree)
+        self.assertIs(tree.value, items)
+        self.assertEqual((0, 6), tree.span)
+        self.assertIsNone(interned.span)
+        self.assertIs(interned, self.interner.intern(interned))
+
+    def test_literal_classes_stay_apart(self):
+        nodes = [self.interner.intern(AST.Number(value)) for value in (1, True, 1.0, Decimal(1))]
+        self.assertEqual(4, len(set(map(id, nodes))))
+        self.assertEqual([int, bool, float, Decimal], [node.value.__class__ for node in nodes])
+
+    def test_literal_forms_stay_apart(self):
+        for text, other in (('1.0  +  x', '1.00  +  x'), ('[1.5]', '[1.50]')):
+            first, second = [self.interner.intern(self.parser.parse(source)) for source in (text, other)]
+            self.assertIsNot(first, second)
+            self.assertEqual(str(self.parser.parse(other)), str(second))
+        for values in ((Decimal('0.0'), Decimal('-0.0')), (0.0, -0.0)):
+            first, second = [self.interner.intern(AST.Number(value)) for value in values]
+            self.assertIsNot(first, second)
+            self.assertEqual([str(value) for value in values], [str(first.value), str(second.value)])
+
+    def test_stateless_nodes(self):
+        tree = self.interner.intern(TableParser().parse('-'))
+        self.assertIs(AST.NoTest(), tree)
+
+    def test_deep_tree(self):
+        tree = AST.Number(0)
+        for i in range(20000):
+            tree = AST.Sum(tree, AST.Number(i % 3))
+        interned = self.interner.intern(tree)
+        self.assertEqual(20000 + 3, len(self.interner))
+        self.assertIs(interned.rhs, self.interner.intern(AST.Number(1)))
+
+    def test_clear(self):
+        first = self.interner.intern(self.parser.parse('1  +  2'))
+        self.interner.clear()
+        self.assertEqual(0, len(self.interner))
+        self.assertIsNot(first, self.interner.intern(self.parser.parse('1  +  2')))
+
+    def test_decision_table(self):
+        rules = [['< 18', '"young"'], ['[18..65[', '"adult"'], ['>= 65', '"senior"'], ['< 18', '"young"']]
+        table = DecisionTable(['age'], ['group'], rules, hit_policy='FIRST', interner=self.interner)
+        self.assertIs(table.entries[0][0], table.entries[3][0])
+        self.assertEqual('adult', table.evaluate({'age': 30}))
+        self.assertEqual('young', table.evaluate({'age': 3}))
+
+
+if __name__ == '__main__':
+    unittest.main()
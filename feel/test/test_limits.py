@@ -0,0 +1,117 @@
+import random
+import time
+import unittest
+
+from feel.Limits import Limits, depth
+from feel.lexer.Lexer import Lexer
+from feel.parser import AST
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+ADVERSARIAL = {
+    'spaced name ending badly': lambda n: 'a ' * n + '#',
+    'name symbols': lambda n: 'a.b-c+d*e/f’' * n + ' #',
+    'invalid characters': lambda n: '#' * n,
+    'numbers without operators': lambda n: '1  ' * n,
+    'spaced fractions': lambda n: '1 .' * n,
+    'open string': lambda n: '"' + 'a ' * n,
+    'parentheses': lambda n: '(' * n + '1' + ')' * n,
+    'negations': lambda n: '-  ' * n + '1',
+    'sums': lambda n: '1  +  ' * n + '1',
+    'lists': lambda n: '[' * n + ']' * n,
+    'long lists': lambda n: '[' + '1,  ' * n + '1]',
+    'long contexts': lambda n: '{' + 'k: 1,  ' * n + 'k: 1}',
+    'long unary tests': lambda n: 'x  in  (' + '<  1,  ' * n + '<  1)',
+}
+LIMITS = Limits(length=10 ** 6, tokens=10 ** 5, errors=50, depth=10 ** 5)
+
+
+def best_time(parse, text, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(text)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+class TestLimits(unittest.TestCase):
+    def setUp(self):
+        self.logger = StoreLogger()
+
+    def test_length(self):
+        parser = Parser(self.logger, limits=Limits(length=10))
+        self.assertEqual(AST.Number(1), parser.parse('1'))
+        self.assertIsNone(parser.parse('1  +  2  +  3'))
+        self.assertEqual(['input exceeds the limit of 10 characters'], self.logger.messages)
+
+    def test_tokens(self):
+        parser = TableParser(self.logger, limits=Limits(tokens=5))
+        self.assertIsNotNone(parser.parse('[1..2]'))
+        self.assertIsNone(parser.parse('[1..2], [3..4]'))
+        self.assertEqual(['input exceeds the limit of 5 tokens'], self.logger.messages)
+
+    def test_errors(self):
+        parser = Parser(self.logger, limits=Limits(errors=2))
+        self.assertIsNone(parser.parse('#' * 1000))
+        self.assertEqual('input exceeds the limit of 2 errors', self.logger.messages[-1])
+        self.assertEqual(9, len(self.logger.messages))
+        self.logger.messages = []
+        self.assertIsNone(Parser(self.logger, limits=Limits(errors=0)).parse('1  1'))
+        self.assertEqual(['input exceeds the limit of 0 errors'], self.logger.messages)
+
+    def test_depth(self):
+        parser = Parser(self.logger, limits=Limits(depth=10))
+        self.assertIsNotNone(parser.parse('-  ' * 9 + '1'))
+        self.assertIsNone(parser.parse('-  ' * 10 + '1'))
+        self.assertEqual(['input exceeds the limit of 10 nested nodes'], self.logger.messages)
+        self.assertEqual(3, depth(AST.List([AST.Sum(AST.Number(1), AST.Number(2))])))
+        self.assertEqual(0, depth(None))
+
+    def test_scanner_only(self):
+        self.assertRaises(ValueError, Lexer, self.logger, backend='ply', limits=LIMITS)
+
+    def test_reused_after_limit(self):
+        parser = Parser(self.logger, limits=Limits(tokens=3))
+        self.assertIsNone(parser.parse('1  +  2  +  3'))
+        self.assertEqual(AST.Sum(AST.Number(1), AST.Number(2)), parser.parse('1  +  2'))
+
+
+class TestLinearTime(unittest.TestCase):
+    """Parsing four times longer inputs must take well under sixteen times as long."""
+
+    def check(self, parse, make, n):
+        for _ in range(3):
+            small, large = best_time(parse, make(n)), best_time(parse, make(4 * n))
+            if large < 8 * small:
+                return
+        self.fail('%.4fs for %d repetitions, %.4fs for %d' % (small, n, large, 4 * n))
+
+    def test_adversarial_inputs(self):
+        parser = Parser(StoreLogger(), limits=LIMITS)
+        for name, make in ADVERSARIAL.items():
+            with self.subTest(name):
+                self.check(parser.parse, make, 2000)
+
+    def test_unbounded_errors(self):
+        def lex(text):
+            lexer = Lexer()
+            lexer.input(text)
+            while lexer.token():
+                pass
+
+        self.check(lex, lambda n: ('a' * 1000 + '  $  ') * n, 500)
+        self.check(lex, lambda n: '1  $  ' * n, 2000)
+
+    def test_random_inputs(self):
+        parser = Parser(StoreLogger(), limits=LIMITS)
+        generator = random.Random(12)
+        for _ in range(5):
+            piece = ''.join(generator.choice('ab  .-+*(["#1') for _ in range(8))
+            with self.subTest(piece):
+                self.check(parser.parse, lambda n: piece * n, 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import pickle
+import unittest
+
+from feel.lexer.Lexer import Lexer
+from feel.lexer.LineIndex import LineIndex
+from feel.parser.parser.Parser import Parser
+
+
+class TestLineIndex(unittest.TestCase):
+    def test_lookups(self):
+        data = 'ab\n\ncde\nf'
+        index = LineIndex(data)
+        self.assertEqual([0, 3, 4, 8], list(index.starts))
+        self.assertEqual([1, 1, 1, 2, 3, 3, 3, 3, 4, 4], [index.line(p) for p in range(len(data) + 1)])
+        self.assertEqual([0, 1, 2, 0, 0, 1, 2, 3, 0, 1], [index.column(p) for p in range(len(data) + 1)])
+        self.assertEqual((0, 1), index.bounds(2))
+        self.assertEqual((3, 2), index.bounds(3))
+        self.assertEqual((4, 6), index.bounds(5))
+        self.assertEqual((8, 8), index.bounds(8))
+        self.assertEqual(12, LineIndex(data, first_line=10).line(4))
+        self.assertEqual((0, -1), LineIndex('').bounds(0))
+
+    def test_pickle(self):
+        index = LineIndex('a\nb', 3)
+        index.line(2)
+        self.assertEqual(index, pickle.loads(pickle.dumps(index)))
+
+    def test_multiline_strings(self):
+        diagnostic, = Parser().diagnose('"a\nb"  +\n  1  @').diagnostics
+        self.assertEqual((3, 5), (diagnostic.line, diagnostic.column))
+
+    def test_same_lines_on_every_parse(self):
+        parser = Parser()
+        first = [(d.line, d.column) for d in parser.diagnose('1\n+\n@  2').diagnostics]
+        self.assertEqual([(3, 0)], first)
+        self.assertEqual(first, [(d.line, d.column) for d in parser.diagnose('1\n+\n@  2').diagnostics])
+        self.assertEqual([(12, 0)], [(d.line, d.column) for d in parser.diagnose('1\n+\n@  2', lineno=10).diagnostics])
+
+    def test_lexers(self):
+        for backend in ('scanner', 'ply'):
+            lexer = Lexer(backend=backend)
+            for _ in range(2):
+                lexer.input('a\n  #\n')
+                list(iter(lexer.token, None))
+                self.assertEqual([(2, 2)], [(d.line, d.column) for d in lexer.diagnostics])
+
+
+if __name__ == '__main__':
+    unittest.main()
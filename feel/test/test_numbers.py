@@ -0,0 +1,97 @@
+import datetime
+import decimal
+import unittest
+from decimal import Decimal
+
+from feel.Numbers import DECIMAL, FLOAT, HYBRID, Numbers
+from feel.evaluator import Operations as op
+from feel.evaluator.Compiler import compiler
+from feel.evaluator.Evaluator import Evaluator
+from feel.lexer.Lexer import Lexer
+from feel.parser import AST
+from feel.parser.FlatAST import FlatTrees
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+
+def literals(tree):
+    """The values of the Number nodes of a tree, in preorder."""
+    found, stack = [], [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, AST.Number):
+            found.append(node.value)
+        elif isinstance(node, AST.AST):
+            stack.extend(reversed([getattr(node, name) for name in AST.fields(node.__class__)]))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return found
+
+
+class TestNumbers(unittest.TestCase):
+    def test_modes(self):
+        self.assertIs(int, type(HYBRID('42')))
+        self.assertEqual(Decimal('1.42'), HYBRID('1 . 42'))
+        self.assertEqual((Decimal, Decimal), (type(DECIMAL('42')), type(DECIMAL('.5'))))
+        self.assertEqual((float, float), (type(FLOAT('42')), type(FLOAT('.5'))))
+        self.assertRaises(ValueError, Numbers, 'binary')
+
+    def test_context(self):
+        numbers = Numbers('decimal', decimal.Context(prec=3))
+        self.assertEqual(Decimal('3.14'), numbers('3.14159'))
+        self.assertEqual(Decimal('0.' + '1' * 34), HYBRID('0.' + '1' * 40))
+
+    def test_lexers(self):
+        for backend in ('ply', 'scanner'):
+            lexer = Lexer(StoreLogger(), backend=backend, numbers=DECIMAL)
+            lexer.input('1  +  2.50')
+            self.assertEqual([Decimal(1), '+', Decimal('2.50')], [t.value for t in iter(lexer.token, None)])
+
+    def test_parsers(self):
+        self.assertEqual(AST.Sum(AST.Number(1), AST.Number(Decimal('0.1'))), Parser(StoreLogger()).parse('1  +  0.1'))
+        tree = Parser(StoreLogger()).parse_spans('2.5')
+        self.assertEqual(Decimal, type(tree.value))
+        tests = TableParser(StoreLogger(), numbers=FLOAT).parse('[1..2.5]')
+        self.assertEqual([float, float], [type(v) for v in literals(tests)])
+
+    def test_exact_arithmetic(self):
+        evaluate = Evaluator().evaluate
+        parser = Parser(StoreLogger())
+        self.assertEqual(Decimal('0.3'), evaluate(parser.parse('0.1  +  0.2')))
+        self.assertIs(True, evaluate(parser.parse('0.1  +  0.2  =  0.3')))
+        self.assertEqual(Decimal('3.5'), evaluate(parser.parse('7  /  2')))
+        self.assertIs(int, type(evaluate(parser.parse('6  /  3  *  4  -  1'))))
+        self.assertEqual(Decimal('0.125'), evaluate(parser.parse('2  **  -3')))
+        self.assertEqual(Decimal('0.75'), evaluate(parser.parse('mean(0.5, 1)')))
+
+    def test_unary_precision(self):
+        digits = '1.234567890123456789012345678901234'
+        parser = Parser(StoreLogger())
+        for evaluate in (Evaluator().evaluate, lambda tree: compiler.compile(tree)({})):
+            self.assertEqual(Decimal('-' + digits), evaluate(parser.parse('-' + digits)))
+            self.assertEqual(Decimal('-' + digits), evaluate(parser.parse('-  (%s)' % digits)))
+            self.assertEqual(Decimal(digits), evaluate(parser.parse('abs(-%s)' % digits)))
+        self.assertEqual(Decimal(digits), op.negate(Decimal('-' + digits)))
+
+    def test_mixed_operands(self):
+        self.assertEqual(Decimal('0.3'), op.add(Decimal('0.1'), 0.2))
+        self.assertEqual(Decimal('1.5'), op.multiply(Decimal('0.5'), 3))
+        self.assertIs(True, op.less(Decimal('0.1'), 0.2))
+        self.assertEqual(datetime.timedelta(hours=36), op.multiply(Decimal('1.5'), datetime.timedelta(1)))
+        self.assertEqual(datetime.timedelta(hours=12), op.divide(datetime.timedelta(1), Decimal(2)))
+        self.assertIsNone(op.divide(Decimal(1), 0))
+        self.assertIsNone(op.divide(1, 0))
+        self.assertIsNone(op.power(Decimal(-8), Decimal('0.5')))
+        self.assertEqual(op.NUMBER, op.kind(Decimal(1)))
+
+    def test_flat_trees(self):
+        trees = [Parser(StoreLogger()).parse('1  +  2.50  *  1.0'), AST.Number(1.5)]
+        flat = FlatTrees.from_buffer(FlatTrees.from_trees(trees).to_bytes())
+        self.assertEqual(trees, flat.trees())
+        self.assertEqual([int, Decimal, Decimal, float], [type(v) for v in literals(flat.trees())])
+        self.assertEqual('2.50', str(literals(flat.tree(0))[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
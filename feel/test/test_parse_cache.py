@@ -0,0 +1,61 @@
+import unittest
+
+from feel.parser import AST
+from feel.parser.common.ParseCache import ParseCache
+from feel.parser.parser.Parser import Parser
+from utils.StoreLogger import StoreLogger
+
+SUM_AST = AST.Sum(AST.Number(1), AST.Number(2))
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.logger = StoreLogger()
+        self.cache = ParseCache(maxsize=2, logger=self.logger)
+
+    def test_hits_and_misses(self):
+        self.assertEqual(SUM_AST, self.cache.parse('1 + 2'))
+        self.assertEqual(SUM_AST, self.cache.parse('1 + 2'))
+        self.assertEqual(AST.SimpleExpressions([SUM_AST]), self.cache.parse('1 + 2', grammar='simple'))
+        self.assertEqual(AST.NoTest(), self.cache.parse('-', grammar='table'))
+        info = self.cache.info()
+        self.assertEqual((1, 3, 1, 2, 2), tuple(info))
+
+    def test_lru_eviction(self):
+        self.cache.parse('1')
+        self.cache.parse('2')
+        self.cache.parse('1')
+        self.cache.parse('3')
+        self.assertEqual([('feel', '1'), ('feel', '3')], list(self.cache.entries))
+        self.assertEqual(1, self.cache.info().evictions)
+
+    def test_shared_instances(self):
+        self.assertIs(self.cache.parse('1 + 2'), self.cache.parse('1 + 2'))
+
+    def test_copies(self):
+        cache = ParseCache(copy=True, logger=self.logger)
+        first = cache.parse('1 + 2')
+        first.rhs = AST.Number(5)
+        self.assertEqual(SUM_AST, cache.parse('1 + 2'))
+        self.assertIsNot(cache.parse('1 + 2'), cache.parse('1 + 2'))
+
+    def test_deep_trees(self):
+        text = '  +  '.join(['1'] * 2000)
+        cache = ParseCache(copy=True, logger=self.logger)
+        tree = cache.parse(text)
+        self.assertEqual(Parser().parse(text), tree)
+        self.assertIsNot(tree, cache.parse(text))
+        self.assertEqual(tree, cache.parse(text))
+
+    def test_failures(self):
+        self.assertIsNone(self.cache.parse('1 +'))
+        self.assertEqual(['unexpected end of file'], self.logger.messages)
+        self.assertIsNone(self.cache.diagnostics('1 +'))
+        self.assertEqual(0, self.cache.info().size)
+
+        cache = ParseCache(cache_failures=True, logger=self.logger)
+        self.assertIsNone(cache.parse('1 +'))
+        self.assertIsNone(cache.parse('1 +'))
+        self.assertEqual(['unexpected end of file'], [d.message for d in cache.diagnostics('1 +')])
+        self.assertEqual(['unexpected end of file'] * 3, self.logger.messages)
+        self.assertEqual((1, 1), cache.info()[:2])
@@ -1,5 +1,6 @@
 # coding: utf8
 import unittest
+from decimal import Decimal
 
 from feel.parser import AST
 from feel.parser.parser.Parser import Parser
@@ -63,7 +64,8 @@ NEGATION_STR = '-?A_zÊÝĄͼൺ⁶Ⰲ〠邏２𐎅'
 NEGATION_AST = AST.Negation(AST.Name('?A_zÊÝĄͼൺ⁶Ⰲ〠邏２𐎅'))
 
 ARITHMETIC_EXPRESSION_STR = '1.2-%s  /true  **%s' % (NEGATION_STR, NAME_STR)
-ARITHMETIC_EXPRESSION_AST = AST.Dif(AST.Number(1.2), AST.Div(NEGATION_AST, AST.Exp(AST.Boolean(True), NAME_AST)))
+ARITHMETIC_EXPRESSION_AST = AST.Dif(AST.Number(Decimal('1.2')),
+                                    AST.Div(NEGATION_AST, AST.Exp(AST.Boolean(True), NAME_AST)))
 
 NOT_STR = 'not (null)'
 NOT_AST = AST.Not(AST.PositiveUnaryTests([AST.Null()]))
@@ -238,10 +240,10 @@ class TestParser(unittest.TestCase):
 
     def test_numeric_literal(self):
         self.check_parser('1', AST.Number(1))
-        self.check_parser('1.42', AST.Number(1.42))
-        self.check_parser('1 . 42', AST.Number(1.42))
-        self.check_parser('.42', AST.Number(.42))
-        self.check_parser('. 42', AST.Number(.42))
+        self.check_parser('1.42', AST.Number(Decimal('1.42')))
+        self.check_parser('1 . 42', AST.Number(Decimal('1.42')))
+        self.check_parser('.42', AST.Number(Decimal('.42')))
+        self.check_parser('. 42', AST.Number(Decimal('.42')))
         self.check_parser('42', AST.Number(42))
         # self.check_parser('-1', AST.Number(-1))
 
@@ -306,7 +308,8 @@ class TestParser(unittest.TestCase):
         self.check_parser('%s  *true  **%s' % (NEGATION_STR, NAME_STR),
                           AST.Mul(NEGATION_AST, AST.Exp(AST.Boolean(True), NAME_AST)))
         self.check_parser('%s  +1.2  /true  **%s' % (NEGATION_STR, NAME_STR),
-                          AST.Sum(NEGATION_AST, AST.Div(AST.Number(1.2), AST.Exp(AST.Boolean(True), NAME_AST))))
+                          AST.Sum(NEGATION_AST,
+                                  AST.Div(AST.Number(Decimal('1.2')), AST.Exp(AST.Boolean(True), NAME_AST))))
         self.check_parser(ARITHMETIC_EXPRESSION_STR, ARITHMETIC_EXPRESSION_AST)
 
     def test_simple_value(self):
@@ -389,3 +392,23 @@ class TestParser(unittest.TestCase):
                           AST.In(AST.Number(1), AST.PositiveUnaryTests([AST.GtEp(AST.Endpoint(AST.Number(2)))])))
         self.check_parser('1 in >=2',
                           AST.In(AST.Number(1), AST.PositiveUnaryTests([AST.GteEp(AST.Endpoint(AST.Number(2)))])))
+
+    def test_long_lists(self):
+        n = 1000
+        numbers = [AST.Number(i) for i in range(n)]
+        names = [AST.Name('p%d' % i) for i in range(n)]
+        items = ',  '.join(str(i) for i in range(n))
+        self.check_parser('[%s]' % items, AST.List(numbers))
+        self.check_parser('x  in  (%s)' % ',  '.join('<  %d' % i for i in range(n)),
+                          AST.In(AST.Name('x'), AST.PositiveUnaryTests([AST.LtEp(AST.Endpoint(number))
+                                                                        for number in numbers])))
+        self.check_parser('{%s}' % ',  '.join('p%d: %d' % (i, i) for i in range(n)),
+                          AST.Context(list(zip(names, numbers))))
+        self.check_parser('f(%s)' % ',  '.join('p%d: %d' % (i, i) for i in range(n)),
+                          AST.Invocation(AST.Name('f'), list(zip(names, numbers))))
+        self.check_parser('function(%s)  1' % ',  '.join('p%d' % i for i in range(n)),
+                          AST.FunctionDefinition(names, False, AST.Number(1)))
+        self.check_parser('for  %s  return  1' % '  '.join('p%d  in  %d' % (i, i) for i in range(n)),
+                          AST.For(list(zip(names, numbers)), AST.Number(1)))
+        self.check_simple_parser(items, AST.SimpleExpressions(numbers))
+        self.check_table_parser(items, AST.PositiveUnaryTests([AST.Endpoint(number) for number in numbers]))
@@ -0,0 +1,58 @@
+import threading
+import unittest
+
+from feel.parser import AST
+from feel.parser.common.ParserPool import ParserPool
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+CASES = [
+    ('1 + 2 * 3', AST.Sum(AST.Number(1), AST.Mul(AST.Number(2), AST.Number(3)))),
+    ('if  a  then  b  else  c', AST.If(AST.Name('a'), AST.Name('b'), AST.Name('c'))),
+    ('{"a": [1, 2], b: date("1")}', AST.Context([('a', AST.List([AST.Number(1), AST.Number(2)])),
+                                                 (AST.Name('b'), AST.Date('1'))])),
+    ('x  in  (null, <= 5)', AST.In(AST.Name('x'), AST.PositiveUnaryTests([AST.Null(),
+                                                                         AST.LteEp(AST.Endpoint(AST.Number(5)))]))),
+    ('if  a  else  c', None),
+]
+
+
+class TestParserPool(unittest.TestCase):
+    def setUp(self):
+        self.logger = StoreLogger()
+        self.pool = ParserPool(Parser, self.logger)
+
+    def test_local_parser_is_reused(self):
+        self.assertIs(self.pool.local(), self.pool.local())
+        self.assertEqual(CASES[0][1], self.pool.parse(CASES[0][0]))
+
+    def test_checkout(self):
+        with self.pool.checkout() as first:
+            with self.pool.checkout() as second:
+                self.assertIsNot(first, second)
+                self.assertIsNot(first.lexer.lexer, second.lexer.lexer)
+                self.assertIs(first.parser.action, second.parser.action)
+        with self.pool.checkout() as again:
+            self.assertIn(again, (first, second))
+
+    def test_table_parser_pool(self):
+        pool = ParserPool(TableParser, self.logger)
+        self.assertEqual(AST.Not(AST.PositiveUnaryTests([AST.Null()])), pool.parse('not (null)'))
+
+    def test_threads(self):
+        failures = []
+
+        def worker(offset):
+            for i in range(200):
+                text, expected = CASES[(i + offset) % len(CASES)]
+                result = self.pool.parse(text)
+                if result != expected:
+                    failures.append((text, result))
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], failures)
@@ -0,0 +1,70 @@
+import random
+import unittest
+
+from feel.Diagnostics import LEXICAL, LIMIT, SYNTAX
+from feel.Limits import Limits
+from feel.parser import AST
+from feel.parser.parser.Parser import Parser
+from feel.parser.simple.SimpleParser import SimpleParser
+from feel.parser.table.TableParser import TableParser
+
+
+class TestRecovery(unittest.TestCase):
+    def setUp(self):
+        self.parser = Parser()
+
+    def test_valid_input(self):
+        for text in ('[1, 2, a  +  b]', 'if  a > 3  then  "big"  else  "small"', '{"a": f(x: 1), "b": (1 + 2)}'):
+            tree, diagnostics = self.parser.recover(text)
+            self.assertEqual(self.parser.parse(text), tree)
+            self.assertEqual([], diagnostics)
+
+    def test_all_errors_in_one_pass(self):
+        text = '{"a": 1 +, "b": f(, 2), "c": [1  2, 3]}'
+        tree, diagnostics = self.parser.recover(text)
+        self.assertEqual([(9, 10), (18, 19), (33, 34)], [d.span for d in diagnostics])
+        self.assertEqual([SYNTAX] * 3, [d.kind for d in diagnostics])
+        entries = dict(tree.value)
+        self.assertEqual(AST.Sum(AST.Number(1), AST.Error('')), entries['a'])
+        self.assertEqual([AST.Error(''), AST.Number(2)], entries['b'].parameters)
+        self.assertEqual(AST.List([AST.Error('1  2'), AST.Number(3)]), entries['c'])
+        self.assertEqual((30, 34), entries['c'].value[0].span)
+
+    def test_keywords(self):
+        tree, diagnostics = self.parser.recover('if  a >  then  1  else')
+        self.assertEqual(AST.If(AST.Gt(AST.Name('a'), AST.Error('')), AST.Number(1), AST.Error('')), tree)
+        self.assertEqual(['unexpected token THEN{then}', 'unexpected end of file'], [d.message for d in diagnostics])
+        self.assertIn('NAME', diagnostics[0].expected)
+
+    def test_brackets_opened_after_the_error(self):
+        tree, _ = self.parser.recover('[1, 2  +  *  (3, 4), 5]')
+        self.assertEqual(AST.List([AST.Number(1), AST.Sum(AST.Number(2), AST.Error('*  (3, 4)')), AST.Number(5)]), tree)
+
+    def test_lexical_errors(self):
+        tree, diagnostics = self.parser.recover('[1 @ 2, 3\n, # 4]', lineno=5)
+        self.assertEqual([LEXICAL, SYNTAX, LEXICAL], [d.kind for d in diagnostics])
+        self.assertEqual([(5, 3), (5, 5), (6, 2)], [(d.line, d.column) for d in diagnostics])
+        self.assertEqual(AST.List([AST.Error('1 @ 2'), AST.Number(3), AST.Number(4)]), tree)
+
+    def test_other_grammars(self):
+        tree, diagnostics = TableParser().recover('not (>= 5 6, "a")')
+        self.assertEqual(1, len(diagnostics))
+        self.assertEqual(AST.GteEp(AST.Error('5 6')), tree.value.value[0])
+        tree, diagnostics = SimpleParser().recover('1  +, 2')
+        self.assertEqual(AST.SimpleExpressions([AST.Sum(AST.Number(1), AST.Error('')), AST.Number(2)]), tree)
+
+    def test_error_limit(self):
+        parser = Parser(limits=Limits(errors=2))
+        tree, diagnostics = parser.recover('[1 2, 3 4, 5 6, 7 8]')
+        self.assertIsNone(tree)
+        self.assertEqual([SYNTAX, SYNTAX, LIMIT], [d.kind for d in diagnostics])
+
+    def test_random_inputs(self):
+        generator = random.Random(0)
+        pieces = ['1', 'a', '+', '*', ',', '(', ')', '[', ']', '{', '}', '"s"', ':', 'if', 'then', 'else', 'for',
+                  'in', 'return', 'some', 'satisfies', '@', '..', 'f(']
+        for _ in range(500):
+            text = '  '.join(generator.choice(pieces) for _ in range(generator.randint(1, 12)))
+            tree, diagnostics = self.parser.recover(text)
+            if not diagnostics:
+                self.assertEqual(self.parser.parse(text), tree)
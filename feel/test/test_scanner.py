@@ -0,0 +1,66 @@
+# encoding: utf8
+import random
+import unittest
+
+from feel.lexer.BaseLexer import BaseLexer
+from feel.lexer.Lexer import Lexer
+from feel.lexer.Scanner import Scanner
+from feel.lexer.TableLexer import TableLexer
+from utils.StoreLogger import StoreLogger
+
+TEXTS = [
+    'ala ma kota  +  1.5',
+    'date and time("2017-01-01T10:00:00")  >=  date("2017-01-01")',
+    'a.b.c  **  2 . 5 != .5',
+    '[1..10[, (1 .. 2], not (>= 5, "a")',
+    '1 \n 2\n\n"x"  \n  y',
+    'some  x  in  [1, 2]  satisfies  x\t>\t2',
+    '"unterminated  @  ?what  ’s ab-c d+e f*g',
+    '٣٤  Àb̀c  ‿  x·y  \U00010400z',
+    '',
+    '  ',
+    '\r\r#',
+]
+ALPHABET = 'ab ?_ \t\n"0123456789.,:()[]{}<>=!+-*/’@#٣·̀À '
+
+
+def tokens(lexer, text):
+    lexer.logger.messages = []
+    lexer.input(text)
+    found = [(t.type, t.value, t.lineno, t.lexpos) for t in iter(lexer.token, None)]
+    return found, lexer.logger.messages
+
+
+class TestScanner(unittest.TestCase):
+    def check(self, cls, texts):
+        ply, scanner = cls(StoreLogger(), backend='ply'), cls(StoreLogger())
+        self.assertIsInstance(scanner.lexer, Scanner)
+        for text in texts:
+            self.assertEqual(tokens(ply, text), tokens(scanner, text), repr(text))
+
+    def test_same_tokens_as_ply(self):
+        for cls in (BaseLexer, Lexer, TableLexer):
+            self.check(cls, TEXTS)
+
+    def test_random_texts(self):
+        generator = random.Random(7)
+        texts = [''.join(generator.choice(ALPHABET) for _ in range(generator.randint(1, 40))) for _ in range(500)]
+        for cls in (BaseLexer, Lexer, TableLexer):
+            self.check(cls, texts)
+
+    def test_clone(self):
+        lexer = Lexer(StoreLogger())
+        other = lexer.clone()
+        other.logger = StoreLogger()
+        lexer.input('a  @')
+        other.input('b  #')
+        self.assertEqual('a', lexer.token().value)
+        self.assertEqual('b', other.token().value)
+        self.assertIsNone(lexer.token())
+        self.assertIsNone(other.token())
+        self.assertIn("Unexpected character: '@'", lexer.logger.messages)
+        self.assertIn("Unexpected character: '#'", other.logger.messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import copy
+import pickle
+import unittest
+
+from feel.parser import AST
+from feel.parser.common.Incremental import children
+from feel.parser.common.ParserPool import ParserPool
+from feel.parser.parser.Parser import Parser
+from feel.parser.simple.SimpleParser import SimpleParser
+from feel.parser.table.TableParser import TableParser
+
+
+def texts(tree, text):
+    """The source text of every node of a tree, in depth-first order."""
+    found, pending = [], [tree]
+    while pending:
+        node = pending.pop()
+        span = node.span
+        found.append((node.__class__.__name__, None if span is None else text[span[0]:span[1]]))
+        pending.extend(reversed(list(children(node))))
+    return found
+
+
+class TestSpans(unittest.TestCase):
+    def test_nodes(self):
+        text = '{"a": [1,  x  *  (y  +  2)], "b": f(q: "s")}'
+        tree = Parser().parse(text)
+        self.assertEqual([
+            ('Context', text),
+            ('List', '[1,  x  *  (y  +  2)]'),
+            ('Number', '1'),
+            ('Mul', 'x  *  (y  +  2)'),
+            ('Name', 'x'),
+            ('Sum', 'y  +  2'),
+            ('Name', 'y'),
+            ('Number', '2'),
+            ('Invocation', 'f(q: "s")'),
+            ('Name', 'f'),
+            ('Name', 'q'),
+            ('StringLiteral', '"s"'),
+        ], texts(tree, text))
+
+    def test_parse_and_parse_spans(self):
+        parser = Parser()
+        for text in ('if  a > 3  then  "big"  else  "small"', 'some  x  in  [1, 2]  satisfies  x > 2',
+                     'function(a, b)  a  +  b', 'date("2017-01-01")  <  d  and  not(b)'):
+            self.assertEqual(texts(parser.parse(text), text), texts(parser.parse_spans(text), text))
+        parser = TableParser()
+        for text in ('[1..10[', 'not (>= 5, "a")', '< 3, "x", [1..5]'):
+            self.assertEqual(texts(parser.parse(text), text), texts(parser.parse_spans(text), text))
+
+    def test_stateless_nodes_have_none(self):
+        tree = TableParser().parse('[1..10[')
+        self.assertEqual((0, 7), tree.value[0].span)
+        self.assertIsNone(tree.value[0].start.span)
+        self.assertIsNone(AST.Null().span)
+
+    def test_recovered_errors(self):
+        parser = Parser()
+        tree = parser.parse('{"a": 1, 2}')
+        self.assertTrue(parser.diagnostics)
+        self.assertEqual((0, 11), tree.span)
+        self.assertEqual((6, 7), tree.value[0][1].span)
+
+    def test_iterparse(self):
+        text = '1  +  a,\n"x",  b  *  2'
+        self.assertEqual([(0, 7), (9, 12), (15, 22)], [tree.span for tree, _ in SimpleParser().iterparse(text)])
+
+    def test_disabled(self):
+        tree = Parser(spans=False).parse('[1, a  +  2]')
+        self.assertIsNone(tree.span)
+        self.assertEqual(Parser().parse('[1, a  +  2]'), tree)
+        self.assertIsNone(Parser(spans=False).parse_spans('[1, a]').span)
+
+    def test_copies(self):
+        tree = ParserPool(Parser).parse('[1, (2)]')
+        self.assertEqual((0, 8), tree.span)
+        self.assertEqual((5, 6), tree.value[1].span)
+        self.assertEqual((5, 6), copy.deepcopy(tree).value[1].span)
+        self.assertEqual((5, 6), pickle.loads(pickle.dumps(tree)).value[1].span)
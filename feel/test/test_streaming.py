@@ -0,0 +1,84 @@
+import io
+import random
+import unittest
+
+from feel.Limits import Limits
+from feel.parser.common.Streaming import split
+from feel.parser.simple.SimpleParser import SimpleParser
+from utils.StoreLogger import StoreLogger
+
+EXPRESSIONS = [
+    '1  +  2',
+    'date("2017-01-01")  <  date and time("2017-01-01T10:00:00")',
+    '"a, (b"',
+    'a.b  **  2  -  c',
+    '-  .5  !=  x',
+    '"]"  =  "{"',
+]
+
+
+def pieces(text, generator):
+    found, position = [], 0
+    while position < len(text):
+        size = generator.randint(1, 8)
+        found.append(text[position:position + size])
+        position += size
+    return found
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.logger = StoreLogger()
+        self.parser = SimpleParser(self.logger)
+
+    def test_split(self):
+        chunks = ['a, "b', ', c", f(x, [y', ', {z: 1}]),']
+        self.assertEqual(['a', ' "b, c"', ' f(x, [y, {z: 1}])', ''], list(split(chunks)))
+        self.assertEqual([''], list(split([])))
+
+    def test_same_as_parse(self):
+        generator = random.Random(15)
+        for _ in range(20):
+            document = ',\n'.join(generator.choice(EXPRESSIONS) for _ in range(generator.randint(1, 10)))
+            expected = self.parser.parse(document).value
+            self.assertEqual(expected, [tree for tree, _ in self.parser.iterparse(pieces(document, generator))])
+            self.assertEqual(expected, [tree for tree, _ in self.parser.iterparse(io.StringIO(document))])
+        self.assertEqual([], self.logger.messages)
+
+    def test_lazy(self):
+        def chunks():
+            yield '1, 2'
+            raise AssertionError('read too far')
+
+        results = self.parser.iterparse(chunks())
+        self.assertEqual(1, next(results).tree.value)
+
+    def test_errors(self):
+        results = list(self.parser.iterparse('1,\n2  +,\n3'))
+        self.assertEqual([1, None, 3], [tree and tree.value for tree, _ in results])
+        self.assertEqual([[], ['unexpected end of file'], []],
+                         [[d.message for d in diagnostics] for _, diagnostics in results])
+        self.assertEqual('unexpected end of file', self.logger.messages[-1])
+        self.logger.messages = []
+        results = list(SimpleParser(self.logger).iterparse('1,\n\n2  3'))
+        self.assertEqual(2, len(results))
+        self.assertEqual('unexpected token NUMERIC_LITERAL{3} at position 3:3', self.logger.messages[0])
+        self.assertEqual([], results[0].diagnostics)
+        self.assertEqual(self.logger.messages, results[1].diagnostics[0].lines())
+
+    def test_partial_trees(self):
+        tree, diagnostics = list(self.parser.iterparse('1,  (1  +  2)  *  3'))[1]
+        self.assertEqual(3, tree.value)
+        self.assertEqual(['unexpected token ({(}', 'unexpected token ){)}'], [d.message for d in diagnostics])
+
+    def test_limits(self):
+        parser = SimpleParser(self.logger, limits=Limits(length=10))
+        results = list(parser.iterparse(['1, 2, "', 'a' * 20, '", 3']))
+        self.assertEqual([1, 2, None], [tree and tree.value for tree, _ in results])
+        self.assertEqual([[], [], ['input exceeds the limit of 10 characters']],
+                         [[d.message for d in diagnostics] for _, diagnostics in results])
+        self.assertEqual(['input exceeds the limit of 10 characters'], self.logger.messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from feel.lexer import baselextab, lextab, tablelextab
+from feel.lexer.BaseLexer import BaseLexer
+from feel.lexer.Lexer import Lexer
+from feel.lexer.TableLexer import TableLexer
+from feel.lexer.Tables import lexer_signature
+from feel.parser import AST
+from feel.parser.common.LazyParser import LazyParser
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+
+class TestTables(unittest.TestCase):
+    def test_shipped_lextabs_are_fresh(self):
+        self.assertEqual(lexer_signature(BaseLexer()), baselextab._signature)
+        self.assertEqual(lexer_signature(Lexer()), lextab._signature)
+        self.assertEqual(lexer_signature(TableLexer()), tablelextab._signature)
+
+    def test_lazy_parser(self):
+        calls = []
+
+        def factory(logger):
+            calls.append(logger)
+            return TableParser(logger)
+
+        lazy = LazyParser(factory, StoreLogger())
+        self.assertEqual([], calls)
+        self.assertEqual(AST.NoTest(), lazy.parse('-'))
+        self.assertEqual(AST.NoTest(), lazy.parse('-'))
+        self.assertEqual(1, len(calls))
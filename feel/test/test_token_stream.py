@@ -0,0 +1,69 @@
+import unittest
+
+from feel.Limits import Limits
+from feel.lexer.BaseLexer import BaseLexer
+from feel.lexer.Lexer import Lexer
+from feel.lexer.TableLexer import TableLexer
+from feel.parser.parser.Parser import Parser
+from feel.parser.simple.SimpleParser import SimpleParser
+from feel.parser.table.TableParser import TableParser
+from feel.test.test_scanner import TEXTS
+from utils.StoreLogger import StoreLogger
+
+EXPRESSIONS = [
+    'if  a > 3  then  "big"  else  "small"',
+    'some  x  in  [1, 2, 3]  satisfies  x > 2',
+    'every  x  in  [1]  satisfies  x > 2',
+    'function(a, b)  external  a',
+    'for  x  in  [1, 2]  return  x  *  2',
+    '{"limit": 10, "rate": a  /  12}',
+    'date and time("2017-01-01T10:00:00")',
+    'if  a  else  c',
+    '1  +  @',
+]
+UNARY_TESTS = ['-', '[1..10[', 'not (>= 5, "a")', '(1..2]', '>>']
+
+
+def tokens(lexer, text):
+    lexer.input(text)
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in iter(lexer.token, None)]
+
+
+class TestTokenStream(unittest.TestCase):
+    def test_same_tokens(self):
+        for cls in (BaseLexer, Lexer, TableLexer):
+            for text in TEXTS:
+                stream = cls(StoreLogger()).stream(text)
+                expected = tokens(cls(StoreLogger()), text)
+                self.assertEqual(expected, [(t.type, t.value, t.lineno, t.lexpos) for t in stream.tokens()])
+
+    def test_spans(self):
+        stream = Lexer(StoreLogger()).stream('a  +  "b"  #  1.5')
+        self.assertEqual(['NAME', '+', 'STRING_LITERAL', 'NUMERIC_LITERAL'], [stream.type(i) for i in range(4)])
+        self.assertEqual('"b"', stream.text(2))
+        self.assertEqual(('b', 1.5), (stream.value(2), stream.value(3)))
+        self.assertEqual([11], stream.errors)
+
+    def check(self, parser_class, texts):
+        logger, expected_logger = StoreLogger(), StoreLogger()
+        parser, expected_parser = parser_class(logger), parser_class(expected_logger)
+        for text in texts:
+            self.assertEqual(expected_parser.parse(text), parser.parse_spans(text), text)
+            self.assertEqual(expected_logger.messages, logger.messages)
+
+    def test_same_trees(self):
+        self.check(Parser, EXPRESSIONS)
+        self.check(SimpleParser, ['1  +  2, a', '1  +'])
+        self.check(TableParser, UNARY_TESTS)
+
+    def test_limits(self):
+        logger = StoreLogger()
+        parser = Parser(logger, limits=Limits(tokens=4, depth=3))
+        self.assertIsNone(parser.parse_spans('1  +  2  +  3'))
+        self.assertIsNone(parser.parse_spans('-  -  -  1'))
+        self.assertEqual(['input exceeds the limit of 4 tokens', 'input exceeds the limit of 3 nested nodes'],
+                         logger.messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
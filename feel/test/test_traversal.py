@@ -0,0 +1,122 @@
+import unittest
+
+from feel.parser import AST
+from feel.parser.Traversal import SKIP, Transformer, Visitor, children, walk
+from feel.parser.parser.Parser import Parser
+from feel.parser.table.TableParser import TableParser
+
+EXPRESSIONS = [
+    '{a: [1,  x  *  (y  +  2)], "b": f(q: "s")}',
+    'if  a  >  1  then  date("2017-01-01")  else  -x',
+    'for  i  in  [1, 2],  j  in  x  return  i  +  j',
+    'some  i  in  x  satisfies  i  between  1  and  5',
+    'function(a, b)  a  **  b',
+    'x[item  >  1].name  instance  of  number',
+    'x  in  (<  1,  [2..3[,  null)',
+]
+
+
+class Names(Visitor):
+    def __init__(self):
+        super(Names, self).__init__()
+        self.found = []
+        self.operations = 0
+
+    def visit_Name(self, node):
+        self.found.append(node.value)
+
+    def visit_BinOp(self, node):
+        self.operations += 1
+
+    def visit_FunctionDefinition(self, node):
+        return SKIP
+
+
+class Depths(Visitor):
+    def __init__(self):
+        super(Depths, self).__init__()
+        self.depth = self.deepest = 0
+
+    def generic_visit(self, node):
+        self.depth += 1
+        self.deepest = max(self.deepest, self.depth)
+
+    def leave_AST(self, node):
+        self.depth -= 1
+
+
+class Folder(Transformer):
+    def transform_Sum(self, node):
+        if isinstance(node.value, AST.Number) and isinstance(node.rhs, AST.Number):
+            return AST.Number(node.value.value + node.rhs.value)
+        return node
+
+
+def chain(n):
+    tree = AST.Name('x')
+    for i in range(n):
+        tree = AST.Sum(tree, AST.Number(i))
+    return tree
+
+
+class TestTraversal(unittest.TestCase):
+    def test_child_fields(self):
+        trees = [Parser().parse(text) for text in EXPRESSIONS] + [TableParser().parse('not ("a", [1..2])')]
+        for node in (node for tree in trees for node in walk(tree)):
+            fields = AST.fields(node.__class__)
+            self.assertTrue(set(node.child_fields) <= set(fields), node.__class__.__name__)
+            for name in set(fields) - set(node.child_fields):
+                pending = [getattr(node, name)]
+                while pending:
+                    value = pending.pop()
+                    self.assertNotIsInstance(value, AST.AST, '%s.%s' % (node.__class__.__name__, name))
+                    if isinstance(value, (list, tuple)):
+                        pending.extend(value)
+
+    def test_walk(self):
+        tree = Parser().parse('f(x,  [1,  y  *  2])')
+        self.assertEqual(['Invocation', 'Name', 'Name', 'List', 'Number', 'Mul', 'Name', 'Number'],
+                         [node.__class__.__name__ for node in walk(tree)])
+        self.assertEqual([tree.value, tree.parameters[0], tree.parameters[1]], list(children(tree)))
+
+    def test_visitor(self):
+        names = Names()
+        names.visit(Parser().parse('a  +  f(b,  function(c)  c  *  d)  -  e  *  a'))
+        self.assertEqual(['a', 'f', 'b', 'e', 'a'], names.found)
+        self.assertEqual(3, names.operations)
+
+    def test_leave(self):
+        depths = Depths()
+        depths.visit(Parser().parse('[1,  [2,  [3]]]'))
+        self.assertEqual(0, depths.depth)
+        self.assertEqual(4, depths.deepest)
+
+    def test_transformer(self):
+        tree = Parser().parse('[x  +  (1  +  2),  f(y)]')
+        folded = Folder().transform(tree)
+        self.assertEqual(Parser().parse('[x  +  3,  f(y)]'), folded)
+        self.assertEqual(Parser().parse('[x  +  (1  +  2),  f(y)]'), tree)
+        self.assertIs(tree.value[1], folded.value[1])
+        self.assertEqual(tree.span, folded.span)
+        self.assertIs(tree, Transformer().transform(tree))
+
+    def test_deep_chains(self):
+        tree = chain(20000)
+        self.assertEqual(40001, sum(1 for _ in walk(tree)))
+        names = Names()
+        names.visit(tree)
+        self.assertEqual((['x'], 20000), (names.found, names.operations))
+        self.assertIs(tree, Transformer().transform(tree))
+        self.assertEqual('((Name{x} + Number{0}) + Number{1})', str(chain(2)))
+        self.assertTrue(str(tree).startswith('(' * 20000 + 'Name{x} + Number{0})'))
+
+    def test_str(self):
+        for text in EXPRESSIONS:
+            tree = Parser().parse(text)
+            self.assertEqual(str(tree), repr(tree))
+        self.assertEqual('PositiveUnaryTests{[[Endpoint{Number{1}}..Endpoint{Number{2}})]}',
+                         str(TableParser().parse('[1..2[')))
+
+
+if __name__ == '__main__':
+    unittest.main()
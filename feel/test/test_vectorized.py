@@ -0,0 +1,72 @@
+import datetime
+import unittest
+
+from feel.evaluator import Vectorized
+from feel.evaluator.Compiler import Compiler
+from feel.evaluator.Evaluator import Evaluator
+from feel.evaluator.Vectorized import Vectorizer, numpy
+from feel.parser.table.TableParser import TableParser
+from utils.StoreLogger import StoreLogger
+
+TESTS = ['[1..10[', ']1..10]', '>= 5', '< 5', '<= 5', '> 5', '5', '1, [7..8], > 50', 'not (1, 5)', '-', 'null',
+         '"a"', 'limit', '< limit', 'not (null)', 'true', '< true', '>= false', 'not (< true)', '0.1', '<= 0.1',
+         '> 0.1', '[1.00000000000000000001..2]', '1.5']
+COLUMNS = [
+    [1, 5, 10, 17, 70, 0],
+    [1.0, 5.5, 10.0, float('nan'), 70.25],
+    [0.1, 1.0, 1.5, 2.0],
+    [1, None, 5, 'a', 10],
+    ['a', 'b', 'c'],
+    [True, False],
+]
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestVectorizer(unittest.TestCase):
+
+    # noinspection PyPep8Naming
+    def __init__(self, methodName='runTest'):
+        super(TestVectorizer, self).__init__(methodName)
+        self.parser = TableParser(StoreLogger())
+        self.vectorizer = Vectorizer(Compiler())
+        self.evaluator = Evaluator()
+
+    def expected(self, test, values, context):
+        null = [None if isinstance(v, float) and v != v else v for v in values]
+        return [self.evaluator.test(test, value, context) for value in null]
+
+    def test_matches_evaluator(self):
+        context = {'limit': 10}
+        for text in TESTS:
+            test = self.parser.parse(text)
+            for column in COLUMNS:
+                mask = self.vectorizer.mask(test, column, context)
+                self.assertEqual(self.expected(test, column, context), list(mask), (text, column))
+
+    def test_numpy_columns(self):
+        test = self.parser.parse('[2..4]')
+        self.assertEqual([False, True, True, True, False], list(self.vectorizer.mask(test, numpy.arange(1, 6))))
+        dates = numpy.array(['2016-05-01', '2017-06-01'], dtype='datetime64[D]')
+        test = self.parser.parse('[date("2017-01-01")..date("2018-01-01")]')
+        self.assertEqual([False, True], list(self.vectorizer.mask(test, dates)))
+        self.assertEqual([datetime.date(2017, 6, 1)], [d.item() for d in dates[self.vectorizer.mask(test, dates)]])
+
+    def test_datetime_units(self):
+        moments = ['2017-01-01T00:00:00', '2017-01-01T12:00:00', '2018-01-01T00:00:00']
+        for text in ['date("2017-01-01")', '>= date("2017-01-01")', 'date and time("2017-01-01T00:00:00")',
+                     '> date and time("2017-01-01T06:00:00")']:
+            test = self.parser.parse(text)
+            for unit in ['D', 'M', 's', 'ms', 'ns']:
+                column = numpy.array(moments, dtype='datetime64[%s]' % unit)
+                items = column.astype('datetime64[us]').tolist()
+                if unit in ('D', 'M'):
+                    items = [item.date() for item in items]
+                self.assertEqual(self.expected(test, items, {}), list(self.vectorizer.mask(test, column)), (text, unit))
+
+    def test_without_numpy(self):
+        Vectorized.numpy = None
+        try:
+            vectorizer = Vectorizer(Compiler())
+            self.assertEqual([False, True, True], vectorizer.mask(self.parser.parse('>= 5'), [1, 5, 10]))
+        finally:
+            Vectorized.numpy = numpy